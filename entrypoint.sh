@@ -73,7 +73,7 @@ except Exception as e:
         echo "Waiting for Postgres to be ready at notifications_postgres:5432..."
         /app/wait-for-it.sh notifications_postgres:5432 -t 60 --strict -- echo "Postgres is up!"
         echo "Starting Celery worker..."
-        celery -A notification_service worker --loglevel=info
+        celery -A notification_service worker --loglevel=info -Q celery,email,sms,push,inapp
         ;;
     celery-beat)
         echo "Starting Celery beat..."
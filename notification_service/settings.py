@@ -126,6 +126,10 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+# Per-channel queues (email, sms, push, inapp); see notifications/tasks/routing.py
+CELERY_TASK_ROUTES = ('notifications.tasks.routing.route_notification_task',)
+# Sends are long I/O waits; don't let one worker hoard a burst of them
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 # Celery 6.0+ compatibility: cancel long-running tasks on connection loss
 worker_cancel_long_running_tasks_on_connection_loss = True
@@ -95,7 +95,7 @@ CACHES = {
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [],
+        'DIRS': [BASE_DIR / 'templates'],  # Same as production; email/base_email.html lives here
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -132,6 +132,7 @@ LOGGING = {
 
 # ======================== External Services ========================
 AUTH_SERVICE_URL = env('AUTH_SERVICE_URL', default='http://localhost:8001')
+GATEWAY_URL = env('API_GATEWAY_URL', default='http://localhost:9090')
 HR_SERVICE_URL = env('HR_SERVICE_URL', default='http://localhost:8004')
 SUPABASE_URL = env('SUPABASE_URL', default='http://localhost')
 SUPABASE_KEY = env('SUPABASE_KEY', default='test-key')
@@ -142,13 +143,14 @@ REDIS_URL = env('REDIS_URL', default='redis://localhost:6379/0')
 
 # ======================== Celery (Eager mode for testing) ========================
 CELERY_BROKER_URL = 'memory://'
-CELERY_RESULT_BACKEND = 'cache+locmem://'
+CELERY_RESULT_BACKEND = 'cache+memory://'
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+CELERY_TASK_ROUTES = ('notifications.tasks.routing.route_notification_task',)
 
 # ======================== CORS ========================
 CORS_ALLOWED_ORIGINS = ['http://localhost:5173', 'http://localhost:3000']
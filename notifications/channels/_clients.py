@@ -0,0 +1,64 @@
+"""
+Process-wide caches for provider SDK clients and decrypted credentials
+
+Building a Twilio client or a Firebase app means decrypting credentials and,
+for Firebase, parsing the service account certificate. Handlers are created
+per notification, so clients and decrypted secrets are kept here and shared
+across handlers for the same tenant credentials.
+"""
+import threading
+import time
+
+# Seconds before a cached client is rebuilt, so rotated credentials are
+# eventually picked up
+CLIENT_TTL_SECONDS = 300
+
+
+class ClientCache:
+    """Thread-safe key -> client cache whose entries expire after a TTL"""
+
+    def __init__(self, ttl: float = CLIENT_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, factory):
+        """
+        Return the cached client for key, building it with factory on a miss
+
+        Args:
+            key: Hashable cache key, typically tenant id plus credential identifiers
+            factory: Zero-argument callable that builds the client
+
+        Returns:
+            The cached or newly built client
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is not None and now - entry[1] < self.ttl:
+                return entry[0]
+
+            client = factory()
+            self._entries[key] = (client, now)
+            return client
+
+    def clear(self):
+        """Drop every cached client"""
+        with self._lock:
+            self._entries.clear()
+
+
+twilio_clients = ClientCache()
+firebase_apps = ClientCache()
+
+# Plaintext credential fields keyed by (tenant_id, field, ciphertext); a
+# re-encrypted secret has a new ciphertext, so rotation never hits a stale entry
+decrypted_secrets = ClientCache()
+
+
+def clear_client_caches():
+    """Drop all cached provider clients and decrypted secrets"""
+    twilio_clients.clear()
+    firebase_apps.clear()
+    decrypted_secrets.clear()
@@ -1,14 +1,19 @@
 from .base_handler import BaseHandler
-from django.core.mail import send_mail, EmailMultiAlternatives
+from ._clients import decrypted_secrets
+from .rendering import render_template
+from django.core.mail import send_mail, EmailMultiAlternatives, get_connection
 from django.conf import settings
 from notifications.services.auth_service import auth_service_client
+import copy
 import logging
+import smtplib
 
 logger = logging.getLogger('notifications.channels.email')
 
 class EmailHandler(BaseHandler):
     def __init__(self, tenant_id: str, credentials: dict):
         super().__init__(tenant_id, credentials)
+        self._connection = None
 
     def _get_tenant_branding(self, context: dict) -> dict:
         """Get tenant branding information"""
@@ -16,12 +21,10 @@ class EmailHandler(BaseHandler):
 
     def _render_content(self, content: dict, context: dict) -> dict:
         """Render content with context"""
-        from django.template import Template, Context
         rendered = {}
         for key, value in content.items():
             if isinstance(value, str):
-                template = Template(value)
-                rendered[key] = template.render(Context(context))
+                rendered[key] = render_template(value, context)
             else:
                 rendered[key] = value
         return rendered
@@ -32,67 +35,118 @@ class EmailHandler(BaseHandler):
         template_name = content.get('html_template', 'email/base_email.html')
         return render_to_string(template_name, context)
 
+    def _get_password(self) -> str:
+        """Return the SMTP password, decrypting it if it is still encrypted"""
+        _pwd = self.credentials.get('password', '') or ''
+        if isinstance(_pwd, str) and _pwd.startswith('gAAAA'):
+            try:
+                from notifications.utils.encryption import decrypt_data
+                ciphertext = _pwd
+                _pwd = decrypted_secrets.get(
+                    (self.tenant_id, 'password', ciphertext),
+                    lambda: decrypt_data(ciphertext)
+                )
+                logger.info(f"🔐 EmailHandler - decrypted tenant password fallback (masked): {_pwd[:6]}... (len={len(_pwd)})")
+            except Exception as exc:
+                logger.warning(f"🔐 EmailHandler - password looks encrypted but failed to decrypt locally; proceeding with original value. Error: {exc}")
+        return _pwd
+
+    def _get_connection(self):
+        """Open the tenant's SMTP connection, or return the one already open"""
+        if self._connection is None:
+            creds = self.credentials
+            connection = get_connection(
+                backend='django.core.mail.backends.smtp.EmailBackend',
+                host=creds.get('smtp_host'),
+                port=creds.get('smtp_port'),
+                username=creds.get('username'),
+                password=self._get_password(),
+                use_ssl=creds.get('use_ssl', False),
+                use_tls=creds.get('use_tls', False),
+                timeout=20,
+                fail_silently=False
+            )
+            # An explicitly opened connection stays open across send_messages() calls
+            connection.open()
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        """Close the SMTP connection, if one was opened"""
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            finally:
+                self._connection = None
+
+    def _reconnect(self):
+        """Replace a reused session the server has dropped; callers retry only once"""
+        logger.warning(f"SMTP session for tenant {self.tenant_id} was closed by the server, reconnecting")
+        self.close()
+        return self._get_connection()
+
+    def __enter__(self):
+        """Keep one SMTP session open across every send() in the block
+
+        Reuse is opt-in. The Celery tasks build a handler per notification and
+        send a single email with it, so they do not use this block and each of
+        their sends opens and closes its own session.
+        """
+        self._get_connection()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _build_message(self, recipient: str, content: dict, context: dict, connection) -> EmailMultiAlternatives:
+        """Render content and build the email message; recipient may be None for a template to clone"""
+        rendered_content = self._render_content(content, context)
+        context.setdefault('company_name', context.get('tenant_name', 'Company'))
+        html_body = self._render_html_template(content, context)
+        email = EmailMultiAlternatives(
+            subject=rendered_content.get('subject', ''),
+            body=rendered_content.get('body', ''),
+            from_email=self.credentials.get('from_email') or self.credentials.get('username'),
+            to=[recipient] if recipient else [],
+            connection=connection
+        )
+        email.attach_alternative(html_body, "text/html")
+        return email
+
     async def send(self, recipient: str, content: dict, context: dict, record_id: str = None) -> dict:
-        from django.core.mail import get_connection
+        # Outside a `with handler:` block the session only lives for this send
+        owns_connection = self._connection is None
         try:
             # Tenant branding details are already included in the event payload context
             logger.info(f"Content before rendering: {content}")
             logger.info(f"Context before rendering: {context}")
-            rendered_content = self._render_content(content, context)
-            subject = rendered_content.get('subject', '')
-            body_text = rendered_content.get('body', '')
-            logger.info(f"Rendered content: {rendered_content}")
             logger.info(f"Template context keys: {list(context.keys())}")
             logger.info(f"Code value in context: {context.get('code', 'NOT_FOUND')}")
             logger.info(f"Body template before rendering: {content.get('body', '')[:100]}...")
-            logger.info(f"Body after rendering: {body_text[:100]}...")
-            # Ensure company_name is set for templates
-            context.setdefault('company_name', context.get('tenant_name', 'Company'))
-            html_body = self._render_html_template(content, context)
-            logger.info(f"[DEBUG] Rendered HTML body (first 500 chars): {html_body[:500]}")
             creds = self.credentials
             _pwd = creds.get('password', '') or ''
             _pwd_preview = (_pwd[:6] + '...') if len(_pwd) > 6 else _pwd
             _looks_encrypted = str(_pwd).startswith('gAAAA')
             logger.info(f"🔍 DEBUG - Credentials summary - smtp_host={creds.get('smtp_host')}, smtp_port={creds.get('smtp_port')}, username={creds.get('username')}, password_preview={_pwd_preview}, password_len={len(_pwd)}, looks_encrypted={_looks_encrypted}")
             logger.info(f"🔍 DEBUG - Use SSL: {creds.get('use_ssl')}, Use TLS: {creds.get('use_tls')}")
-            from_email = creds.get('from_email') or creds.get('username')
+            # Reuses the session opened by `with handler:`, if any
+            connection = self._get_connection()
+            # Same message assembly as send_bulk, so the two paths cannot drift apart
+            email = self._build_message(recipient, content, context, connection)
             # Always use tenant's from_email or username as from address; do not fall back to settings
             logger.info(f"📧 Sending email for tenant {self.tenant_id}")
-            logger.info(f"   From: {from_email}")
+            logger.info(f"   From: {email.from_email}")
             logger.info(f"   To: {recipient}")
-            logger.info(f"   Subject: {subject}")
-            logger.info(f"   Content preview: {body_text[:100]}...")
+            logger.info(f"   Subject: {email.subject}")
+            logger.info(f"   Content preview: {email.body[:100]}...")
             logger.info(f"   Using SMTP: {creds.get('smtp_host')}:{creds.get('smtp_port')}")
-            # Decrypt password if needed
-            if isinstance(_pwd, str) and _pwd.startswith('gAAAA'):
-                try:
-                    from notifications.utils.encryption import decrypt_data
-                    _pwd = decrypt_data(_pwd)
-                    logger.info(f"🔐 EmailHandler - decrypted tenant password fallback (masked): {_pwd[:6]}... (len={len(_pwd)})")
-                except Exception as exc:
-                    logger.warning(f"🔐 EmailHandler - password looks encrypted but failed to decrypt locally; proceeding with original value. Error: {exc}")
-            # Use get_connection for pooling
-            connection = get_connection(
-                backend='django.core.mail.backends.smtp.EmailBackend',
-                host=creds.get('smtp_host'),
-                port=creds.get('smtp_port'),
-                username=creds.get('username'),
-                password=_pwd,
-                use_ssl=creds.get('use_ssl', False),
-                use_tls=creds.get('use_tls', False),
-                timeout=20
-            )
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=body_text,
-                from_email=from_email,
-                to=[recipient],
-                connection=connection
-            )
-            email.attach_alternative(html_body, "text/html")
             try:
-                sent = email.send(fail_silently=False)
+                try:
+                    sent = email.send(fail_silently=False)
+                except smtplib.SMTPServerDisconnected:
+                    # The server dropped an idle reused session; reconnect once
+                    email.connection = self._reconnect()
+                    sent = email.send(fail_silently=False)
                 logger.info(f"📬 SMTP send() returned: {sent}")
                 if sent:
                     logger.info(f"✅ Email sent successfully to {recipient}")
@@ -115,4 +169,57 @@ class EmailHandler(BaseHandler):
             logger.error(traceback.format_exc())
             return {'success': False, 'error': str(e), 'response': None}
 
+        finally:
+            if owns_connection:
+                self.close()
+
+    async def send_bulk(self, recipients: list, content: dict, context: dict) -> dict:
+        """
+        Send email to multiple recipients over a single SMTP session
+
+        Every recipient shares the same context, so the subject, text and HTML
+        bodies are rendered into one message which is then cloned per
+        recipient rather than re-rendered.
+
+        Args:
+            recipients: List of email addresses
+            content: Email content
+            context: Template context
+
+        Returns:
+            dict: Bulk send results
+        """
+        owns_connection = self._connection is None
+        try:
+            connection = self._get_connection()
+            template = self._build_message(None, content, dict(context), connection)
+            messages = []
+            for recipient in recipients:
+                message = copy.copy(template)
+                message.to = [recipient]
+                messages.append(message)
+            try:
+                sent = connection.send_messages(messages) or 0
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped an idle reused session; reconnect once
+                connection = self._reconnect()
+                sent = connection.send_messages(messages) or 0
+
+            logger.info(f"Bulk email sent for tenant {self.tenant_id}: {sent}/{len(recipients)}")
+
+            return {
+                'success': True,
+                'total_recipients': len(recipients),
+                'success_count': sent,
+                'failure_count': len(recipients) - sent
+            }
+
+        except Exception as e:
+            logger.error(f"Bulk email send error for tenant {self.tenant_id}: {str(e)}")
+            return {'success': False, 'error': str(e), 'response': None}
+
+        finally:
+            if owns_connection:
+                self.close()
+
 # End of EmailHandler
\ No newline at end of file
@@ -1,15 +1,20 @@
 from .base_handler import BaseHandler
+from .rendering import has_placeholders
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 from datetime import datetime
-import json
+import asyncio
 import logging
+import orjson
 import uuid
 from notifications.models import InAppMessage, InAppMessageStatus
 from django.utils import timezone
 
 logger = logging.getLogger('notifications.channels.inapp')
 
+# Upper bound on in-flight group_send calls for a single send_bulk call
+BULK_SEND_CONCURRENCY = 100
+
 class InAppHandler(BaseHandler):
     """
     Handler for real-time in-app notifications via WebSocket
@@ -18,6 +23,9 @@ class InAppHandler(BaseHandler):
     def __init__(self, tenant_id: str, credentials: dict):
         super().__init__(tenant_id, credentials)
         self.notification_id = None
+        # Group names only vary by recipient, so build the tenant parts once
+        self._tenant_group = f"tenant_{tenant_id}"
+        self._group_suffix = f"_{tenant_id}"
 
     async def send(self, recipient: str, content: dict, context: dict, record_id: str = None) -> dict:
         """
@@ -77,7 +85,7 @@ class InAppHandler(BaseHandler):
 
             # Prepare message payload
             message_payload = self._prepare_message_payload(rendered_content, message_type)
-            logger.info(f"📦 Message payload: {json.dumps(message_payload, indent=2)}")
+            logger.info(f"📦 Message payload: {orjson.dumps(message_payload, option=orjson.OPT_INDENT_2).decode()}")
 
             # Send to all target groups
             sent_groups = []
@@ -129,11 +137,13 @@ class InAppHandler(BaseHandler):
 
             # Render title
             if 'title' in content:
-                rendered['title'] = content['title'].format(**context)
+                title = content['title']
+                rendered['title'] = title.format(**context) if has_placeholders(title) else title
 
             # Render body
             if 'body' in content:
-                rendered['body'] = content['body'].format(**context)
+                body = content['body']
+                rendered['body'] = body.format(**context) if has_placeholders(body) else body
 
             # Handle data payload (merge with context if needed)
             if 'data' in content:
@@ -157,7 +167,9 @@ class InAppHandler(BaseHandler):
         rendered_data = {}
 
         for key, value in data.items():
-            if isinstance(value, str):
+            if isinstance(value, str) and not has_placeholders(value):
+                rendered_data[key] = value
+            elif isinstance(value, str):
                 try:
                     rendered_data[key] = value.format(**context)
                 except KeyError:
@@ -178,20 +190,16 @@ class InAppHandler(BaseHandler):
         """
         if recipient == 'all':
             # Tenant-wide broadcast
-            return 'tenant_broadcast', [f"tenant_{self.tenant_id}"]
+            return 'tenant_broadcast', (self._tenant_group,)
 
         elif recipient.startswith('group_'):
             # Custom group broadcast
             group_name = recipient.replace('group_', '')
-            return 'group_notification', [f"group_{group_name}_{self.tenant_id}"]
-
-        elif recipient.isdigit() or len(recipient) > 10:  # Assuming user ID
-            # User-specific notification
-            return 'inapp_notification', [f"user_{recipient}_{self.tenant_id}"]
+            return 'group_notification', ("group_" + group_name + self._group_suffix,)
 
         else:
-            # Default to user-specific
-            return 'inapp_notification', [f"user_{recipient}_{self.tenant_id}"]
+            # User-specific notification
+            return 'inapp_notification', ("user_" + recipient + self._group_suffix,)
 
     def _prepare_message_payload(self, content: dict, message_type: str) -> dict:
         """Prepare the WebSocket message payload"""
@@ -222,8 +230,12 @@ class InAppHandler(BaseHandler):
         """
         Send notification to multiple recipients efficiently
 
+        Content is rendered and the payload built once per message type, then
+        every group_send is issued concurrently (bounded by
+        BULK_SEND_CONCURRENCY) instead of awaiting one round trip per recipient.
+
         Args:
-            recipients: List of user IDs
+            recipients: List of user IDs, group names or 'all'
             content: Notification content
             context: Template context
 
@@ -231,40 +243,46 @@ class InAppHandler(BaseHandler):
             dict: Bulk send results
         """
         try:
-            results = []
-            success_count = 0
-            failure_count = 0
+            channel_layer = get_channel_layer()
+            if not channel_layer:
+                logger.error(f"❌ Channel layer not configured for tenant {self.tenant_id}")
+                return {'success': False, 'error': 'Channel layer not configured', 'response': None}
 
-            # Group recipients by type for efficient sending
-            user_recipients = [r for r in recipients if r != 'all' and not r.startswith('group_')]
+            self.notification_id = str(uuid.uuid4())
+            rendered_content = self._render_content(content, context)
 
-            # Send to individual users
-            for recipient in user_recipients:
-                result = await self.send(recipient, content, context)
-                results.append({
-                    'recipient': recipient,
-                    'success': result['success'],
-                    'error': result.get('error')
-                })
+            payloads = {}
+            targets = []
+            for recipient in recipients:
+                message_type, target_groups = self._determine_message_type(recipient)
+                if message_type not in payloads:
+                    payloads[message_type] = self._prepare_message_payload(rendered_content, message_type)
+                targets.append((recipient, target_groups, payloads[message_type]))
 
-                if result['success']:
-                    success_count += 1
-                else:
-                    failure_count += 1
+            semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
 
-            # Send tenant-wide if 'all' is in recipients
-            if 'all' in recipients:
-                result = await self.send('all', content, context)
-                results.append({
-                    'recipient': 'all',
-                    'success': result['success'],
-                    'error': result.get('error')
-                })
+            async def send_to_groups(target_groups, payload):
+                async with semaphore:
+                    for group_name in target_groups:
+                        await channel_layer.group_send(group_name, payload)
 
-                if result['success']:
-                    success_count += 1
-                else:
+            outcomes = await asyncio.gather(
+                *(send_to_groups(target_groups, payload) for _, target_groups, payload in targets),
+                return_exceptions=True
+            )
+
+            results = []
+            success_count = 0
+            failure_count = 0
+
+            for (recipient, _, _), outcome in zip(targets, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"❌ Failed to send to {recipient}: {str(outcome)}")
+                    results.append({'recipient': recipient, 'success': False, 'error': str(outcome)})
                     failure_count += 1
+                else:
+                    results.append({'recipient': recipient, 'success': True, 'error': None})
+                    success_count += 1
 
             logger.info(f"Bulk in-app notification sent: {success_count} success, {failure_count} failures")
 
@@ -1,14 +1,22 @@
 from .base_handler import BaseHandler
+from ._clients import firebase_apps, decrypted_secrets
+from .rendering import has_placeholders
 from notifications.utils.encryption import decrypt_data
 from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
 import logging
 import json
+import orjson
 
 logger = logging.getLogger('notifications.channels.push')
 
+# FCM accepts at most 500 messages per send_each call
+FCM_BATCH_SIZE = 500
+
 # Optional Firebase import - handle gracefully if not available
 try:
-    from firebase_admin import credentials, messaging, initialize_app, exceptions
+    from firebase_admin import credentials, messaging, initialize_app, get_app, exceptions
     FIREBASE_AVAILABLE = True
 except ImportError:
     logger.warning("Firebase Admin SDK not available. Push notifications will be disabled.")
@@ -18,7 +26,10 @@ except ImportError:
         Certificate = lambda x: None
     class messaging:
         @staticmethod
-        def send(app, message):
+        def send(message, dry_run=False, app=None):
+            raise Exception("Firebase not available")
+        @staticmethod
+        def send_each(messages, dry_run=False, app=None):
             raise Exception("Firebase not available")
         @staticmethod
         def subscribe_to_topic(tokens, topic, app):
@@ -50,6 +61,8 @@ except ImportError:
             pass
     class initialize_app:
         pass
+    def get_app(name=None):
+        raise ValueError("Firebase not available")
     class exceptions:
         class FirebaseError(Exception):
             pass
@@ -77,17 +90,42 @@ class PushHandler(BaseHandler):
             sensitive_fields = ['private_key', 'client_secret', 'refresh_token']
             for field in sensitive_fields:
                 if field in self._decrypted_creds:
-                    self._decrypted_creds[field] = decrypt_data(self._decrypted_creds[field])
+                    ciphertext = self._decrypted_creds[field]
+                    self._decrypted_creds[field] = decrypted_secrets.get(
+                        (self.tenant_id, field, ciphertext),
+                        lambda: decrypt_data(ciphertext)
+                    )
         return self._decrypted_creds
 
+    def _credentials_fingerprint(self) -> str:
+        """Short digest of the stored credentials; it changes whenever they are rotated"""
+        payload = orjson.dumps(self.credentials, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(payload).hexdigest()[:16]
+
+    def _build_firebase_app(self):
+        """Reuse the Firebase app registered for these credentials, initializing it on first use
+
+        The app name includes the credentials fingerprint, so rotated credentials
+        register a new app instead of getting the stale one back from get_app().
+        """
+        name = f'tenant_{self.tenant_id}_{self._credentials_fingerprint()}'
+        try:
+            return get_app(name=name)
+        except ValueError:
+            pass
+
+        creds = self._get_decrypted_credentials()
+        cred = credentials.Certificate(creds)
+        app = initialize_app(cred, name=name)
+        logger.info(f"Initialized Firebase app for tenant {self.tenant_id}")
+        return app
+
     def _get_firebase_app(self):
-        """Get or create Firebase app instance"""
+        """Get the shared Firebase app for this tenant's project"""
         if self._firebase_app is None:
             try:
-                creds = self._get_decrypted_credentials()
-                cred = credentials.Certificate(creds)
-                self._firebase_app = initialize_app(cred, name=f'tenant_{self.tenant_id}')
-                logger.info(f"Initialized Firebase app for tenant {self.tenant_id}")
+                key = (self.tenant_id, self.credentials.get('project_id'), self._credentials_fingerprint())
+                self._firebase_app = firebase_apps.get(key, self._build_firebase_app)
             except Exception as e:
                 logger.error(f"Failed to initialize Firebase app for tenant {self.tenant_id}: {str(e)}")
                 raise
@@ -101,13 +139,16 @@ class PushHandler(BaseHandler):
             # Render basic fields
             for field in ['title', 'body', 'image_url', 'icon']:
                 if field in content:
-                    rendered[field] = content[field].format(**context)
+                    value = content[field]
+                    rendered[field] = value.format(**context) if has_placeholders(value) else value
 
             # Handle data payload
             if 'data' in content:
                 rendered['data'] = {}
                 for key, value in content['data'].items():
-                    if isinstance(value, str):
+                    if isinstance(value, str) and not has_placeholders(value):
+                        rendered['data'][key] = value
+                    elif isinstance(value, str):
                         try:
                             rendered['data'][key] = value.format(**context)
                         except KeyError:
@@ -124,6 +165,14 @@ class PushHandler(BaseHandler):
             logger.error(f"Content rendering error in push notification: {str(e)}")
             return content
 
+    @staticmethod
+    def _serialize_data(data: dict) -> dict:
+        """FCM data values must be strings; JSON-encode anything that is not"""
+        return {
+            str(key): value if isinstance(value, str) else orjson.dumps(value).decode()
+            for key, value in data.items()
+        }
+
     def _create_fcm_message(self, recipient: str, content: dict, message_type: str = 'token') -> messaging.Message:
         """Create FCM message based on recipient type"""
 
@@ -136,12 +185,14 @@ class PushHandler(BaseHandler):
                 image=content.get('image_url')
             )
 
+        data = self._serialize_data(content.get('data', {}))
+
         # Build message based on type
         if message_type == 'token':
             # Single device token
             message = messaging.Message(
                 notification=notification,
-                data=content.get('data', {}),
+                data=data,
                 token=recipient,
                 android=self._get_android_config(content),
                 apns=self._get_apns_config(content),
@@ -151,7 +202,7 @@ class PushHandler(BaseHandler):
             # Topic-based messaging
             message = messaging.Message(
                 notification=notification,
-                data=content.get('data', {}),
+                data=data,
                 topic=recipient,
                 android=self._get_android_config(content),
                 apns=self._get_apns_config(content),
@@ -258,8 +309,8 @@ class PushHandler(BaseHandler):
             else:
                 message = self._create_fcm_message(topic_name, rendered_content, 'topic')
 
-            # Send message
-            response = messaging.send(app, message)
+            # Send message (the Admin SDK is blocking; keep it off the event loop)
+            response = await asyncio.to_thread(messaging.send, message, app=app)
 
             logger.info(f"Push notification sent successfully: {response}")
             return {
@@ -293,6 +344,10 @@ class PushHandler(BaseHandler):
         """
         Send push notification to multiple recipients efficiently
 
+        Content is rendered once and the messages are submitted with
+        messaging.send_each in batches of FCM_BATCH_SIZE, which sends each
+        batch concurrently over the app's pooled HTTP session.
+
         Args:
             recipients: List of FCM tokens
             content: Notification content
@@ -302,25 +357,30 @@ class PushHandler(BaseHandler):
             dict: Bulk send results
         """
         try:
+            app = self._get_firebase_app()
+            rendered_content = self._render_content(content, context)
+
             results = []
             success_count = 0
             failure_count = 0
 
-            # For large batches, consider using topics or FCM's batch send
-            # For now, send individually (FCM has rate limits)
-            for recipient in recipients:
-                result = await self.send(recipient, content, context)
-                results.append({
-                    'recipient': recipient,
-                    'success': result['success'],
-                    'error': result.get('error'),
-                    'message_id': result.get('response', {}).get('message_id')
-                })
-
-                if result['success']:
-                    success_count += 1
-                else:
-                    failure_count += 1
+            for start in range(0, len(recipients), FCM_BATCH_SIZE):
+                batch = recipients[start:start + FCM_BATCH_SIZE]
+                messages = [self._create_fcm_message(recipient, rendered_content, 'token') for recipient in batch]
+                batch_response = await asyncio.to_thread(messaging.send_each, messages, app=app)
+
+                for recipient, response in zip(batch, batch_response.responses):
+                    results.append({
+                        'recipient': recipient,
+                        'success': response.success,
+                        'error': str(response.exception) if response.exception else None,
+                        'message_id': response.message_id
+                    })
+
+                    if response.success:
+                        success_count += 1
+                    else:
+                        failure_count += 1
 
             logger.info(f"Bulk push notification sent: {success_count} success, {failure_count} failures")
 
@@ -0,0 +1,44 @@
+"""
+Template rendering helpers shared by the channel handlers
+"""
+import re
+from functools import lru_cache
+from django.template import Context, Template
+
+# Plain {{ name }} placeholders; anything with filters, tags or lookups needs
+# the Django template engine
+VARIABLE_PATTERN = re.compile(r'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+# Every placeholder syntax the handlers understand ({{ }}, {% %}, {# #} and
+# str.format's {name}) starts with this character
+PLACEHOLDER_MARKER = '{'
+
+
+def has_placeholders(value: str) -> bool:
+    """Cheap check for whether a string needs rendering at all"""
+    return PLACEHOLDER_MARKER in value
+
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str) -> Template:
+    """Compile a template string once; later renders reuse the parsed nodelist"""
+    return Template(source)
+
+
+def render_template(source: str, context: dict) -> str:
+    """Render a template string with the given context"""
+    if not has_placeholders(source):
+        return source
+    return compile_template(source).render(Context(context))
+
+
+def substitute_variables(source: str, context: dict) -> str:
+    """Replace {{ name }} placeholders in one regex pass, leaving unknown names as-is"""
+    if not has_placeholders(source):
+        return source
+
+    def replace(match):
+        name = match.group(1)
+        return str(context[name]) if name in context else match.group(0)
+
+    return VARIABLE_PATTERN.sub(replace, source)
@@ -1,9 +1,20 @@
 from .base_handler import BaseHandler
+from ._clients import twilio_clients, decrypted_secrets
+from .rendering import has_placeholders, substitute_variables
 from notifications.utils.encryption import decrypt_data
+import asyncio
+import json
 import logging
+import re
 
 logger = logging.getLogger('notifications.channels.sms')
 
+# Upper bound on in-flight Twilio requests for a single send_bulk call
+BULK_SEND_CONCURRENCY = 32
+
+# E.164: '+', a non-zero country code digit, up to 15 digits in total
+E164_PATTERN = re.compile(r'\+[1-9]\d{7,14}')
+
 # Optional Twilio import - handle gracefully if not available
 try:
     from twilio.rest import Client
@@ -43,16 +54,26 @@ class SMSHandler(BaseHandler):
             sensitive_fields = ['auth_token']
             for field in sensitive_fields:
                 if field in self._decrypted_creds:
-                    self._decrypted_creds[field] = decrypt_data(self._decrypted_creds[field])
+                    ciphertext = self._decrypted_creds[field]
+                    self._decrypted_creds[field] = decrypted_secrets.get(
+                        (self.tenant_id, field, ciphertext),
+                        lambda: decrypt_data(ciphertext)
+                    )
         return self._decrypted_creds
 
+    def _build_twilio_client(self):
+        """Create a Twilio client from the decrypted credentials"""
+        creds = self._get_decrypted_credentials()
+        client = Client(creds['account_sid'], creds['auth_token'])
+        logger.info(f"Initialized Twilio client for tenant {self.tenant_id}")
+        return client
+
     def _get_twilio_client(self):
-        """Get or create Twilio client instance"""
+        """Get the shared Twilio client for this tenant's credentials"""
         if self._client is None:
             try:
-                creds = self._get_decrypted_credentials()
-                self._client = Client(creds['account_sid'], creds['auth_token'])
-                logger.info(f"Initialized Twilio client for tenant {self.tenant_id}")
+                key = (self.tenant_id, self.credentials['account_sid'], self.credentials['auth_token'])
+                self._client = twilio_clients.get(key, self._build_twilio_client)
             except Exception as e:
                 logger.error(f"Failed to initialize Twilio client for tenant {self.tenant_id}: {str(e)}")
                 raise
@@ -66,14 +87,14 @@ class SMSHandler(BaseHandler):
             # Render body - handle both single and double curly braces
             if 'body' in content:
                 body = content['body']
-                # Replace double curly braces with single ones for Python formatting
-                for key, value in context.items():
-                    body = body.replace(f'{{{{{key}}}}}', str(value))
-                # Also handle single curly braces
-                try:
-                    body = body.format(**context)
-                except KeyError:
-                    pass  # Keep original if formatting fails
+                if has_placeholders(body):
+                    # Substitute double curly brace placeholders in a single pass
+                    body = substitute_variables(body, context)
+                    # Also handle single curly braces
+                    try:
+                        body = body.format(**context)
+                    except KeyError:
+                        pass  # Keep original if formatting fails
                 rendered['body'] = body
 
             return rendered
@@ -110,15 +131,20 @@ class SMSHandler(BaseHandler):
             dict: Success status and response
         """
         try:
+            # Twilio would reject these with error 21211 after a full round trip
+            if not E164_PATTERN.fullmatch(recipient or ''):
+                logger.error(f"Invalid phone number for tenant {self.tenant_id}: {recipient}")
+                return {'success': False, 'error': 'invalid_number', 'response': None}
+
             client = self._get_twilio_client()
             rendered_content = self._render_content(content, context)
 
-            creds = self._get_decrypted_credentials()
-
-            # Send SMS
-            message = client.messages.create(
+            # Send SMS (the Twilio SDK is blocking; run it off the event loop
+            # so concurrent sends from send_bulk actually overlap)
+            message = await asyncio.to_thread(
+                client.messages.create,
                 body=rendered_content['body'],
-                from_=creds['from_number'],
+                from_=self.credentials['from_number'],
                 to=recipient
             )
 
@@ -152,6 +178,11 @@ class SMSHandler(BaseHandler):
         """
         Send SMS to multiple recipients
 
+        Every recipient gets the same rendered body, so when the tenant has a
+        Twilio Notify service configured the whole batch goes out in a single
+        request. Otherwise messages are sent concurrently, bounded by
+        BULK_SEND_CONCURRENCY.
+
         Args:
             recipients: List of phone numbers
             content: SMS content
@@ -161,23 +192,27 @@ class SMSHandler(BaseHandler):
             dict: Bulk send results
         """
         try:
-            results = []
-            success_count = 0
-            failure_count = 0
+            service_sid = self.credentials.get('notify_service_sid')
+            if service_sid:
+                return await self._send_bulk_notify(recipients, content, context, service_sid)
 
-            for recipient in recipients:
-                result = await self.send(recipient, content, context)
-                results.append({
-                    'recipient': recipient,
-                    'success': result['success'],
-                    'error': result.get('error'),
-                    'sid': result.get('response', {}).get('sid')
-                })
-
-                if result['success']:
-                    success_count += 1
-                else:
-                    failure_count += 1
+            semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
+
+            async def send_one(recipient):
+                async with semaphore:
+                    return await self.send(recipient, content, context)
+
+            send_results = await asyncio.gather(
+                *(send_one(recipient) for recipient in recipients),
+                return_exceptions=True
+            )
+
+            results = [
+                self._bulk_result(recipient, result)
+                for recipient, result in zip(recipients, send_results)
+            ]
+            success_count = sum(1 for result in results if result['success'])
+            failure_count = len(results) - success_count
 
             logger.info(f"Bulk SMS sent: {success_count} success, {failure_count} failures")
 
@@ -193,6 +228,98 @@ class SMSHandler(BaseHandler):
             logger.error(f"Bulk SMS send error: {str(e)}")
             return {'success': False, 'error': str(e), 'response': None}
 
+    async def iter_send_bulk(self, recipients, content: dict, context: dict):
+        """
+        Send SMS to many recipients, yielding each result as soon as it completes
+
+        At most BULK_SEND_CONCURRENCY sends are in flight and no result list is
+        kept, so memory stays flat however many recipients are streamed in and
+        callers can persist results while later sends are still running.
+        Results arrive in completion order, not input order.
+
+        Args:
+            recipients: Iterable of phone numbers
+            content: SMS content
+            context: Template context
+
+        Yields:
+            dict: Per-recipient result with recipient, success, error and sid
+        """
+        recipients = iter(recipients)
+        pending = {}
+
+        def start_next():
+            for recipient in recipients:
+                pending[asyncio.ensure_future(self.send(recipient, content, context))] = recipient
+                return
+
+        for _ in range(BULK_SEND_CONCURRENCY):
+            start_next()
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    recipient = pending.pop(task)
+                    start_next()
+                    yield self._bulk_result(recipient, task.exception() or task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _bulk_result(recipient: str, result) -> dict:
+        """Flatten a send() result, or the exception it raised, into a bulk result entry"""
+        if isinstance(result, Exception):
+            result = {'success': False, 'error': str(result), 'response': None}
+        return {
+            'recipient': recipient,
+            'success': result['success'],
+            'error': result.get('error'),
+            'sid': (result.get('response') or {}).get('sid')
+        }
+
+    async def _send_bulk_notify(self, recipients: list, content: dict, context: dict, service_sid: str) -> dict:
+        """
+        Send one Twilio Notify request that fans the same body out to every recipient
+
+        Numbers that are not E.164 are rejected up front with 'invalid_number',
+        as send() does. For the rest, success means Notify accepted the request;
+        their entries carry status 'queued' because delivery is not known yet.
+        """
+        accepted, results = [], []
+        for recipient in recipients:
+            if E164_PATTERN.fullmatch(recipient or ''):
+                accepted.append(recipient)
+            else:
+                logger.error(f"Invalid phone number for tenant {self.tenant_id}: {recipient}")
+                results.append({'recipient': recipient, 'success': False, 'error': 'invalid_number', 'sid': None})
+
+        if accepted:
+            client = self._get_twilio_client()
+            rendered_content = self._render_content(content, context)
+            bindings = [json.dumps({'binding_type': 'sms', 'address': recipient}) for recipient in accepted]
+
+            notification = await asyncio.to_thread(
+                client.notify.v1.services(service_sid).notifications.create,
+                to_binding=bindings,
+                body=rendered_content['body']
+            )
+
+            logger.info(f"Bulk SMS submitted via Notify service {service_sid}: {notification.sid}")
+            results.extend(
+                {'recipient': recipient, 'success': True, 'error': None, 'sid': notification.sid, 'status': 'queued'}
+                for recipient in accepted
+            )
+
+        return {
+            'success': True,
+            'total_recipients': len(recipients),
+            'success_count': len(accepted),
+            'failure_count': len(recipients) - len(accepted),
+            'results': results
+        }
+
     async def check_status(self, message_sid: str) -> dict:
         """
         Check delivery status of an SMS message
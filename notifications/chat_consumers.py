@@ -67,6 +67,13 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         except Exception as e:
             logger.error(f"Chat disconnect error: {str(e)}")
 
+    async def receive(self, text_data=None, bytes_data=None, **kwargs):
+        """Answer malformed JSON with an error frame instead of dropping the connection"""
+        try:
+            await super().receive(text_data=text_data, bytes_data=bytes_data, **kwargs)
+        except json.JSONDecodeError:
+            await self.send_json({'type': 'error', 'message': 'Invalid JSON'})
+
     async def receive_json(self, content):
         """Handle incoming WebSocket messages"""
         try:
@@ -1 +1,4 @@
-# Event handlers package
\ No newline at end of file
+# Event handlers package
+from .registry import EVENT_HANDLERS, HANDLER_BY_EVENT, dispatch, event_registry
+
+__all__ = ['EVENT_HANDLERS', 'HANDLER_BY_EVENT', 'dispatch', 'event_registry']
@@ -8,15 +8,14 @@ logger = logging.getLogger('notifications.events.app')
 class InvoicePaymentHandler(BaseEventHandler):
     """Handles invoice payment events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['invoice.payment.failed'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['invoice.payment.failed']
         self.default_channels = [ChannelType.EMAIL, ChannelType.SMS, ChannelType.PUSH]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_template_data(self, event_payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             'invoice_id': event_payload.get('invoice_id', ''),
@@ -68,15 +67,14 @@ class InvoicePaymentHandler(BaseEventHandler):
 class TaskAssignmentHandler(BaseEventHandler):
     """Handles task assignment events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['task.assigned'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['task.assigned']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP, ChannelType.PUSH]
         self.priority = 'medium'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_template_data(self, event_payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             'task_id': event_payload.get('task_id', ''),
@@ -136,15 +134,14 @@ class TaskAssignmentHandler(BaseEventHandler):
 class CommentMentionHandler(BaseEventHandler):
     """Handles comment mention events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['comment.mentioned'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['comment.mentioned']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP, ChannelType.PUSH]
         self.priority = 'medium'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_template_data(self, event_payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             'comment_id': event_payload.get('comment_id', ''),
@@ -200,15 +197,14 @@ class CommentMentionHandler(BaseEventHandler):
 class ContentEngagementHandler(BaseEventHandler):
     """Handles content engagement events (likes, etc.)"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['content.liked'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['content.liked']
         self.default_channels = [ChannelType.INAPP, ChannelType.PUSH]
         self.priority = 'low'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_template_data(self, event_payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             'content_id': event_payload.get('content_id', ''),
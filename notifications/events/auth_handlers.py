@@ -1,6 +1,6 @@
-from .base_handler import BaseEventHandler
+from .base_handler import BaseEventHandler, render_event_template
 from notifications.models import ChannelType, NotificationRecord
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, Optional
 import logging
 from django.utils import timezone
 from datetime import timedelta
@@ -10,15 +10,14 @@ logger = logging.getLogger('notifications.events.auth')
 class UserRegistrationHandler(BaseEventHandler):
     """Handles user registration completed events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['user.registration.completed'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['user.registration.completed']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient - can use username, email, or user_id"""
         # Priority: username > email/user_email > user_id
@@ -103,6 +102,9 @@ IMPORTANT: Keep these credentials secure and do not share them with anyone.'''
 class OTPHandler(BaseEventHandler):
     """Handles OTP code requested events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['auth.2fa.code.requested'])
+
     def _get_inapp_content(self, event_type: str, context: dict) -> dict:
         return {
             'title': 'Your Login Verification Code',
@@ -116,9 +118,8 @@ class OTPHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: dict) -> dict:
-        from django.template.loader import render_to_string
         subject = 'Your Login Verification Code - {{tenant_name}}'
-        body = render_to_string('email/otp_email.html', context)
+        body = render_event_template('email/otp_email.html', context)
         return {
             'subject': subject,
             'body': body
@@ -126,13 +127,9 @@ class OTPHandler(BaseEventHandler):
 
     def __init__(self):
         super().__init__()
-        self.supported_events = ['auth.2fa.code.requested']
         self.default_channels = [ChannelType.EMAIL]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         return event_payload.get('user_email')
 
@@ -154,9 +151,8 @@ class OTPHandler(BaseEventHandler):
         }
 
         def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-                from django.template.loader import render_to_string
                 subject = 'Your Login Verification Code - {{tenant_name}}'
-                body = render_to_string('email/otp_email.html', context)
+                body = render_event_template('email/otp_email.html', context)
                 return {
                         'subject': subject,
                         'body': body
@@ -211,10 +207,12 @@ class OTPHandler(BaseEventHandler):
 class PasswordResetHandler(BaseEventHandler):
     """Handles password reset requested events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['user.password.reset.requested'])
+
     def _get_email_content(self, event_type: str, context: dict) -> dict:
-        from django.template.loader import render_to_string
         subject = 'Password Reset Request - {{tenant_name}}'
-        body = render_to_string('email/password_reset_email.html', context)
+        body = render_event_template('email/password_reset_email.html', context)
         return {
             'subject': subject,
             'body': body
@@ -222,13 +220,9 @@ class PasswordResetHandler(BaseEventHandler):
 
     def __init__(self):
         super().__init__()
-        self.supported_events = ['user.password.reset.requested']
         self.default_channels = [ChannelType.EMAIL, ChannelType.SMS]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         # Can send to both email and phone based on user preference
         return event_payload.get('email') or event_payload.get('phone')
@@ -268,9 +262,8 @@ class PasswordResetHandler(BaseEventHandler):
         }
 
         def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-                from django.template.loader import render_to_string
                 subject = 'Password Reset Request - {{tenant_name}}'
-                body = render_to_string('email/password_reset_email.html', context)
+                body = render_event_template('email/password_reset_email.html', context)
                 return {
                         'subject': subject,
                         'body': body
@@ -325,19 +318,18 @@ class PasswordResetHandler(BaseEventHandler):
 class LoginSecurityHandler(BaseEventHandler):
     """Handles login success and failure events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['user.login.succeeded', 'user.login.failed'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['user.login.succeeded', 'user.login.failed']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
-    def get_default_channels(self, event_type: str) -> List[str]:
+    def get_default_channels(self, event_type: str) -> FrozenSet[ChannelType]:
         if event_type == 'user.login.failed':
-            return [ChannelType.EMAIL, ChannelType.SMS, ChannelType.PUSH, ChannelType.INAPP]
-        return [ChannelType.EMAIL, ChannelType.INAPP]
+            return frozenset({ChannelType.EMAIL, ChannelType.SMS, ChannelType.PUSH, ChannelType.INAPP})
+        return frozenset({ChannelType.EMAIL, ChannelType.INAPP})
 
     def get_template_data(self, event_payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -376,9 +368,8 @@ class LoginSecurityHandler(BaseEventHandler):
                 '''
             }
         else:  # login succeeded
-            from django.template.loader import render_to_string
             subject = 'New Login to Your Account'
-            body = render_to_string('email/login_success_email.html', context)
+            body = render_event_template('email/login_success_email.html', context)
             return {
                 'subject': subject,
                 'body': body
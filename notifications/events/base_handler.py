@@ -1,26 +1,94 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Dict, FrozenSet, Any, Mapping, Optional, Tuple
 import logging
+from django.core.signals import setting_changed
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.template.loader import get_template
 from notifications.models import NotificationRecord, ChannelType
 
 logger = logging.getLogger('notifications.events')
 
+# Rows per INSERT when creating an event's per-channel notifications
+RECORD_BULK_CREATE_BATCH_SIZE = 50
+
+
+@lru_cache(maxsize=None)
+def _compiled_template(template_name: str):
+    """Resolve and compile an email template once per process"""
+    return get_template(template_name)
+
+
+@receiver(setting_changed)
+def _clear_compiled_templates(setting, **kwargs):
+    if setting == 'TEMPLATES':
+        _compiled_template.cache_clear()
+
+
+def render_event_template(template_name: str, context: Mapping[str, Any]) -> str:
+    """render_to_string without the per-call engine and loader lookup"""
+    # Django's template backend only accepts a real dict
+    return _compiled_template(template_name).render(context if isinstance(context, dict) else dict(context))
+
 class BaseEventHandler(ABC):
     """Base class for all event handlers"""
 
+    # Subclasses declare __slots__ = () so handler instances carry no __dict__
+    __slots__ = ('default_channels', 'priority', '_channels_cache')
+
+    SUPPORTED_EVENTS: ClassVar[FrozenSet[str]] = frozenset()
+
+    # Methods the registry and consumers call on every handler
+    HANDLER_INTERFACE: ClassVar[FrozenSet[str]] = frozenset({
+        'can_handle', 'get_default_channels', 'get_template_data',
+        'get_recipient', 'get_channel_content', 'process_event',
+    })
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Accept any iterable in subclasses, but always serve lookups from a frozenset
+        cls.SUPPORTED_EVENTS = frozenset(cls.SUPPORTED_EVENTS)
+
+        # Checked once at class definition, so a broken handler fails at import
+        # rather than on its first event. ABCMeta only sets cls.__abstractmethods__
+        # after this hook, so the bases' abstract hooks are checked directly.
+        # Intermediate bases without events may stay abstract
+        inherited = set().union(*(getattr(base, '__abstractmethods__', ()) for base in cls.__mro__[1:]))
+        unimplemented = sorted(
+            name for name in inherited
+            if getattr(getattr(cls, name, None), '__isabstractmethod__', False)
+        )
+        if cls.SUPPORTED_EVENTS and unimplemented:
+            raise TypeError(f"{cls.__name__} declares events but does not implement: {', '.join(unimplemented)}")
+        if not cls.SUPPORTED_EVENTS and not unimplemented:
+            raise TypeError(f"{cls.__name__} implements every hook but declares no SUPPORTED_EVENTS")
+
     def __init__(self):
-        self.supported_events = []
         self.default_channels = []
         self.priority = 'medium'  # low, medium, high
+        self._channels_cache: Dict[str, FrozenSet[ChannelType]] = {}
 
-    @abstractmethod
     def can_handle(self, event_type: str) -> bool:
         """Check if this handler can process the event type"""
-        pass
+        return event_type in self.SUPPORTED_EVENTS
 
-    def get_default_channels(self, event_type: str) -> List[str]:
+    def get_default_channels(self, event_type: str) -> FrozenSet[ChannelType]:
         """Get recommended channels for this event type"""
-        return self.default_channels
+        return frozenset(self.default_channels)
+
+    def get_channels(self, event_type: str) -> FrozenSet[ChannelType]:
+        """Memoized get_default_channels; channel sets are fixed per event type"""
+        channels = self._channels_cache.get(event_type)
+        if channels is None:
+            channels = self._channels_cache[event_type] = frozenset(self.get_default_channels(event_type))
+        return channels
+
+    def get_ordered_channels(self, event_type: str) -> Tuple[ChannelType, ...]:
+        """get_channels in ChannelType declaration order, for listings that need a stable order"""
+        channels = self.get_channels(event_type)
+        return tuple(channel for channel in ChannelType if channel in channels)
 
     def get_priority(self, event_type: str) -> str:
         """Get priority level for this event type"""
@@ -36,22 +104,25 @@ class BaseEventHandler(ABC):
         # Default implementation - override if needed
         return event_payload.get('email') or event_payload.get('phone') or event_payload.get('user_id')
 
-    def get_channel_content(self, event_type: str, event_payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-        """Get content for each channel type"""
-        context = self.get_template_data(event_payload)
+    def get_channel_content(self, event_type: str, event_payload: Dict[str, Any],
+                            context: Optional[Mapping[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get content for each channel type, reusing context when the caller already extracted it"""
+        if context is None:
+            context = self.get_template_data(event_payload)
 
+        channels = self.get_channels(event_type)
         content_map = {}
 
-        if ChannelType.EMAIL in self.get_default_channels(event_type):
+        if ChannelType.EMAIL in channels:
             content_map[ChannelType.EMAIL.value] = self._get_email_content(event_type, context)
 
-        if ChannelType.SMS in self.get_default_channels(event_type):
+        if ChannelType.SMS in channels:
             content_map[ChannelType.SMS.value] = self._get_sms_content(event_type, context)
 
-        if ChannelType.PUSH in self.get_default_channels(event_type):
+        if ChannelType.PUSH in channels:
             content_map[ChannelType.PUSH.value] = self._get_push_content(event_type, context)
 
-        if ChannelType.INAPP in self.get_default_channels(event_type):
+        if ChannelType.INAPP in channels:
             content_map[ChannelType.INAPP.value] = self._get_inapp_content(event_type, context)
 
         return content_map
@@ -75,54 +146,74 @@ class BaseEventHandler(ABC):
 
     def process_event(self, event: Dict[str, Any]) -> Optional[NotificationRecord]:
         """Process the event and create notifications"""
+        event_type = event.get('event_type')
+        event_payload = event.get('payload')
+        # Reject before any template, channel or DB work
+        if not event_payload or not self.can_handle(event_type):
+            logger.info(f"🎯 Handler {self.__class__.__name__} skipping {event_type}: unsupported event or empty payload")
+            return None
+
         try:
-            event_type = event['event_type']
-            event_payload = event['payload']
             tenant_id = event['tenant_id']
 
             logger.info(f"🎯 EVENT HANDLER: Processing {event_type} for tenant {tenant_id}")
 
-            if not self.can_handle(event_type):
-                logger.info(f"🎯 Handler {self.__class__.__name__} cannot handle {event_type}")
-                return None
-
             recipient = self.get_recipient(event_payload)
             logger.info(f"🎯 Recipient identified: {recipient}")
             if not recipient:
                 logger.warning(f"❌ No recipient found for event {event_type}")
                 return None
 
-            channels_content = self.get_channel_content(event_type, event_payload)
+            # Extract template data once; content builders share a read-only view of it
+            template_data = self.get_template_data(event_payload)
+            channels_content = self.get_channel_content(
+                event_type, event_payload, context=MappingProxyType(template_data)
+            )
             logger.info(f"🎯 Channel content generated: {list(channels_content.keys())}")
 
 
             # Create notifications for each channel
-            notifications = []
+            records = []
             for channel, content in channels_content.items():
                 if content:  # Only create if content is provided
                     logger.info(f"🔔 Creating notification for channel: {channel}")
                     if not tenant_id:
                         logger.error(f"❌ tenant_id is missing, cannot create NotificationRecord for channel {channel} and recipient {recipient}")
                         continue
-                    notification = NotificationRecord.objects.create(
+                    records.append(NotificationRecord(
                         tenant_id=tenant_id,
                         channel=channel,  # channel is already a string (enum value)
                         recipient=recipient,
                         context={
-                            'template_data': self.get_template_data(event_payload),
+                            'template_data': template_data,
                             'content': content
                         }
-                    )
-                    notifications.append(notification)
-                    logger.info(f"✅ Notification created: ID={notification.id}, Channel={channel}")
-
-                    # Trigger async sending
-                    from notifications.tasks import send_notification_task
-                    send_notification_task.delay(
-                        str(notification.id), channel, recipient, content,
-                        self.get_template_data(event_payload)
-                    )
-                    logger.info(f"📤 Async send task queued for notification {notification.id}")
+                    ))
+
+            notifications = []
+            if records:
+                notifications = NotificationRecord.objects.bulk_create(
+                    records, batch_size=RECORD_BULK_CREATE_BATCH_SIZE
+                )
+
+            batch = []
+            for notification in notifications:
+                # bulk_create skips post_save; replay it so receivers such as the in-app WebSocket push still run
+                post_save.send(
+                    sender=NotificationRecord, instance=notification, created=True,
+                    update_fields=None, raw=False, using=NotificationRecord.objects.db
+                )
+                logger.info(f"✅ Notification created: ID={notification.id}, Channel={notification.channel}")
+                batch.append([
+                    str(notification.id), notification.channel, recipient,
+                    notification.context['content'], template_data
+                ])
+
+            # Trigger async sending for every channel in one enqueue
+            if batch:
+                from notifications.tasks import send_notifications_batch_task
+                send_notifications_batch_task.delay(batch)
+                logger.info(f"📤 Async send batch queued for {len(batch)} notifications")
 
             logger.info(f"🎯 Processed event {event_type} for tenant {tenant_id}: {len(notifications)} notifications created")
             return notifications[0] if notifications else None
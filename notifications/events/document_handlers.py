@@ -9,18 +9,17 @@ logger = logging.getLogger('notifications.events.document')
 class DocumentExpiryHandler(BaseEventHandler):
     """Handles document expiry warning and expired events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset([
+        'user.document.expiry.warning',
+        'user.document.expired'
+    ])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = [
-            'user.document.expiry.warning',
-            'user.document.expired'
-        ]
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'medium'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient email from event payload"""
         return event_payload.get('user_email')
@@ -124,17 +123,16 @@ class DocumentExpiryHandler(BaseEventHandler):
 class DocumentAcknowledgmentHandler(BaseEventHandler):
    """Handles document acknowledgment events"""
 
+   __slots__ = ()
+   SUPPORTED_EVENTS = frozenset([
+       'document.acknowledged'
+   ])
+
    def __init__(self):
        super().__init__()
-       self.supported_events = [
-           'document.acknowledged'
-       ]
        self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
        self.priority = 'medium'
 
-   def can_handle(self, event_type: str) -> bool:
-       return event_type in self.supported_events
-
    def get_recipient(self, event_payload: Dict[str, Any]) -> str:
        """Extract recipient email from event payload"""
        return event_payload.get('user_email')
@@ -44,7 +44,7 @@ class EventRegistry:
         ]
 
         for handler in handlers:
-            for event_type in handler.supported_events:
+            for event_type in handler.SUPPORTED_EVENTS:
                 self.handlers[event_type] = handler
 
         logger.info(f"Registered {len(self.handlers)} event types with {len(handlers)} handlers")
@@ -71,6 +71,10 @@ class EventRegistry:
 
         return handler.process_event(event)
 
+    def is_supported(self, event_type: str) -> bool:
+        """Check whether any handler is registered for the event type"""
+        return event_type in self.handlers
+
     def get_event_info(self, event_type: str) -> Optional[Dict[str, Any]]:
         """Get information about an event type"""
         handler = self.get_handler(event_type)
@@ -79,11 +83,25 @@ class EventRegistry:
 
         return {
             'handler_class': handler.__class__.__name__,
-            'default_channels': handler.get_default_channels(event_type),
+            'default_channels': handler.get_ordered_channels(event_type),
             'priority': handler.get_priority(event_type),
             'supported': True
         }
 
 
 # Global registry instance
-event_registry = EventRegistry()
\ No newline at end of file
+event_registry = EventRegistry()
+
+# event_type -> shared handler instance, built once at import
+HANDLER_BY_EVENT = event_registry.handlers
+
+# event_type -> handler class, for introspection
+EVENT_HANDLERS = {event_type: type(handler) for event_type, handler in HANDLER_BY_EVENT.items()}
+
+
+def dispatch(event: Dict[str, Any]) -> Optional[Any]:
+    """Route an event to its registered handler with a single dict lookup"""
+    handler = HANDLER_BY_EVENT.get(event.get('event_type'))
+    if handler is None:
+        return None
+    return handler.process_event(event)
@@ -1,4 +1,4 @@
-from .base_handler import BaseEventHandler
+from .base_handler import BaseEventHandler, render_event_template
 from notifications.models import ChannelType
 from typing import Dict, Any, List
 import logging
@@ -8,15 +8,14 @@ logger = logging.getLogger('notifications.events.review')
 class ReviewApprovedHandler(BaseEventHandler):
     """Handles review approval events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['reviews.approved'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['reviews.approved']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'medium'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient - the reviewer whose review was approved"""
         return event_payload.get('reviewer_email')
@@ -33,9 +32,8 @@ class ReviewApprovedHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        from django.template.loader import render_to_string
         subject = 'Your Review Has Been Approved'
-        body = render_to_string('email/review_approved.html', context)
+        body = render_event_template('email/review_approved.html', context)
         return {
             'subject': subject,
             'body': body
@@ -57,15 +55,14 @@ class ReviewApprovedHandler(BaseEventHandler):
 class ReviewQRScannedHandler(BaseEventHandler):
     """Handles QR scan events for reviews"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['reviews.qr_scanned'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['reviews.qr_scanned']
         self.default_channels = [ChannelType.INAPP]  # Maybe notify business admin
         self.priority = 'low'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient - could be business admin or system"""
         # For now, use a placeholder or admin email
@@ -82,9 +79,8 @@ class ReviewQRScannedHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        from django.template.loader import render_to_string
         subject = 'New Review Submitted via QR Code'
-        body = render_to_string('email/review_qr_scanned.html', context)
+        body = render_event_template('email/review_qr_scanned.html', context)
         return {
             'subject': subject,
             'body': body
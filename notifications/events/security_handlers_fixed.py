@@ -1,6 +1,6 @@
 from .base_handler import BaseEventHandler
 from notifications.models import ChannelType
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet
 import logging
 
 logger = logging.getLogger('notifications.events.security')
@@ -8,26 +8,25 @@ logger = logging.getLogger('notifications.events.security')
 class TwoFactorAuthHandler(BaseEventHandler):
     """Handles 2FA-related security events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset([
+        'auth.2fa.code.requested',
+        'auth.2fa.attempt.failed',
+        'auth.2fa.method.changed'
+    ])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = [
-            'auth.2fa.code.requested',
-            'auth.2fa.attempt.failed',
-            'auth.2fa.method.changed'
-        ]
         self.default_channels = [ChannelType.SMS, ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
-    def get_default_channels(self, event_type: str) -> List[str]:
+    def get_default_channels(self, event_type: str) -> FrozenSet[ChannelType]:
         if event_type == 'auth.2fa.code.requested':
-            return [ChannelType.SMS, ChannelType.EMAIL]  # Primary and backup
+            return frozenset({ChannelType.SMS, ChannelType.EMAIL})  # Primary and backup
         elif event_type == 'auth.2fa.attempt.failed':
-            return [ChannelType.EMAIL, ChannelType.SMS, ChannelType.PUSH]
+            return frozenset({ChannelType.EMAIL, ChannelType.SMS, ChannelType.PUSH})
         else:  # method changed
-            return [ChannelType.EMAIL, ChannelType.INAPP]
+            return frozenset({ChannelType.EMAIL, ChannelType.INAPP})
 
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient from 2FA event payload"""
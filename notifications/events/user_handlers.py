@@ -1,4 +1,4 @@
-from .base_handler import BaseEventHandler
+from .base_handler import BaseEventHandler, render_event_template
 from notifications.models import ChannelType
 from typing import Dict, Any, List
 import logging
@@ -8,15 +8,14 @@ logger = logging.getLogger('notifications.events.user')
 class UserAccountCreatedHandler(BaseEventHandler):
     """Handles user account created events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['user.account.created'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['user.account.created']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         return event_payload.get('user_email') or event_payload.get('email')
 
@@ -30,9 +29,8 @@ class UserAccountCreatedHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        from django.template.loader import render_to_string
         subject = 'Your Account Has Been Created - {{tenant_name}}'
-        body = render_to_string('email/user_account_created.html', context)
+        body = render_event_template('email/user_account_created.html', context)
         return {
             'subject': subject,
             'body': body
@@ -53,15 +51,14 @@ class UserAccountCreatedHandler(BaseEventHandler):
 class UserProfileUpdateHandler(BaseEventHandler):
     """Handles user profile update events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['user.profile.updated'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['user.profile.updated']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'medium'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient - the user whose profile was updated"""
         return event_payload.get('user_email')
@@ -79,9 +76,8 @@ class UserProfileUpdateHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        from django.template.loader import render_to_string
         subject = 'Your Profile Has Been Updated - {{tenant_name}}'
-        body = render_to_string('email/user_profile_updated.html', context)
+        body = render_event_template('email/user_profile_updated.html', context)
         return {
             'subject': subject,
             'body': body
@@ -107,20 +103,19 @@ class UserProfileUpdateHandler(BaseEventHandler):
 class UserAccountActionHandler(BaseEventHandler):
     """Handles user account action events (lock, unlock, suspend, activate)"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset([
+        'user.account.locked',
+        'user.account.unlocked',
+        'user.account.suspended',
+        'user.account.activated'
+    ])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = [
-            'user.account.locked',
-            'user.account.unlocked',
-            'user.account.suspended',
-            'user.account.activated'
-        ]
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient - the user whose account was affected"""
         return event_payload.get('user_email')
@@ -139,9 +134,8 @@ class UserAccountActionHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        from django.template.loader import render_to_string
         subject = 'Account Status Changed - {{tenant_name}}'
-        body = render_to_string('email/user_account_action.html', context)
+        body = render_event_template('email/user_account_action.html', context)
         return {
             'subject': subject,
             'body': body
@@ -187,15 +181,14 @@ class UserAccountActionHandler(BaseEventHandler):
 class UserPasswordChangeHandler(BaseEventHandler):
     """Handles user password change events"""
 
+    __slots__ = ()
+    SUPPORTED_EVENTS = frozenset(['user.password.changed'])
+
     def __init__(self):
         super().__init__()
-        self.supported_events = ['user.password.changed']
         self.default_channels = [ChannelType.EMAIL, ChannelType.INAPP]
         self.priority = 'high'
 
-    def can_handle(self, event_type: str) -> bool:
-        return event_type in self.supported_events
-
     def get_recipient(self, event_payload: Dict[str, Any]) -> str:
         """Extract recipient - the user whose password was changed"""
         return event_payload.get('user_email')
@@ -213,9 +206,8 @@ class UserPasswordChangeHandler(BaseEventHandler):
         }
 
     def _get_email_content(self, event_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        from django.template.loader import render_to_string
         subject = 'Your Password Has Been Changed - {{tenant_name}}'
-        body = render_to_string('email/user_password_changed.html', context)
+        body = render_event_template('email/user_password_changed.html', context)
         return {
             'subject': subject,
             'body': body
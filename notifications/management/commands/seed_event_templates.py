@@ -36,7 +36,7 @@ class Command(BaseCommand):
             handler = event_registry.get_handler(event_type)
 
             # Create templates for each channel
-            for channel in handler.get_default_channels(event_type):
+            for channel in handler.get_ordered_channels(event_type):
                 template_name = f"{event_type.replace('.', '_')}_{channel.value}"
 
                 # Check if template exists
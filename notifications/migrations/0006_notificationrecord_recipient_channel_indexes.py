@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-15 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_chatconversation_deleted_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificationrecord',
+            index=models.Index(fields=['tenant_id', 'recipient'], name='notificatio_tenant__3ef3cc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationrecord',
+            index=models.Index(fields=['tenant_id', 'channel'], name='notificatio_tenant__1154f6_idx'),
+        ),
+    ]
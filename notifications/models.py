@@ -16,6 +16,9 @@ class ChannelType(Enum):
     PUSH = 'push'
     INAPP = 'inapp'
 
+# Hashed lookup for validating raw channel strings
+CHANNEL_VALUES = frozenset(tag.value for tag in ChannelType)
+
 class NotificationStatus(Enum):
     PENDING = 'pending'
     SUCCESS = 'success'
@@ -116,6 +119,8 @@ class NotificationRecord(models.Model):
             models.Index(fields=['tenant_id', 'status']),
             models.Index(fields=['tenant_id', 'created_at']),
             models.Index(fields=['status', 'retry_count']),
+            models.Index(fields=['tenant_id', 'recipient']),
+            models.Index(fields=['tenant_id', 'channel']),
         ]
 
     def soft_delete(self):
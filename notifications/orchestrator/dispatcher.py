@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from notifications.channels.base_handler import BaseHandler
 from notifications.channels.email_handler import EmailHandler
@@ -26,3 +27,34 @@ class Dispatcher:
         if not handler_class:
             raise ChannelNotConfiguredError(f"Handler for {channel} not implemented.")
         return handler_class(tenant_id, credentials)
+
+    @staticmethod
+    async def send_all(handlers: dict, recipients: dict, content: dict, context: dict) -> dict:
+        """
+        Send one notification over several channels concurrently
+
+        Channel sends are independent I/O, so total latency is that of the
+        slowest channel rather than the sum of all of them.
+
+        Args:
+            handlers: Mapping of channel name to handler instance
+            recipients: Mapping of channel name to that channel's recipient
+            content: Notification content shared by every channel
+            context: Template context
+
+        Returns:
+            dict: Mapping of channel name to that handler's send result
+        """
+        channels = list(handlers)
+        outcomes = await asyncio.gather(
+            *(handlers[channel].send(recipients[channel], content, context) for channel in channels),
+            return_exceptions=True
+        )
+
+        results = {}
+        for channel, outcome in zip(channels, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"{channel} send raised: {outcome}")
+                outcome = {'success': False, 'error': str(outcome), 'response': None}
+            results[channel] = outcome
+        return results
@@ -115,9 +115,9 @@ class CampaignSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data['tenant_id'] = self.context['request'].tenant_id
+        # Set before the INSERT so creating a campaign is a single write
+        validated_data['total_recipients'] = len(validated_data['recipients'])
         instance = super().create(validated_data)
-        instance.total_recipients = len(validated_data['recipients'])
-        instance.save()
         # Enqueue bulk send
         from notifications.tasks.tasks import send_bulk_campaign_task
         send_bulk_campaign_task.delay(str(instance.id))
@@ -177,10 +177,16 @@ class ChatConversationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
 
     def get_participant_count(self, obj):
+        # Annotated by list views; fall back to a query for single objects
+        if hasattr(obj, 'participant_count'):
+            return obj.participant_count
         return obj.participants.filter(is_active=True).count()
 
     def get_last_message(self, obj):
-        last_msg = obj.messages.filter(is_deleted=False).order_by('-created_at').first()
+        if hasattr(obj, 'latest_messages'):
+            last_msg = obj.latest_messages[0] if obj.latest_messages else None
+        else:
+            last_msg = obj.messages.filter(is_deleted=False).order_by('-created_at').first()
         if last_msg:
             return {
                 'id': last_msg.id,
@@ -229,6 +235,8 @@ class ChatMessageSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'sender_id', 'edited_at', 'created_at']
 
     def get_reply_count(self, obj):
+        if hasattr(obj, 'reply_count'):
+            return obj.reply_count
         return obj.replies.filter(is_deleted=False).count()
 
     def create(self, validated_data):
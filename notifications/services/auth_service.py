@@ -1,6 +1,7 @@
 import requests
 import logging
 from django.conf import settings
+from django.core.cache import cache
 from typing import Optional, Dict, Any
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -16,6 +17,7 @@ class AuthServiceClient:
         self.auth_base_url = getattr(settings, 'API_GATEWAY_URL', settings.AUTH_SERVICE_URL).rstrip('/')  # Use gateway for auth calls
         self.tenant_base_url = getattr(settings, 'TENANT_SERVICE_URL', settings.AUTH_SERVICE_URL).rstrip('/')
         self.timeout = getattr(settings, 'AUTH_SERVICE_TIMEOUT', 10)
+        self.branding_cache_timeout = getattr(settings, 'TENANT_BRANDING_CACHE_TIMEOUT', 600)
 
         # Setup retry strategy
         self.session = requests.Session()
@@ -104,12 +106,21 @@ class AuthServiceClient:
         """
         Get tenant branding information for email templates
 
+        Branding fetched from the tenant service is cached per tenant for
+        branding_cache_timeout seconds; fallback branding is never cached so
+        a tenant service outage does not outlive itself.
+
         Args:
             tenant_id: UUID of the tenant
 
         Returns:
             Branding dict with name, logo, colors, etc.
         """
+        cache_key = f'tenant_branding:{tenant_id}'
+        branding = cache.get(cache_key)
+        if branding is not None:
+            return branding
+
         tenant_details = self.get_tenant_details(tenant_id, token)
 
         if not tenant_details:
@@ -123,7 +134,7 @@ class AuthServiceClient:
                 'email_from': f'noreply@{tenant_prefix}.local'
             }
 
-        return {
+        branding = {
             'name': tenant_details.get('name', 'Company'),
             'logo_url': tenant_details.get('logo'),
             'primary_color': tenant_details.get('primary_color', '#FF0000'),
@@ -132,6 +143,8 @@ class AuthServiceClient:
             'about_us': tenant_details.get('about_us', ''),
             'status': tenant_details.get('status', 'active')
         }
+        cache.set(cache_key, branding, self.branding_cache_timeout)
+        return branding
 
 
 # Global client instance
@@ -1,10 +1,14 @@
 # Tasks package
 
-from .tasks import send_notification_task, send_bulk_campaign_task, update_campaign_completion, process_error_task
+from .tasks import (
+    send_notification_task, send_notifications_batch_task, send_bulk_campaign_task,
+    update_campaign_completion, process_error_task
+)
 from .email_tasks import send_email_task
 
 __all__ = [
     'send_notification_task',
+    'send_notifications_batch_task',
     'send_bulk_campaign_task',
     'update_campaign_completion',
     'process_error_task',
@@ -0,0 +1,32 @@
+"""
+Celery task routing
+
+Channel sends are routed to a queue named after the channel so email, SMS,
+push and in-app delivery can be scaled on separate worker pools. A worker
+started without -Q only consumes the default queue, so workers must list the
+channel queues they serve.
+"""
+
+SEND_NOTIFICATION_TASK = 'notifications.tasks.tasks.send_notification_task'
+SEND_EMAIL_TASK = 'notifications.tasks.email_tasks.send_email_task'
+
+
+def route_notification_task(name, args, kwargs, options, task=None, **kw):
+    """
+    Route channel send tasks to their channel's queue
+
+    Returns:
+        dict: {'queue': channel} for channel sends, None to fall through to the default queue
+    """
+    from notifications.models import CHANNEL_VALUES
+
+    if name == SEND_NOTIFICATION_TASK:
+        channel = kwargs.get('channel') or (args[1] if args and len(args) > 1 else None)
+    elif name == SEND_EMAIL_TASK:
+        channel = 'email'
+    else:
+        return None
+
+    if channel in CHANNEL_VALUES:
+        return {'queue': channel}
+    return None
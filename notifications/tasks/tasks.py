@@ -172,6 +172,21 @@ def send_notification_task(self, record_id: str, channel: str, recipient: str, c
 
 
 
+@shared_task
+def send_notifications_batch_task(batch: list):
+    """
+    Fan out a batch of channel sends enqueued with a single broker round-trip
+
+    Args:
+        batch: list of [record_id, channel, recipient, content, context] entries,
+            matching send_notification_task's arguments
+    """
+    if not batch:
+        return
+    group(send_notification_task.s(*item) for item in batch).apply_async()
+    logger.info(f"[TASK] Fanned out {len(batch)} notification sends")
+
+
 @shared_task
 def process_error_task(record_id: str):
     # Handle dead-letter or final errors (e.g., notify tenant admin)
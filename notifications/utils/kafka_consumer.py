@@ -172,7 +172,7 @@ class NotificationKafkaConsumer:
             return False
 
         # Check if event type is supported
-        if event['event_type'] not in event_registry.get_supported_events():
+        if not event_registry.is_supported(event['event_type']):
             logger.info(f"Unsupported event type: {event['event_type']}")
             return False
 
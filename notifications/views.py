@@ -26,7 +26,7 @@ import logging
 logger = logging.getLogger('notifications.api')
 
 from rest_framework.views import APIView
-from django.db.models import Count, Q
+from django.db.models import Count, Prefetch, Q
 from django.utils import timezone
 from datetime import timedelta
 
@@ -329,13 +329,26 @@ class ChatConversationListCreateView(generics.ListCreateAPIView):
             tenant_id = self.request.tenant_id
             user = self.request.user
             user_id = getattr(user, "id", None)
-            # Return conversations where user is a participant
+            # Return conversations where user is a participant; the counts and
+            # latest message are loaded up front so serialization is query-free
+            member_of = ChatParticipant.objects.filter(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                is_active=True
+            ).values('conversation_id')
             return ChatConversation.objects.filter(
                 tenant_id=tenant_id,
-                participants__user_id=user_id,
-                participants__is_active=True,
+                id__in=member_of,
                 is_active=True
-            ).distinct()
+            ).annotate(
+                participant_count=Count('participants', filter=Q(participants__is_active=True))
+            ).prefetch_related(
+                Prefetch(
+                    'messages',
+                    queryset=ChatMessage.objects.filter(is_deleted=False).order_by('-created_at')[:1],
+                    to_attr='latest_messages'
+                )
+            )
 
     def create(self, request, *args, **kwargs):
         tenant_id = request.tenant_id
@@ -443,7 +456,9 @@ class ChatMessageListCreateView(generics.ListCreateAPIView):
             tenant_id=tenant_id,
             conversation_id=conversation_id,
             is_deleted=False
-        )
+        ).annotate(
+            reply_count=Count('replies', filter=Q(replies__is_deleted=False))
+        ).prefetch_related('reactions').order_by('created_at')
 
     def perform_create(self, serializer):
         message = serializer.save()
@@ -234,6 +234,34 @@ def mock_redis():
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_provider_clients():
+    """Drop cached Twilio/Firebase clients so each test sees its own mocks"""
+    from notifications.channels._clients import clear_client_caches
+
+    clear_client_caches()
+    yield
+    clear_client_caches()
+
+
+@pytest.fixture(autouse=True)
+def mute_signals(request):
+    """Disconnect post_save side effects unless the test is marked with_signals"""
+    if request.node.get_closest_marker('with_signals'):
+        yield
+        return
+
+    from django.db.models.signals import post_save
+    from notifications.models import NotificationRecord
+    from notifications.signals import send_inapp_notification_ws
+
+    post_save.disconnect(send_inapp_notification_ws, sender=NotificationRecord)
+    try:
+        yield
+    finally:
+        post_save.connect(send_inapp_notification_ws, sender=NotificationRecord)
+
+
 # Custom test markers
 def pytest_configure(config):
     """Configure pytest with custom markers"""
@@ -241,6 +269,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
     config.addinivalue_line("markers", "websocket: marks tests as WebSocket tests")
     config.addinivalue_line("markers", "event: marks tests as event system tests")
+    config.addinivalue_line("markers", "with_signals: keep model signal receivers connected")
 
 
 # Test utilities
@@ -326,12 +355,9 @@ def time_test_execution(func):
     return wrapper
 
 
-# Database cleanup utilities
-@pytest.fixture(autouse=True)
-def clean_db(db):
-    """Clean database between tests"""
-    from django.core.management import call_command
-    call_command('flush', '--noinput', verbosity=0)
+# Database cleanup: pytest-django rolls back tests marked django_db and flushes
+# transaction=True tests once after they run, and Django test classes manage
+# their own data, so no extra flush is needed. Unmarked tests get no database.
 
 
 # Test data factories
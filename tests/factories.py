@@ -0,0 +1,77 @@
+"""
+factory_boy factories for notification service models
+"""
+from uuid import UUID
+
+import factory
+from factory.django import DjangoModelFactory
+from notifications.models import (
+    NotificationRecord, ChannelType, NotificationStatus,
+    ChatConversation, ChatParticipant, ChatMessage, MessageType
+)
+
+TENANT_ID = "550e8400-e29b-41d4-a716-446655440000"
+USER_ID = "660e8400-e29b-41d4-a716-446655440001"
+
+# Parsed once, so UUIDField saves skip the str -> UUID conversion
+TENANT_UUID = UUID(TENANT_ID)
+USER_UUID = UUID(USER_ID)
+
+
+class BulkDjangoModelFactory(DjangoModelFactory):
+    """DjangoModelFactory whose create_batch issues a single bulk INSERT
+
+    Objects are built before the INSERT, so foreign keys (e.g. conversation)
+    must be passed in rather than left to a SubFactory.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def create_batch(cls, size, **kwargs):
+        model = cls._meta.get_model_class()
+        objs = cls.build_batch(size, **kwargs)
+        return model.objects.bulk_create(objs)
+
+
+class NotificationRecordFactory(BulkDjangoModelFactory):
+    class Meta:
+        model = NotificationRecord
+
+    tenant_id = TENANT_UUID
+    channel = ChannelType.EMAIL.value
+    recipient = factory.Sequence(lambda n: f"user{n}@example.com")
+    context = factory.LazyFunction(dict)
+    status = NotificationStatus.PENDING.value
+
+
+class ChatConversationFactory(BulkDjangoModelFactory):
+    class Meta:
+        model = ChatConversation
+
+    tenant_id = TENANT_UUID
+    title = factory.Sequence(lambda n: f"Conversation {n}")
+    conversation_type = "direct"
+    created_by = USER_UUID
+
+
+class ChatParticipantFactory(BulkDjangoModelFactory):
+    class Meta:
+        model = ChatParticipant
+
+    tenant_id = factory.SelfAttribute('conversation.tenant_id')
+    conversation = factory.SubFactory(ChatConversationFactory)
+    user_id = USER_UUID
+    role = "member"
+
+
+class ChatMessageFactory(BulkDjangoModelFactory):
+    class Meta:
+        model = ChatMessage
+
+    tenant_id = factory.SelfAttribute('conversation.tenant_id')
+    conversation = factory.SubFactory(ChatConversationFactory)
+    sender_id = USER_UUID
+    message_type = MessageType.TEXT.value
+    content = factory.Sequence(lambda n: f"Message {n}")
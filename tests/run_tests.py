@@ -22,6 +22,7 @@ class TestRunner:
         self.test_dir = Path(__file__).parent
         self.start_time = None
         self.end_time = None
+        self.workers = None
 
     def setup_django(self):
         """Setup Django environment for testing"""
@@ -71,6 +72,9 @@ class TestRunner:
         if args:
             cmd.extend(args)
 
+        if self.workers is not None:
+            cmd.extend(["-n", str(self.workers)])
+
         # Add test directory
         cmd.append("tests/")
 
@@ -100,6 +104,9 @@ class TestRunner:
         if args:
             cmd.extend(args)
 
+        if self.workers is not None:
+            cmd.extend(["-n", str(self.workers)])
+
         cmd.append("tests/")
 
         print("Running tests with coverage...")
@@ -107,6 +114,10 @@ class TestRunner:
 
         return stdout, stderr, code
 
+    def set_workers(self, workers):
+        """Override pytest.ini's `-n auto` with a fixed xdist worker count (0 runs in-process)"""
+        self.workers = workers
+
     def run_specific_tests(self, test_type):
         """Run specific test categories"""
         test_mapping = {
@@ -210,10 +221,13 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--fail-fast', '-x', action='store_true', help='Stop on first failure')
     parser.add_argument('--keepdb', action='store_true', help='Keep test database')
+    parser.add_argument('--workers', '-n', type=int,
+                       help='Parallel test workers (default: one per CPU; 0 disables xdist)')
 
     args = parser.parse_args()
 
     runner = TestRunner()
+    runner.set_workers(args.workers)
 
     try:
         if args.coverage:
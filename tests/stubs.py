@@ -0,0 +1,78 @@
+"""
+Lightweight stand-ins for provider SDK objects used by the channel tests
+
+Unlike MagicMock these expose plain attributes only, and record calls in a
+list so tests can still assert on what the handler did.
+"""
+from types import SimpleNamespace
+
+
+class StubCall:
+    """Callable that records its calls and returns a fixed value or raises"""
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    def reset(self, return_value=None, side_effect=None):
+        """Forget recorded calls and set a new outcome"""
+        self.calls.clear()
+        self.return_value = return_value
+        self.side_effect = side_effect
+
+
+def twilio_message(sid="SM1234567890", status="queued"):
+    """A Twilio MessageInstance with the attributes SMSHandler reads"""
+    return SimpleNamespace(
+        sid=sid,
+        status=status,
+        date_sent=None,
+        date_updated=None,
+        error_code=None,
+        error_message=None
+    )
+
+
+class StubTwilioMessages:
+    """client.messages: create() sends, calling it with a SID fetches"""
+
+    def __init__(self, message, error=None):
+        self.message = message
+        self.create = StubCall(return_value=message, side_effect=error)
+
+    def __call__(self, sid):
+        return SimpleNamespace(fetch=lambda: self.message)
+
+
+class StubTwilioClient:
+    def __init__(self, message=None, error=None):
+        self.messages = StubTwilioMessages(message or twilio_message(), error)
+
+
+class StubEmailMessage:
+    """EmailMultiAlternatives instance whose send() returns a fixed count or raises"""
+
+    # Read by the handler's send logging
+    subject = body = from_email = ''
+
+    def __init__(self, sent=1, error=None):
+        self.send = StubCall(return_value=sent, side_effect=error)
+        self.attach_alternative = StubCall()
+
+
+class StubSMTPConnection:
+    def __init__(self, sent=0):
+        self.open = StubCall()
+        self.close = StubCall()
+        self.send_messages = StubCall(return_value=sent)
@@ -1,7 +1,12 @@
 import json
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from uuid import UUID
+from django.db import connection, transaction
 from django.test import TestCase
-from django.urls import reverse
-from rest_framework.test import APITestCase, APIClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+from rest_framework.test import APITestCase, APISimpleTestCase, APIClient, APIRequestFactory
 from rest_framework import status
 from unittest.mock import patch, MagicMock
 from notifications.models import (
@@ -9,62 +14,104 @@ from notifications.models import (
     Campaign, ChannelType, DeviceToken, DeviceType,
     ChatConversation, ChatParticipant, ChatMessage, MessageType
 )
+from tests.factories import NotificationRecordFactory
 
+TENANT_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+USER_ID = UUID("660e8400-e29b-41d4-a716-446655440001")
+
+# Read-only request bodies shared across tests; copy before mutating
+EMAIL_NOTIFICATION_PAYLOAD = MappingProxyType({
+    "channel": "email",
+    "recipient": "test@example.com",
+    "content": {
+        "subject": "Test Subject",
+        "body": "Test Body"
+    },
+    "context": {"name": "Test User"}
+})
+
+
+# Named endpoints, resolved lazily so importing this module does not load the URLconf
+NOTIFICATION_URL = reverse_lazy('notification-list-create')
+CREDENTIALS_URL = reverse_lazy('credentials-list-create')
+TEMPLATE_URL = reverse_lazy('template-list-create')
+CAMPAIGN_URL = reverse_lazy('campaign-list-create')
+ANALYTICS_URL = reverse_lazy('analytics')
+HEALTH_URL = reverse_lazy('health')
+DEVICE_TOKEN_URL = reverse_lazy('device-token-list-create')
+PUSH_TEST_URL = reverse_lazy('push-test')
+SMS_TEST_URL = reverse_lazy('sms-test')
+SMS_COST_ESTIMATE_URL = reverse_lazy('sms-cost-estimate')
+CHAT_CONVERSATIONS_URL = reverse_lazy('chat-conversations')
+FILE_UPLOAD_URL = reverse_lazy('file-upload')
+USER_PRESENCE_URL = reverse_lazy('user-presence-detail')
+
+
+@lru_cache(maxsize=32)
+def chat_messages_url(conversation_id):
+    return reverse('chat-messages', kwargs={'conversation_id': conversation_id})
+
+
+@lru_cache(maxsize=32)
+def message_reactions_url(message_id):
+    return reverse('message-reactions', kwargs={'message_id': message_id})
 
-class NotificationAPITest(APITestCase):
-    """Test notification API endpoints"""
+
+@lru_cache(maxsize=32)
+def sms_status_url(sid):
+    return reverse('sms-status', kwargs={'sid': sid})
+
+
+def _assert_single(queryset):
+    """Fetch at most two rows in one query and return the only one"""
+    rows = list(queryset[:2])
+    assert len(rows) == 1, f"Expected exactly 1 row, got {len(rows)}"
+    return rows[0]
+
+
+class TenantContextTestMixin:
+    """Tenant/user context and credentials applied to each test's fresh APIClient"""
+
+    tenant_id = TENANT_ID
+    user_id = USER_ID
+    client_class = APIClient
+    client_credentials = {}
+    # Mock middleware would set these on the request
+    with_client_context = True
 
     def setUp(self):
-        self.client = APIClient()
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
+        super().setUp()
+        # self.client is built per test by _pre_setup, so nothing carries over
+        if self.client_credentials:
+            self.client.credentials(**self.client_credentials)
+        if self.with_client_context:
+            self.client.tenant_id = self.tenant_id
+            self.client.user_id = self.user_id
+
 
-        # Set tenant and user in request context
-        self.client.credentials(HTTP_AUTHORIZATION='Bearer test_token')
-        # Mock middleware would set these
-        self.client.tenant_id = self.tenant_id
-        self.client.user_id = self.user_id
+class NotificationAPITest(TenantContextTestMixin, APITestCase):
+    """Test notification API endpoints"""
+
+    client_credentials = {'HTTP_AUTHORIZATION': 'Bearer test_token'}
 
     def test_create_notification_record(self):
         """Test creating a notification record"""
-        url = reverse('notification-list-create')
-        data = {
-            "channel": "email",
-            "recipient": "test@example.com",
-            "content": {
-                "subject": "Test Subject",
-                "body": "Test Body"
-            },
-            "context": {"name": "Test User"}
-        }
+        url = NOTIFICATION_URL
 
-        response = self.client.post(url, data, format='json')
+        response = self.client.post(url, EMAIL_NOTIFICATION_PAYLOAD, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(NotificationRecord.objects.count(), 1)
-
-        record = NotificationRecord.objects.first()
+        record = _assert_single(NotificationRecord.objects.all())
         self.assertEqual(record.channel, ChannelType.EMAIL)
         self.assertEqual(record.recipient, "test@example.com")
         self.assertEqual(record.status, "pending")
 
     def test_list_notification_records(self):
         """Test listing notification records"""
-        # Create test records
-        NotificationRecord.objects.create(
-            tenant_id=self.tenant_id,
-            channel=ChannelType.EMAIL,
-            recipient="user1@example.com",
-            content={"subject": "Test 1"}
-        )
-        NotificationRecord.objects.create(
-            tenant_id=self.tenant_id,
-            channel=ChannelType.SMS,
-            recipient="+1234567890",
-            content={"body": "Test SMS"}
-        )
+        # Create test records in a single INSERT
+        NotificationRecordFactory.create_batch(2, tenant_id=self.tenant_id)
 
-        url = reverse('notification-list-create')
+        url = NOTIFICATION_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -86,7 +133,7 @@ class NotificationAPITest(APITestCase):
         )
 
         # Filter by status
-        url = reverse('notification-list-create') + '?status=success'
+        url = f"{NOTIFICATION_URL}?status=success"
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -95,7 +142,7 @@ class NotificationAPITest(APITestCase):
 
     def test_create_tenant_credentials(self):
         """Test creating tenant credentials"""
-        url = reverse('credentials-list-create')
+        url = CREDENTIALS_URL
         data = {
             "channel": "email",
             "credentials": {
@@ -108,9 +155,7 @@ class NotificationAPITest(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(TenantCredentials.objects.count(), 1)
-
-        creds = TenantCredentials.objects.first()
+        creds = _assert_single(TenantCredentials.objects.all())
         self.assertEqual(creds.channel, ChannelType.EMAIL)
         self.assertTrue(creds.is_active)
 
@@ -122,7 +167,7 @@ class NotificationAPITest(APITestCase):
             credentials={"host": "smtp.test.com"}
         )
 
-        url = reverse('credentials-list-create')
+        url = CREDENTIALS_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -130,7 +175,7 @@ class NotificationAPITest(APITestCase):
 
     def test_create_notification_template(self):
         """Test creating notification templates"""
-        url = reverse('template-list-create')
+        url = TEMPLATE_URL
         data = {
             "name": "Welcome Email",
             "channel": "email",
@@ -144,15 +189,13 @@ class NotificationAPITest(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(NotificationTemplate.objects.count(), 1)
-
-        template = NotificationTemplate.objects.first()
+        template = _assert_single(NotificationTemplate.objects.all())
         self.assertEqual(template.name, "Welcome Email")
         self.assertEqual(template.version, 1)
 
     def test_create_campaign(self):
         """Test creating notification campaigns"""
-        url = reverse('campaign-list-create')
+        url = CAMPAIGN_URL
         data = {
             "name": "Test Campaign",
             "channel": "push",
@@ -166,12 +209,15 @@ class NotificationAPITest(APITestCase):
             ]
         }
 
-        response = self.client.post(url, data, format='json')
+        # The bulk send is covered elsewhere; pin only the request's own queries
+        with patch('notifications.tasks.tasks.send_bulk_campaign_task.delay'):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Campaign.objects.count(), 1)
-
-        campaign = Campaign.objects.first()
+        # Recipients live on the campaign row: one INSERT regardless of list size
+        self.assertLessEqual(len(ctx.captured_queries), 1)
+        campaign = _assert_single(Campaign.objects.all())
         self.assertEqual(campaign.name, "Test Campaign")
         self.assertEqual(campaign.total_recipients, 2)
         self.assertEqual(campaign.status, "draft")
@@ -187,7 +233,7 @@ class NotificationAPITest(APITestCase):
             created_at="2024-01-01T12:00:00Z"
         )
 
-        url = reverse('analytics') + '?days=30'
+        url = f"{ANALYTICS_URL}?days=30"
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -195,9 +241,13 @@ class NotificationAPITest(APITestCase):
         self.assertIn('success_rate', response.data)
         self.assertIn('channel_usage', response.data)
 
+
+class HealthCheckAPITest(TenantContextTestMixin, APISimpleTestCase):
+    """Test health check endpoint (no database access)"""
+
     def test_health_check(self):
         """Test health check endpoint"""
-        url = reverse('health')
+        url = HEALTH_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -205,19 +255,12 @@ class NotificationAPITest(APITestCase):
         self.assertEqual(response.data['service'], 'notification_service')
 
 
-class DeviceTokenAPITest(APITestCase):
+class DeviceTokenAPITest(TenantContextTestMixin, APITestCase):
     """Test device token API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
-        self.client.tenant_id = self.tenant_id
-        self.client.user_id = self.user_id
-
     def test_register_device_token(self):
         """Test registering a device token"""
-        url = reverse('device-token-list-create')
+        url = DEVICE_TOKEN_URL
         data = {
             "device_type": "android",
             "device_token": "fcm_test_token_123",
@@ -228,9 +271,7 @@ class DeviceTokenAPITest(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(DeviceToken.objects.count(), 1)
-
-        token = DeviceToken.objects.first()
+        token = _assert_single(DeviceToken.objects.all())
         self.assertEqual(token.device_type, DeviceType.ANDROID)
         self.assertEqual(token.device_token, "fcm_test_token_123")
 
@@ -244,7 +285,7 @@ class DeviceTokenAPITest(APITestCase):
             device_id="ios_device_123"
         )
 
-        url = reverse('device-token-list-create')
+        url = DEVICE_TOKEN_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -262,7 +303,7 @@ class DeviceTokenAPITest(APITestCase):
         )
 
         # Try to create another token for same device - should deactivate first
-        url = reverse('device-token-list-create')
+        url = DEVICE_TOKEN_URL
         data = {
             "device_type": "android",
             "device_token": "token2",
@@ -277,20 +318,15 @@ class DeviceTokenAPITest(APITestCase):
         self.assertEqual(DeviceToken.objects.filter(is_active=True).count(), 1)
 
 
-class PushAPITest(APITestCase):
+class PushAPITest(TenantContextTestMixin, APITestCase):
     """Test push notification API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.client.tenant_id = self.tenant_id
-
     @patch('notifications.channels.push_handler.PushHandler.send')
     def test_push_test_endpoint(self, mock_send):
         """Test push notification test endpoint"""
         mock_send.return_value = {'success': True, 'response': {'message_id': 'msg_123'}}
 
-        url = reverse('push-test')
+        url = PUSH_TEST_URL
         data = {
             "device_token": "test_fcm_token",
             "title": "Test Notification",
@@ -304,14 +340,9 @@ class PushAPITest(APITestCase):
         mock_send.assert_called_once()
 
 
-class SMSAPITest(APITestCase):
+class SMSAPITest(TenantContextTestMixin, APITestCase):
     """Test SMS API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.client.tenant_id = self.tenant_id
-
     @patch('notifications.channels.sms_handler.SMSHandler.send')
     def test_sms_test_endpoint(self, mock_send):
         """Test SMS test endpoint"""
@@ -320,7 +351,7 @@ class SMSAPITest(APITestCase):
             'response': {'sid': 'SM1234567890', 'status': 'queued'}
         }
 
-        url = reverse('sms-test')
+        url = SMS_TEST_URL
         data = {
             "phone_number": "+1234567890",
             "message": "Test SMS message"
@@ -340,7 +371,7 @@ class SMSAPITest(APITestCase):
             'response': {'status': 'delivered', 'sid': 'SM123'}
         }
 
-        url = reverse('sms-status', kwargs={'sid': 'SM1234567890'})
+        url = sms_status_url('SM1234567890')
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -358,7 +389,7 @@ class SMSAPITest(APITestCase):
             }
         }
 
-        url = reverse('sms-cost-estimate')
+        url = SMS_COST_ESTIMATE_URL
         data = {
             "phone_numbers": ["+1234567890", "+0987654321"],
             "message": "Test message"
@@ -370,87 +401,86 @@ class SMSAPITest(APITestCase):
         self.assertEqual(response.data['estimation']['estimated_cost_usd'], 0.015)
 
 
-class ChatAPITest(APITestCase):
+class ChatAPITest(TenantContextTestMixin, APITestCase):
     """Test chat API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
-        self.client.tenant_id = self.tenant_id
-        self.client.user_id = self.user_id
+    @classmethod
+    def setUpTestData(cls):
+        # Shared read-only scaffold; rolled back once per class
+        cls.conversation = ChatConversation.objects.create(
+            tenant_id=cls.tenant_id,
+            conversation_type="direct",
+            created_by=cls.user_id
+        )
+        ChatParticipant.objects.create(
+            tenant_id=cls.tenant_id,
+            conversation=cls.conversation,
+            user_id=cls.user_id,
+            role="member"
+        )
 
     def test_create_chat_conversation(self):
         """Test creating a chat conversation"""
-        url = reverse('chat-conversations')
+        url = CHAT_CONVERSATIONS_URL
         data = {
             "title": "Project Discussion",
             "conversation_type": "group"
         }
 
-        response = self.client.post(url, data, format='json')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(ChatConversation.objects.count(), 1)
-
-        conversation = ChatConversation.objects.first()
+        # conversation + creator participant INSERTs, then participant_count/last_message
+        self.assertLessEqual(len(ctx.captured_queries), 4)
+        conversation = _assert_single(
+            ChatConversation.objects.exclude(id=self.conversation.id)
+        )
         self.assertEqual(conversation.title, "Project Discussion")
         self.assertEqual(conversation.conversation_type, "group")
         self.assertEqual(conversation.created_by, self.user_id)
 
         # Should auto-create participant for creator
-        self.assertEqual(ChatParticipant.objects.count(), 1)
-        participant = ChatParticipant.objects.first()
+        participant = _assert_single(ChatParticipant.objects.filter(conversation=conversation))
         self.assertEqual(participant.user_id, self.user_id)
         self.assertEqual(participant.role, "admin")
 
     def test_list_chat_conversations(self):
         """Test listing user's chat conversations"""
-        # Create conversations
-        conv1 = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            title="Team Chat",
-            conversation_type="group",
-            created_by=self.user_id
-        )
-        conv2 = ChatConversation.objects.create(
+        # The shared conversation includes the user; this one does not
+        ChatConversation.objects.create(
             tenant_id=self.tenant_id,
             title="Direct Chat",
             conversation_type="direct",
             created_by="other_user"
         )
 
-        # Add user as participant to conv1
-        ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conv1,
-            user_id=self.user_id,
-            role="member"
-        )
-
-        url = reverse('chat-conversations')
-        response = self.client.get(url)
+        url = CHAT_CONVERSATIONS_URL
+        # count + conversations (with participant_count) + latest message prefetch
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)  # Only conv1
-        self.assertEqual(response.data['results'][0]['title'], "Team Chat")
+        self.assertEqual(len(response.data['results']), 1)  # Only the shared conversation
+        self.assertEqual(response.data['results'][0]['id'], str(self.conversation.id))
 
     def test_send_chat_message(self):
         """Test sending a chat message"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id,
-            role="member"
-        )
-
-        url = reverse('chat-messages', kwargs={'conversation_id': conversation.id})
+        with transaction.atomic():
+            conversation = ChatConversation.objects.create(
+                tenant_id=self.tenant_id,
+                conversation_type="direct",
+                created_by=self.user_id
+            )
+
+            ChatParticipant.objects.create(
+                tenant_id=self.tenant_id,
+                conversation=conversation,
+                user_id=self.user_id,
+                role="member"
+            )
+
+        url = chat_messages_url(conversation.id)
         data = {
             "message_type": "text",
             "content": "Hello world!"
@@ -459,64 +489,38 @@ class ChatAPITest(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(ChatMessage.objects.count(), 1)
-
-        message = ChatMessage.objects.first()
+        message = _assert_single(ChatMessage.objects.all())
         self.assertEqual(message.content, "Hello world!")
         self.assertEqual(message.message_type, MessageType.TEXT)
         self.assertEqual(message.sender_id, self.user_id)
 
     def test_list_chat_messages(self):
         """Test listing chat messages"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id,
-            role="member"
-        )
-
-        # Create messages
-        ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Message 1"
-        )
-        ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Message 2"
-        )
-
-        url = reverse('chat-messages', kwargs={'conversation_id': conversation.id})
-        response = self.client.get(url)
+        conversation = self.conversation
+
+        # Create messages in a single INSERT
+        ChatMessage.objects.bulk_create([
+            ChatMessage(
+                tenant_id=self.tenant_id,
+                conversation=conversation,
+                sender_id=self.user_id,
+                message_type=MessageType.TEXT,
+                content=content
+            )
+            for content in ("Message 1", "Message 2")
+        ])
+
+        url = chat_messages_url(conversation.id)
+        # membership check + count + messages (with reply_count) + reactions prefetch
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)
 
     def test_add_message_reaction(self):
         """Test adding emoji reactions to messages"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id,
-            role="member"
-        )
+        conversation = self.conversation
 
         message = ChatMessage.objects.create(
             tenant_id=self.tenant_id,
@@ -526,16 +530,14 @@ class ChatAPITest(APITestCase):
             content="Test message"
         )
 
-        url = reverse('message-reactions', kwargs={'message_id': message.id})
+        url = message_reactions_url(message.id)
         data = {"emoji": "👍"}
 
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         from notifications.models import MessageReaction
-        self.assertEqual(MessageReaction.objects.count(), 1)
-
-        reaction = MessageReaction.objects.first()
+        reaction = _assert_single(MessageReaction.objects.all())
         self.assertEqual(reaction.emoji, "👍")
         self.assertEqual(reaction.user_id, self.user_id)
 
@@ -543,7 +545,7 @@ class ChatAPITest(APITestCase):
         """Test file upload for chat messages"""
         from django.core.files.uploadedfile import SimpleUploadedFile
 
-        url = reverse('file-upload')
+        url = FILE_UPLOAD_URL
 
         # Create a test file
         test_file = SimpleUploadedFile(
@@ -563,7 +565,7 @@ class ChatAPITest(APITestCase):
 
     def test_user_presence(self):
         """Test user presence management"""
-        url = reverse('user-presence-detail')
+        url = USER_PRESENCE_URL
 
         # Update presence
         data = {"status": "busy"}
@@ -580,15 +582,14 @@ class ChatAPITest(APITestCase):
         self.assertEqual(presence.status, "busy")
 
 
-class APIAuthenticationTest(APITestCase):
+class APIAuthenticationTest(TenantContextTestMixin, APITestCase):
     """Test API authentication and authorization"""
 
-    def setUp(self):
-        self.client = APIClient()
+    with_client_context = False
 
     def test_unauthenticated_request(self):
         """Test that unauthenticated requests are rejected"""
-        url = reverse('notification-list-create')
+        url = NOTIFICATION_URL
         response = self.client.get(url)
 
         # Should fail due to missing tenant/user context
@@ -597,7 +598,7 @@ class APIAuthenticationTest(APITestCase):
 
     def test_tenant_isolation(self):
         """Test that tenants are properly isolated"""
-        tenant1 = "550e8400-e29b-41d4-a716-446655440000"
+        tenant1 = TENANT_ID
         tenant2 = "550e8400-e29b-41d4-a716-446655440001"
 
         # Create record for tenant1
@@ -612,7 +613,7 @@ class APIAuthenticationTest(APITestCase):
         self.client.tenant_id = tenant2
         self.client.user_id = "user123"
 
-        url = reverse('notification-list-create')
+        url = NOTIFICATION_URL
         response = self.client.get(url)
 
         # Should not see tenant1's records
@@ -620,64 +621,68 @@ class APIAuthenticationTest(APITestCase):
         self.assertEqual(len(response.data['results']), 0)
 
 
-class APIErrorHandlingTest(APITestCase):
-    """Test API error handling"""
+class APIErrorHandlingTest(TenantContextTestMixin, APISimpleTestCase):
+    """Test API error handling (validation paths never reach the database)"""
 
     def setUp(self):
-        self.client = APIClient()
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
-        self.client.tenant_id = self.tenant_id
-        self.client.user_id = self.user_id
+        super().setUp()
+        self.factory = APIRequestFactory()
+
+    def post_notification(self, data, **kwargs):
+        """Call the notification create view directly, skipping URL resolution and middleware"""
+        from notifications.views import NotificationListCreateView
+
+        request = self.factory.post('/records/', data, **kwargs)
+        request.tenant_id = self.tenant_id
+        request.user_id = self.user_id
+        return NotificationListCreateView.as_view()(request)
 
     def test_invalid_channel_type(self):
         """Test invalid channel type handling"""
-        url = reverse('notification-list-create')
         data = {
             "channel": "invalid_channel",
             "recipient": "test@example.com",
             "content": {"subject": "Test"}
         }
 
-        response = self.client.post(url, data, format='json')
+        response = self.post_notification(data, format='json')
 
         # Should fail validation
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_missing_required_fields(self):
         """Test missing required fields"""
-        url = reverse('notification-list-create')
         data = {
             "channel": "email",
             # Missing recipient and content
         }
 
-        response = self.client.post(url, data, format='json')
+        response = self.post_notification(data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_invalid_json(self):
         """Test invalid JSON handling"""
-        url = reverse('notification-list-create')
-
-        response = self.client.post(url, "invalid json", content_type='application/json')
+        response = self.post_notification("invalid json", content_type='application/json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_file_upload_validation(self):
         """Test file upload validation"""
-        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+        from notifications.views import FileUploadView
 
-        url = reverse('file-upload')
+        url = FILE_UPLOAD_URL
 
-        # Test oversized file
-        large_file = SimpleUploadedFile(
-            "large.txt",
-            b"x" * (11 * 1024 * 1024),  # 11MB
-            content_type="text/plain"
+        # Test oversized file: the size check runs before any read, so an
+        # empty upload reporting 11MB is enough and skips the multipart round-trip
+        large_file = UploadedFile(
+            name="large.txt",
+            content_type="text/plain",
+            size=11 * 1024 * 1024
         )
 
-        response = self.client.post(url, {'file': large_file}, format='multipart')
+        response = FileUploadView().post(SimpleNamespace(FILES={'file': large_file}))
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('File too large', response.data['error'])
@@ -1,17 +1,54 @@
+import asyncio
+import smtplib
 import pytest
-from django.test import TestCase
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import patch, MagicMock, AsyncMock
-from asgiref.sync import async_to_sync
 from notifications.channels.email_handler import EmailHandler
 from notifications.channels.sms_handler import SMSHandler
 from notifications.channels.push_handler import PushHandler
 from notifications.channels.inapp_handler import InAppHandler
-from notifications.models import ChannelType
+from notifications.models import ChannelType, CHANNEL_VALUES
+from notifications.orchestrator.dispatcher import Dispatcher
+from tests.stubs import (
+    StubCall, StubEmailMessage, StubSMTPConnection, StubTwilioClient, twilio_message
+)
 
+TEST_BRANDING = {
+    'name': 'Test Company',
+    'logo_url': None,
+    'primary_color': '#FF0000',
+    'secondary_color': '#FADBD8',
+    'email_from': 'noreply@test.com'
+}
 
-class EmailChannelTest(TestCase):
+FIREBASE_APP = object()
+
+
+class EmailChannelTest(IsolatedAsyncioTestCase):
     """Test Email notification channel"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Patched once for the whole class; setUp only resets the stubs' state
+        cls.get_connection = StubCall()
+        cls.email_class = StubCall()
+        cls._patches = [
+            patch('notifications.channels.email_handler.get_connection', new=cls.get_connection),
+            patch('notifications.channels.email_handler.EmailMultiAlternatives', new=cls.email_class),
+            patch('notifications.channels.email_handler.auth_service_client.get_tenant_branding',
+                  new=StubCall(return_value=TEST_BRANDING)),
+        ]
+        for p in cls._patches:
+            p.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for p in reversed(cls._patches):
+            p.stop()
+        super().tearDownClass()
+
     def setUp(self):
         self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
         self.credentials = {
@@ -22,27 +59,15 @@ class EmailChannelTest(TestCase):
             "from_email": "noreply@example.com",
             "use_tls": True
         }
+        self.connection = StubSMTPConnection()
+        self.email = StubEmailMessage(sent=1)
+        self.get_connection.reset(return_value=self.connection)
+        self.email_class.reset(return_value=self.email)
 
-    @patch('notifications.channels.email_handler.auth_service_client.get_tenant_branding')
-    @patch('notifications.channels.email_handler.EmailMultiAlternatives')
-    def test_email_send_success(self, mock_email_class, mock_get_branding):
+    async def test_email_send_success(self):
         """Test successful email sending"""
-        # Mock tenant branding
-        mock_get_branding.return_value = {
-            'name': 'Test Company',
-            'logo_url': None,
-            'primary_color': '#FF0000',
-            'secondary_color': '#FADBD8',
-            'email_from': 'noreply@test.com'
-        }
-
-        # Mock email send
-        mock_email_instance = MagicMock()
-        mock_email_instance.send.return_value = 1
-        mock_email_class.return_value = mock_email_instance
-
         handler = EmailHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
+        result = await handler.send(
             recipient="user@example.com",
             content={
                 "subject": "Welcome {{name}}!",
@@ -53,28 +78,16 @@ class EmailChannelTest(TestCase):
 
         self.assertTrue(result['success'])
         self.assertIn('Sent to 1 recipients', result['response'])
-        mock_email_instance.send.assert_called_once()
+        self.assertEqual(self.email.send.call_count, 1)
+        # A send outside `with handler:` does not leave the session open
+        self.assertEqual(self.connection.close.call_count, 1)
 
-    @patch('notifications.channels.email_handler.auth_service_client.get_tenant_branding')
-    @patch('notifications.channels.email_handler.EmailMultiAlternatives')
-    def test_email_send_failure(self, mock_email_class, mock_get_branding):
+    async def test_email_send_failure(self):
         """Test email sending failure"""
-        # Mock tenant branding
-        mock_get_branding.return_value = {
-            'name': 'Test Company',
-            'logo_url': None,
-            'primary_color': '#FF0000',
-            'secondary_color': '#FADBD8',
-            'email_from': 'noreply@test.com'
-        }
-
-        # Mock email send failure
-        mock_email_instance = MagicMock()
-        mock_email_instance.send.side_effect = Exception("SMTP Error")
-        mock_email_class.return_value = mock_email_instance
+        self.email.send.reset(side_effect=Exception("SMTP Error"))
 
         handler = EmailHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
+        result = await handler.send(
             recipient="user@example.com",
             content={"subject": "Test", "body": "Test body"},
             context={}
@@ -83,26 +96,10 @@ class EmailChannelTest(TestCase):
         self.assertFalse(result['success'])
         self.assertIn("SMTP Error", result['error'])
 
-    @patch('notifications.channels.email_handler.auth_service_client.get_tenant_branding')
-    @patch('notifications.channels.email_handler.EmailMultiAlternatives')
-    def test_email_content_rendering(self, mock_email_class, mock_get_branding):
+    async def test_email_content_rendering(self):
         """Test email template rendering"""
-        # Mock tenant branding
-        mock_get_branding.return_value = {
-            'name': 'Test Company',
-            'logo_url': None,
-            'primary_color': '#FF0000',
-            'secondary_color': '#FADBD8',
-            'email_from': 'noreply@test.com'
-        }
-
-        # Mock email send
-        mock_email_instance = MagicMock()
-        mock_email_instance.send.return_value = 1
-        mock_email_class.return_value = mock_email_instance
-
         handler = EmailHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
+        result = await handler.send(
             recipient="user@example.com",
             content={
                 "subject": "Hello {{name}}",
@@ -113,12 +110,140 @@ class EmailChannelTest(TestCase):
 
         # Check that email was created and sent successfully
         self.assertTrue(result['success'])
-        # Verify EmailMultiAlternatives was called
-        mock_email_class.assert_called_once()
-        mock_email_instance.send.assert_called_once()
+        self.assertEqual(self.email_class.call_count, 1)
+        self.assertEqual(self.email_class.calls[0][1]['subject'], "Hello Alice")
+        self.assertEqual(self.email.send.call_count, 1)
+
+    @patch('notifications.channels.email_handler.EmailHandler._render_html_template', return_value="<p>Hi</p>")
+    async def test_email_connection_reused(self, mock_render_html):
+        """Test consecutive sends in a `with handler:` block share one SMTP connection"""
+        with EmailHandler(self.tenant_id, self.credentials) as handler:
+            for recipient in ["a@example.com", "b@example.com"]:
+                result = await handler.send(
+                    recipient=recipient,
+                    content={"subject": "Hi", "body": "Hello"},
+                    context={}
+                )
+                self.assertTrue(result['success'])
+            self.assertEqual(self.connection.close.call_count, 0)
+
+        self.assertEqual(self.get_connection.call_count, 1)
+        self.assertEqual(self.connection.open.call_count, 1)
+        self.assertEqual(self.email.send.call_count, 2)
+        self.assertEqual(self.connection.close.call_count, 1)
+
+    @patch('notifications.channels.email_handler.EmailHandler._render_html_template', return_value="<p>Hi</p>")
+    async def test_email_stale_connection_reconnects(self, mock_render_html):
+        """Test a reused session dropped by the server is reopened once"""
+        disconnects = [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]
+
+        def send(fail_silently=False):
+            if disconnects:
+                raise disconnects.pop()
+            return 1
+        self.email.send = send
+
+        with EmailHandler(self.tenant_id, self.credentials) as handler:
+            result = await handler.send(
+                recipient="user@example.com",
+                content={"subject": "Hi", "body": "Hello"},
+                context={}
+            )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(self.get_connection.call_count, 2)
+        self.assertEqual(self.connection.close.call_count, 2)
+
+    @patch('notifications.channels.email_handler.EmailHandler._render_html_template', return_value="<p>Hi</p>")
+    async def test_email_send_bulk_stale_connection_reconnects(self, mock_render_html):
+        """Test bulk sends in a `with handler:` block reopen a dropped session once"""
+        disconnects = [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]
+
+        def send_messages(messages):
+            if disconnects:
+                raise disconnects.pop()
+            return len(messages)
+        self.connection.send_messages = send_messages
+
+        with EmailHandler(self.tenant_id, self.credentials) as handler:
+            result = await handler.send_bulk(
+                recipients=["a@example.com", "b@example.com"],
+                content={"subject": "Hi", "body": "Hello"},
+                context={}
+            )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['success_count'], 2)
+        self.assertEqual(self.get_connection.call_count, 2)
+
+    @patch('notifications.channels.email_handler.EmailHandler._render_html_template', return_value="<p>Hi</p>")
+    async def test_email_send_bulk_single_session(self, mock_render_html):
+        """Test bulk email is built once, goes out in one send_messages call and closes the session"""
+        self.connection.send_messages.reset(return_value=2)
+
+        handler = EmailHandler(self.tenant_id, self.credentials)
+        result = await handler.send_bulk(
+            recipients=["a@example.com", "b@example.com"],
+            content={"subject": "Hi {{name}}", "body": "Hello"},
+            context={"name": "Team"}
+        )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['success_count'], 2)
+        self.assertEqual(self.email_class.call_count, 1)
+        self.assertEqual(self.email_class.calls[0][1]['subject'], "Hi Team")
+        self.assertEqual(self.email.attach_alternative.calls[0][0], ("<p>Hi</p>", "text/html"))
+        self.assertEqual(self.connection.send_messages.call_count, 1)
+        messages = self.connection.send_messages.calls[0][0][0]
+        self.assertEqual([m.to for m in messages], [["a@example.com"], ["b@example.com"]])
+        mock_render_html.assert_called_once()
+        self.assertEqual(self.connection.close.call_count, 1)
+
+    @patch('notifications.services.auth_service.AuthServiceClient.get_tenant_details')
+    def test_email_tenant_branding_cached(self, mock_get_details):
+        """Test tenant branding is fetched once and reused across clients"""
+        from django.core.cache import cache
+        from notifications.services.auth_service import AuthServiceClient
+
+        cache.delete(f'tenant_branding:{self.tenant_id}')
+        self.addCleanup(cache.delete, f'tenant_branding:{self.tenant_id}')
+        mock_get_details.return_value = {'name': 'Test Company'}
+
+        for _ in range(2):
+            branding = AuthServiceClient().get_tenant_branding(self.tenant_id)
+            self.assertEqual(branding['name'], 'Test Company')
+
+        mock_get_details.assert_called_once()
+
+    def test_email_plain_content_skips_template_engine(self):
+        """Test content without placeholders is returned without compiling a template"""
+        from notifications.channels.rendering import compile_template
+
+        handler = EmailHandler(self.tenant_id, self.credentials)
+        misses = compile_template.cache_info().misses
+        hits = compile_template.cache_info().hits
+
+        rendered = handler._render_content({"subject": "Plain subject 42", "body": "No variables here"}, {"name": "Alice"})
 
+        self.assertEqual(rendered, {"subject": "Plain subject 42", "body": "No variables here"})
+        self.assertEqual((compile_template.cache_info().misses, compile_template.cache_info().hits), (misses, hits))
 
-class SMSChannelTest(TestCase):
+    def test_email_template_compiled_once(self):
+        """Test repeated renders of the same template reuse the compiled template"""
+        from notifications.channels.rendering import compile_template
+
+        handler = EmailHandler(self.tenant_id, self.credentials)
+        content = {"subject": "Welcome {{name}}!"}
+
+        handler._render_content(content, {"name": "Alice"})
+        hits = compile_template.cache_info().hits
+        rendered = handler._render_content(content, {"name": "Bob"})
+
+        self.assertEqual(rendered['subject'], "Welcome Bob!")
+        self.assertEqual(compile_template.cache_info().hits, hits + 1)
+
+
+class SMSChannelTest(IsolatedAsyncioTestCase):
     """Test SMS notification channel"""
 
     def setUp(self):
@@ -137,81 +262,152 @@ class SMSChannelTest(TestCase):
         # (Twilio handles validation)
         self.assertIsInstance(handler, SMSHandler)
 
-    @patch('notifications.channels.sms_handler.decrypt_data')
-    @patch('notifications.channels.sms_handler.Client')
-    def test_sms_send_success(self, mock_client_class, mock_decrypt):
+    @patch('notifications.channels.sms_handler.decrypt_data', return_value="decrypted_auth_token")
+    async def test_sms_send_success(self, mock_decrypt):
         """Test successful SMS sending"""
-        # Mock decryption
-        mock_decrypt.return_value = "decrypted_auth_token"
-
-        # Mock Twilio client
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.sid = "SM1234567890"
-        mock_message.status = "queued"
-        mock_client.messages.create.return_value = mock_message
-        mock_client_class.return_value = mock_client
+        client = StubTwilioClient(twilio_message(sid="SM1234567890", status="queued"))
 
         handler = SMSHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
-            recipient="+1234567890",
-            content={"body": "Your code is: {{code}}"},
-            context={"code": "123456"}
-        )
+        with patch('notifications.channels.sms_handler.Client', new=StubCall(return_value=client)):
+            result = await handler.send(
+                recipient="+1234567890",
+                content={"body": "Your code is: {{code}}"},
+                context={"code": "123456"}
+            )
 
         self.assertTrue(result['success'])
         self.assertEqual(result['response']['sid'], "SM1234567890")
         self.assertEqual(result['response']['status'], "queued")
+        self.assertEqual(client.messages.create.calls[0][1]['body'], "Your code is: 123456")
+
+    @patch('notifications.channels.sms_handler.decrypt_data', return_value="decrypted_auth_token")
+    async def test_sms_client_shared_across_handlers(self, mock_decrypt):
+        """Test the Twilio client is built once per tenant credentials"""
+        client_class = StubCall(return_value=StubTwilioClient())
+
+        with patch('notifications.channels.sms_handler.Client', new=client_class):
+            for _ in range(2):
+                handler = SMSHandler(self.tenant_id, self.credentials)
+                result = await handler.send(
+                    recipient="+1234567890",
+                    content={"body": "Hello"},
+                    context={}
+                )
+                self.assertTrue(result['success'])
 
-    @patch('notifications.channels.sms_handler.decrypt_data')
-    @patch('notifications.channels.sms_handler.Client')
-    def test_sms_send_failure(self, mock_client_class, mock_decrypt):
+        self.assertEqual(client_class.call_count, 1)
+        self.assertEqual(mock_decrypt.call_count, 1)
+
+    @patch('notifications.channels.sms_handler.decrypt_data', return_value="decrypted_auth_token")
+    async def test_sms_send_failure(self, mock_decrypt):
         """Test SMS sending failure"""
         from notifications.channels.sms_handler import TwilioException
 
-        # Mock decryption
-        mock_decrypt.return_value = "decrypted_auth_token"
-
-        mock_client = MagicMock()
-        mock_client.messages.create.side_effect = TwilioException("Invalid number")
-        mock_client_class.return_value = mock_client
+        client = StubTwilioClient(error=TwilioException("Invalid number"))
 
         handler = SMSHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
-            recipient="invalid_number",
-            content={"body": "Test SMS"},
-            context={}
-        )
+        with patch('notifications.channels.sms_handler.Client', new=StubCall(return_value=client)):
+            result = await handler.send(
+                recipient="+15005550001",
+                content={"body": "Test SMS"},
+                context={}
+            )
 
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], 'provider_error')
 
+    async def test_sms_send_rejects_non_e164_number(self):
+        """Test malformed numbers are rejected before any Twilio call"""
+        client_class = StubCall(return_value=StubTwilioClient())
+
+        handler = SMSHandler(self.tenant_id, self.credentials)
+        with patch('notifications.channels.sms_handler.Client', new=client_class):
+            for recipient in ["invalid_number", "1234567890", "+0123456789", "+1234567890123456"]:
+                result = await handler.send(recipient=recipient, content={"body": "Test SMS"}, context={})
+                self.assertEqual(result['error'], 'invalid_number', recipient)
+
+        self.assertEqual(client_class.call_count, 0)
+
+    @patch('notifications.channels.sms_handler.decrypt_data', return_value="decrypted_auth_token")
+    async def test_sms_bulk_send(self, mock_decrypt):
+        """Test bulk SMS sending"""
+        client = StubTwilioClient()
+
+        handler = SMSHandler(self.tenant_id, self.credentials)
+        with patch('notifications.channels.sms_handler.Client', new=StubCall(return_value=client)):
+            result = await handler.send_bulk(
+                recipients=["+1234567890", "+447700900123"],
+                content={"body": "Hello {{name}}!"},
+                context={"name": "User"}
+            )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['total_recipients'], 2)
+        self.assertEqual(result['success_count'], 2)
+        self.assertEqual(result['failure_count'], 0)
+        self.assertEqual(len(result['results']), 2)
+        self.assertEqual(client.messages.create.call_count, 2)
+
+    @patch('notifications.channels.sms_handler.BULK_SEND_CONCURRENCY', 1)
+    @patch('notifications.channels.sms_handler.decrypt_data', return_value="decrypted_auth_token")
+    async def test_sms_iter_send_bulk_streams_results(self, mock_decrypt):
+        """Test streamed bulk SMS yields each result before later sends start"""
+        client = StubTwilioClient()
+        recipients = ["+1234567890", "invalid_number", "+447700900123"]
+
+        handler = SMSHandler(self.tenant_id, self.credentials)
+        results = []
+        with patch('notifications.channels.sms_handler.Client', new=StubCall(return_value=client)):
+            async for result in handler.iter_send_bulk(iter(recipients), {"body": "Hello"}, {}):
+                results.append((result, client.messages.create.call_count))
+
+        self.assertEqual([r['recipient'] for r, _ in results], recipients)
+        self.assertEqual([r['success'] for r, _ in results], [True, False, True])
+        self.assertEqual(results[1][0]['error'], 'invalid_number')
+        # With one send in flight, each result is yielded before the next Twilio call
+        self.assertEqual([calls for _, calls in results], [1, 1, 2])
+
     @patch('notifications.channels.sms_handler.decrypt_data')
     @patch('notifications.channels.sms_handler.Client')
-    def test_sms_bulk_send(self, mock_client_class, mock_decrypt):
-        """Test bulk SMS sending"""
-        # Mock decryption
+    async def test_sms_bulk_send_notify_service(self, mock_client_class, mock_decrypt):
+        """Test bulk SMS goes out as a single Notify request when configured"""
         mock_decrypt.return_value = "decrypted_auth_token"
 
         mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.sid = "SM1234567890"
-        mock_message.status = "queued"
-        mock_client.messages.create.return_value = mock_message
+        mock_notifications = mock_client.notify.v1.services.return_value.notifications
+        mock_notifications.create.return_value.sid = "NT1234567890"
         mock_client_class.return_value = mock_client
 
-        handler = SMSHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send_bulk)(
-            recipients=["+1234567890", "+0987654321"],
+        handler = SMSHandler(self.tenant_id, {**self.credentials, "notify_service_sid": "IS123"})
+        result = await handler.send_bulk(
+            recipients=["+1234567890", "invalid_number", "+447700900123"],
             content={"body": "Hello {{name}}!"},
             context={"name": "User"}
         )
 
         self.assertTrue(result['success'])
-        self.assertEqual(result['total_recipients'], 2)
         self.assertEqual(result['success_count'], 2)
-        self.assertEqual(result['failure_count'], 0)
-        self.assertEqual(len(result['results']), 2)
+        self.assertEqual(result['failure_count'], 1)
+        by_recipient = {entry['recipient']: entry for entry in result['results']}
+        self.assertEqual(by_recipient["invalid_number"]['error'], 'invalid_number')
+        # Accepted by Notify, not yet delivered
+        self.assertEqual(by_recipient["+1234567890"]['status'], 'queued')
+        mock_client.notify.v1.services.assert_called_once_with("IS123")
+        mock_notifications.create.assert_called_once()
+        self.assertEqual(len(mock_notifications.create.call_args.kwargs['to_binding']), 2)
+        self.assertEqual(mock_notifications.create.call_args.kwargs['body'], "Hello User!")
+        mock_client.messages.create.assert_not_called()
+
+    @patch('notifications.channels.sms_handler.decrypt_data')
+    def test_sms_credentials_decrypted_once(self, mock_decrypt):
+        """Test handlers for the same tenant share the decrypted auth token"""
+        mock_decrypt.return_value = "decrypted_auth_token"
+
+        for _ in range(2):
+            creds = SMSHandler(self.tenant_id, self.credentials)._get_decrypted_credentials()
+            self.assertEqual(creds['auth_token'], "decrypted_auth_token")
+
+        mock_decrypt.assert_called_once_with("encrypted_token")
 
     def test_sms_content_rendering(self):
         """Test SMS content rendering with context"""
@@ -224,6 +420,17 @@ class SMSChannelTest(TestCase):
 
         self.assertEqual(rendered['body'], "Hi Alice, your code is 123456")
 
+    def test_sms_content_rendering_spaced_placeholders(self):
+        """Test placeholders written with inner whitespace are substituted"""
+        handler = SMSHandler(self.tenant_id, self.credentials)
+
+        rendered = handler._render_content(
+            {"body": "Hi {{ name }}, your code is {{code }}"},
+            {"name": "Alice", "code": "123456"}
+        )
+
+        self.assertEqual(rendered['body'], "Hi Alice, your code is 123456")
+
     def test_sms_cost_estimation(self):
         """Test SMS cost estimation"""
         handler = SMSHandler(self.tenant_id, self.credentials)
@@ -238,29 +445,21 @@ class SMSChannelTest(TestCase):
         self.assertEqual(result['message_length'], 22)  # "This is a test message" = 22 chars
         self.assertIsInstance(result['estimated_cost'], float)
 
-    @patch('notifications.channels.sms_handler.decrypt_data')
-    @patch('notifications.channels.sms_handler.Client')
-    def test_sms_status_check(self, mock_client_class, mock_decrypt):
+    @patch('notifications.channels.sms_handler.decrypt_data', return_value="decrypted_auth_token")
+    async def test_sms_status_check(self, mock_decrypt):
         """Test SMS status checking"""
-        # Mock decryption
-        mock_decrypt.return_value = "decrypted_auth_token"
-
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.sid = "SM1234567890"
-        mock_message.status = "delivered"
-        mock_client.messages.return_value.fetch.return_value = mock_message
-        mock_client_class.return_value = mock_client
+        client = StubTwilioClient(twilio_message(sid="SM1234567890", status="delivered"))
 
         handler = SMSHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.check_status)("SM1234567890")
+        with patch('notifications.channels.sms_handler.Client', new=StubCall(return_value=client)):
+            result = await handler.check_status("SM1234567890")
 
         self.assertTrue(result['success'])
         self.assertEqual(result['response']['status'], "delivered")
         self.assertEqual(result['response']['sid'], "SM1234567890")
 
 
-class PushChannelTest(TestCase):
+class PushChannelTest(IsolatedAsyncioTestCase):
     """Test Push notification channel"""
 
     def setUp(self):
@@ -278,108 +477,154 @@ class PushChannelTest(TestCase):
             "client_x509_cert_url": "https://www.googleapis.com/robot/v1/metadata/x509/firebase@test-project.iam.gserviceaccount.com"
         }
 
-    @patch('notifications.channels.push_handler.initialize_app')
-    @patch('notifications.channels.push_handler.credentials.Certificate')
-    @patch('notifications.channels.push_handler.messaging.send')
-    @patch('notifications.channels.push_handler.decrypt_data')
-    def test_push_send_success(self, mock_decrypt, mock_send, mock_certificate, mock_init_app):
+    @patch('notifications.channels.push_handler.initialize_app', new=StubCall(return_value=FIREBASE_APP))
+    @patch('notifications.channels.push_handler.credentials.Certificate', new=StubCall())
+    @patch('notifications.channels.push_handler.decrypt_data', new=StubCall(return_value="decrypted_private_key"))
+    async def test_push_send_success(self):
         """Test successful push notification sending"""
-        # Mock decryption
-        mock_decrypt.return_value = "decrypted_private_key"
-
-        # Mock Firebase app
-        mock_app = MagicMock()
-        mock_init_app.return_value = mock_app
-
-        # Mock send
-        mock_send.return_value = "msg_1234567890"
-
         handler = PushHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
-            recipient="fcm_token_123",
-            content={
-                "title": "New Message",
-                "body": "You have a new message",
-                "data": {"type": "message", "id": "123"}
-            },
-            context={}
-        )
+        send = StubCall(return_value="msg_1234567890")
+        with patch('notifications.channels.push_handler.messaging.send', new=send):
+            result = await handler.send(
+                recipient="fcm_token_123",
+                content={
+                    "title": "New Message",
+                    "body": "You have a new message",
+                    "data": {"type": "message", "id": "123"}
+                },
+                context={}
+            )
 
         self.assertTrue(result['success'])
         self.assertEqual(result['response']['message_id'], "msg_1234567890")
+        self.assertIs(send.calls[0][1]['app'], FIREBASE_APP)
 
     @patch('notifications.channels.push_handler.initialize_app')
     @patch('notifications.channels.push_handler.credentials.Certificate')
     @patch('notifications.channels.push_handler.messaging.send')
     @patch('notifications.channels.push_handler.decrypt_data')
-    def test_push_send_failure(self, mock_decrypt, mock_send, mock_certificate, mock_init_app):
-        """Test push notification sending failure"""
-        # Mock decryption
+    async def test_push_app_shared_across_handlers(self, mock_decrypt, mock_send, mock_certificate, mock_init_app):
+        """Test the Firebase app is initialized once per tenant project"""
         mock_decrypt.return_value = "decrypted_private_key"
+        mock_send.return_value = "msg_1234567890"
 
-        # Mock Firebase app
-        mock_app = MagicMock()
-        mock_init_app.return_value = mock_app
+        for _ in range(2):
+            handler = PushHandler(self.tenant_id, self.credentials)
+            result = await handler.send(
+                recipient="fcm_token_123",
+                content={"title": "New Message", "body": "Hello"},
+                context={}
+            )
+            self.assertTrue(result['success'])
 
-        # Mock send failure
-        mock_send.side_effect = Exception("Invalid token")
+        mock_init_app.assert_called_once()
+        self.assertEqual(mock_certificate.call_count, 1)
 
+    @patch('notifications.channels.push_handler.initialize_app')
+    @patch('notifications.channels.push_handler.credentials.Certificate', new=StubCall())
+    @patch('notifications.channels.push_handler.decrypt_data', new=StubCall(return_value="decrypted_private_key"))
+    def test_push_rotated_credentials_new_app(self, mock_init_app):
+        """Test rotated credentials initialize a separate Firebase app"""
+        rotated = dict(self.credentials, private_key_id="key456", private_key="rotated_key")
+
+        PushHandler(self.tenant_id, self.credentials)._get_firebase_app()
+        PushHandler(self.tenant_id, rotated)._get_firebase_app()
+
+        self.assertEqual(mock_init_app.call_count, 2)
+        names = [call.kwargs['name'] for call in mock_init_app.call_args_list]
+        self.assertNotEqual(names[0], names[1])
+
+    @patch('notifications.channels.push_handler.initialize_app', new=StubCall(return_value=FIREBASE_APP))
+    @patch('notifications.channels.push_handler.credentials.Certificate', new=StubCall())
+    @patch('notifications.channels.push_handler.decrypt_data', new=StubCall(return_value="decrypted_private_key"))
+    async def test_push_send_failure(self):
+        """Test push notification sending failure"""
         handler = PushHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
-            recipient="invalid_token",
-            content={"title": "Test", "body": "Test message"},
-            context={}
-        )
+        with patch('notifications.channels.push_handler.messaging.send', new=StubCall(side_effect=Exception("Invalid token"))):
+            result = await handler.send(
+                recipient="invalid_token",
+                content={"title": "Test", "body": "Test message"},
+                context={}
+            )
 
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], 'invalid_arguments')
 
-    @patch('notifications.channels.push_handler.initialize_app')
-    @patch('notifications.channels.push_handler.credentials.Certificate')
-    @patch('notifications.channels.push_handler.messaging.send')
-    @patch('notifications.channels.push_handler.decrypt_data')
-    def test_push_content_rendering(self, mock_decrypt, mock_send, mock_certificate, mock_init_app):
+    @patch('notifications.channels.push_handler.initialize_app', new=StubCall(return_value=FIREBASE_APP))
+    @patch('notifications.channels.push_handler.credentials.Certificate', new=StubCall())
+    @patch('notifications.channels.push_handler.decrypt_data', new=StubCall(return_value="decrypted_private_key"))
+    async def test_push_content_rendering(self):
         """Test push content rendering with context"""
-        # Mock decryption
-        mock_decrypt.return_value = "decrypted_private_key"
+        handler = PushHandler(self.tenant_id, self.credentials)
+        with patch('notifications.channels.push_handler.messaging.send', new=StubCall(return_value="msg_123")):
+            result = await handler.send(
+                recipient="fcm_token_123",
+                content={
+                    "title": "Hello {{name}}",
+                    "body": "Welcome to {{company}}",
+                    "data": {"user_id": "{{user_id}}"}
+                },
+                context={"name": "Alice", "company": "Acme Corp", "user_id": "123"}
+            )
+
+        # Check that send succeeded
+        self.assertTrue(result['success'])
 
-        # Mock Firebase app
-        mock_app = MagicMock()
-        mock_init_app.return_value = mock_app
 
-        # Mock send
-        mock_send.return_value = "msg_123"
+    @patch('notifications.channels.push_handler.initialize_app', new=StubCall(return_value=FIREBASE_APP))
+    @patch('notifications.channels.push_handler.credentials.Certificate', new=StubCall())
+    @patch('notifications.channels.push_handler.decrypt_data', new=StubCall(return_value="decrypted_private_key"))
+    async def test_push_send_bulk(self):
+        """Test bulk push goes out as one send_each batch"""
+        send_each = StubCall(return_value=SimpleNamespace(responses=[
+            SimpleNamespace(success=True, message_id="msg_1", exception=None),
+            SimpleNamespace(success=False, message_id=None, exception=Exception("Token unregistered")),
+        ]))
 
         handler = PushHandler(self.tenant_id, self.credentials)
-        result = async_to_sync(handler.send)(
-            recipient="fcm_token_123",
-            content={
-                "title": "Hello {{name}}",
-                "body": "Welcome to {{company}}",
-                "data": {"user_id": "{{user_id}}"}
-            },
-            context={"name": "Alice", "company": "Acme Corp", "user_id": "123"}
-        )
+        with patch('notifications.channels.push_handler.messaging.send_each', new=send_each):
+            result = await handler.send_bulk(
+                recipients=["fcm_token_1", "fcm_token_2"],
+                content={"title": "Hello {name}", "body": "Update"},
+                context={"name": "Team"}
+            )
 
-        # Check that send succeeded
         self.assertTrue(result['success'])
+        self.assertEqual(result['success_count'], 1)
+        self.assertEqual(result['failure_count'], 1)
+        self.assertEqual(result['results'][1]['error'], "Token unregistered")
+        self.assertEqual(send_each.call_count, 1)
+        messages = send_each.calls[0][0][0]
+        self.assertEqual([m.token for m in messages], ["fcm_token_1", "fcm_token_2"])
+        self.assertEqual(messages[0].notification.title, "Hello Team")
+
+    def test_push_data_values_serialized(self):
+        """Test non-string FCM data values are JSON-encoded"""
+        handler = PushHandler(self.tenant_id, self.credentials)
+
+        message = handler._create_fcm_message("fcm_token_123", {
+            "title": "Test",
+            "data": {"type": "message", "id": 123, "meta": {"unread": 2}}
+        })
+
+        self.assertEqual(message.data, {"type": "message", "id": "123", "meta": '{"unread":2}'})
 
 
-class InAppChannelTest(TestCase):
+class InAppChannelTest(IsolatedAsyncioTestCase):
     """Test In-App notification channel"""
 
     def setUp(self):
         self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
 
     @patch('notifications.channels.inapp_handler.get_channel_layer')
-    def test_inapp_send_success(self, mock_get_channel_layer):
+    async def test_inapp_send_success(self, mock_get_channel_layer):
         """Test successful in-app notification sending"""
         mock_channel_layer = MagicMock()
         mock_channel_layer.group_send = AsyncMock()
         mock_get_channel_layer.return_value = mock_channel_layer
 
         handler = InAppHandler(self.tenant_id, {})
-        result = async_to_sync(handler.send)(
+        result = await handler.send(
             recipient="user_123",
             content={
                 "title": "New Message",
@@ -390,18 +635,18 @@ class InAppChannelTest(TestCase):
         )
 
         self.assertTrue(result['success'])
-        self.assertIn(f"user_user_123_{self.tenant_id}", result['response']['groups'])
+        self.assertEqual(result['response']['groups'], [f"user_user_123_{self.tenant_id}"])
         mock_channel_layer.group_send.assert_called_once()
 
     @patch('notifications.channels.inapp_handler.get_channel_layer')
-    def test_inapp_send_tenant_broadcast(self, mock_get_channel_layer):
+    async def test_inapp_send_tenant_broadcast(self, mock_get_channel_layer):
         """Test tenant-wide broadcast"""
         mock_channel_layer = MagicMock()
         mock_channel_layer.group_send = AsyncMock()
         mock_get_channel_layer.return_value = mock_channel_layer
 
         handler = InAppHandler(self.tenant_id, {})
-        result = async_to_sync(handler.send)(
+        result = await handler.send(
             recipient="all",
             content={
                 "title": "System Update",
@@ -411,16 +656,42 @@ class InAppChannelTest(TestCase):
         )
 
         self.assertTrue(result['success'])
-        self.assertIn(f"tenant_{self.tenant_id}", result['response']['groups'])
+        self.assertEqual(result['response']['groups'], [f"tenant_{self.tenant_id}"])
         mock_channel_layer.group_send.assert_called_once()
 
     @patch('notifications.channels.inapp_handler.get_channel_layer')
-    def test_inapp_send_no_channel_layer(self, mock_get_channel_layer):
+    async def test_inapp_send_bulk(self, mock_get_channel_layer):
+        """Test bulk in-app send renders once and fans out to every recipient"""
+        mock_channel_layer = MagicMock()
+        mock_channel_layer.group_send = AsyncMock()
+        mock_get_channel_layer.return_value = mock_channel_layer
+
+        handler = InAppHandler(self.tenant_id, {})
+        recipients = [f"user_{i}" for i in range(100)] + ["group_admins", "all"]
+
+        with patch.object(handler, '_render_content', wraps=handler._render_content) as mock_render:
+            result = await handler.send_bulk(
+                recipients=recipients,
+                content={"title": "Hello {name}", "body": "Update"},
+                context={"name": "Team"}
+            )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['success_count'], 102)
+        mock_render.assert_called_once()
+        self.assertEqual(mock_channel_layer.group_send.await_count, 102)
+        groups = {c.args[0] for c in mock_channel_layer.group_send.await_args_list}
+        self.assertIn(f"group_admins_{self.tenant_id}", groups)
+        self.assertIn(f"tenant_{self.tenant_id}", groups)
+        self.assertEqual(mock_channel_layer.group_send.await_args_list[0].args[1]['title'], "Hello Team")
+
+    @patch('notifications.channels.inapp_handler.get_channel_layer')
+    async def test_inapp_send_no_channel_layer(self, mock_get_channel_layer):
         """Test in-app sending when channel layer is unavailable"""
         mock_get_channel_layer.return_value = None
 
         handler = InAppHandler(self.tenant_id, {})
-        result = async_to_sync(handler.send)(
+        result = await handler.send(
             recipient="user_123",
             content={"title": "Test", "body": "Test message"},
             context={}
@@ -429,7 +700,7 @@ class InAppChannelTest(TestCase):
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], 'Channel layer not configured')
 
-    def test_inapp_content_rendering(self):
+    async def test_inapp_content_rendering(self):
         """Test in-app content rendering with context"""
         handler = InAppHandler(self.tenant_id, {})
 
@@ -438,7 +709,7 @@ class InAppChannelTest(TestCase):
             mock_channel_layer.group_send = AsyncMock()
             mock_get_layer.return_value = mock_channel_layer
 
-            result = async_to_sync(handler.send)(
+            result = await handler.send(
                 recipient="user_123",
                 content={
                     "title": "Welcome {{name}}",
@@ -452,120 +723,183 @@ class InAppChannelTest(TestCase):
             self.assertTrue(result['success'])
 
 
-class ChannelIntegrationTest(TestCase):
-    """Test channel integration and cross-cutting concerns"""
+class TestChannelTaskRouting:
+    """Test channel send tasks are routed to per-channel Celery queues"""
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
+    def test_sms_task_routed_to_sms_queue(self):
+        from notification_service.celery import app
+        from notifications.tasks import send_notification_task
 
-    def test_channel_type_enum_values(self):
-        """Test that all channel types are properly defined"""
-        expected_channels = ['email', 'sms', 'push', 'inapp']
-        actual_channels = [channel.value for channel in ChannelType]
+        route = app.amqp.router.route(
+            {}, send_notification_task.name,
+            args=("record-id", "sms", "+1234567890", {}, {}), kwargs={}
+        )
 
-        for channel in expected_channels:
-            self.assertIn(channel, actual_channels,
-                         f"Channel '{channel}' should be defined in ChannelType enum")
+        assert route['queue'].name == 'sms'
 
-    def test_channel_handler_interface(self):
-        """Test that all channel handlers implement the required interface"""
-        handlers = [
-            EmailHandler(self.tenant_id, {}),
-            SMSHandler(self.tenant_id, {}),
-            PushHandler(self.tenant_id, {}),
-            InAppHandler(self.tenant_id, {})
-        ]
+    def test_email_task_routed_to_email_queue(self):
+        from notifications.tasks.routing import route_notification_task
 
-        required_methods = ['send', 'log_result']
+        assert route_notification_task(
+            'notifications.tasks.email_tasks.send_email_task', (), {}, {}
+        ) == {'queue': 'email'}
 
-        for handler in handlers:
-            for method in required_methods:
-                self.assertTrue(hasattr(handler, method),
-                               f"Handler {handler.__class__.__name__} missing method '{method}'")
-                self.assertTrue(callable(getattr(handler, method)),
-                               f"Handler {handler.__class__.__name__} method '{method}' not callable")
+    def test_other_tasks_use_default_queue(self):
+        from notifications.tasks.routing import route_notification_task
 
-    def test_channel_error_handling(self):
-        """Test consistent error handling across channels"""
-        handlers = [
-            EmailHandler(self.tenant_id, {}),
-            SMSHandler(self.tenant_id, {}),
-            PushHandler(self.tenant_id, {}),
-            InAppHandler(self.tenant_id, {})
+        assert route_notification_task(
+            'notifications.tasks.tasks.send_bulk_campaign_task', ("campaign-id",), {}, {}
+        ) is None
+
+    def test_batch_task_fans_out_each_send(self):
+        from notifications.tasks import send_notification_task, send_notifications_batch_task
+
+        batch = [
+            ["record-1", "email", "user@example.com", {"subject": "Hi"}, {}],
+            ["record-2", "inapp", "user-id", {"title": "Hi"}, {}],
         ]
+        with patch.object(send_notification_task, 'run') as mock_run:
+            send_notifications_batch_task.delay(batch)
 
-        for handler in handlers:
-            # Test with invalid recipient
-            result = async_to_sync(handler.send)(
-                recipient="",  # Invalid
-                content={"test": "data"},
-                context={}
-            )
+        assert [call.args[0] for call in mock_run.call_args_list] == ["record-1", "record-2"]
 
-            # Should return a result dict with success/error keys
-            self.assertIsInstance(result, dict)
-            self.assertIn('success', result)
 
-            if not result['success']:
-                self.assertIn('error', result)
+CHANNEL_HANDLER_CLASSES = [EmailHandler, SMSHandler, PushHandler, InAppHandler]
 
-    def test_channel_content_validation(self):
-        """Test content validation across channels"""
-        test_content = {
-            "title": "Test Title",
-            "body": "Test Body",
-            "subject": "Test Subject",
-            "data": {"key": "value"}
-        }
+CHANNEL_SEND_CREDENTIALS = [
+    (EmailHandler, {"from_email": "test@example.com"}),
+    (SMSHandler, {"account_sid": "AC123", "auth_token": "token", "from_number": "+1234567890"}),
+    (PushHandler, {"project_id": "test"}),
+    (InAppHandler, {}),
+]
 
-        handlers = [
-            EmailHandler(self.tenant_id, {}),
-            SMSHandler(self.tenant_id, {}),
-            PushHandler(self.tenant_id, {}),
-            InAppHandler(self.tenant_id, {})
-        ]
 
-        for handler in handlers:
-            # Should handle content gracefully
-            result = async_to_sync(handler.send)(
-                recipient="test_recipient",
-                content=test_content,
-                context={}
-            )
+def _handler_id(value):
+    return value.__name__ if isinstance(value, type) else None
 
-            # Should not crash, even with unexpected content
-            self.assertIsInstance(result, dict)
-            self.assertIn('success', result)
 
-    @patch('notifications.channels.email_handler.send_mail')
+class TestChannelIntegration:
+    """Test channel integration and cross-cutting concerns"""
+
+    tenant_id = "550e8400-e29b-41d4-a716-446655440000"
+
+    @pytest.fixture(scope="class", autouse=True)
+    def offline_email(self):
+        """Keep EmailHandler away from SMTP and the auth service for the whole class"""
+        with patch('notifications.channels.email_handler.get_connection'), \
+                patch('notifications.channels.email_handler.auth_service_client.get_tenant_branding',
+                      return_value={'name': 'Test Company'}):
+            yield
+
+    @pytest.fixture(scope="class")
+    def run(self):
+        """Run coroutines on one event loop shared by the class"""
+        loop = asyncio.new_event_loop()
+        yield loop.run_until_complete
+        loop.close()
+
+    @pytest.fixture(scope="class")
+    def all_handlers(self):
+        """One credential-less instance of every handler, built once per class"""
+        return {handler_class: handler_class(self.tenant_id, {}) for handler_class in CHANNEL_HANDLER_CLASSES}
+
+    def test_channel_type_enum_values(self):
+        """Test that all channel types are properly defined"""
+        expected_channels = {'email', 'sms', 'push', 'inapp'}
+
+        assert expected_channels <= CHANNEL_VALUES, \
+            f"Channels {expected_channels - CHANNEL_VALUES} should be defined in ChannelType enum"
+        assert CHANNEL_VALUES == {channel.value for channel in ChannelType}
+
+    @pytest.mark.parametrize("handler_class", CHANNEL_HANDLER_CLASSES, ids=_handler_id)
+    @pytest.mark.parametrize("method", ['send', 'log_result'])
+    def test_channel_handler_interface(self, all_handlers, handler_class, method):
+        """Test that all channel handlers implement the required interface"""
+        assert callable(getattr(all_handlers[handler_class], method, None)), \
+            f"Handler {handler_class.__name__} missing method '{method}'"
+
+    @pytest.mark.parametrize("handler_class", CHANNEL_HANDLER_CLASSES, ids=_handler_id)
+    def test_channel_error_handling(self, all_handlers, run, handler_class):
+        """Test consistent error handling across channels"""
+        result = run(all_handlers[handler_class].send(
+            recipient="",  # Invalid
+            content={"test": "data"},
+            context={}
+        ))
+
+        # Should return a result dict with success/error keys
+        assert isinstance(result, dict)
+        assert 'success' in result
+        if not result['success']:
+            assert 'error' in result
+
+    @pytest.mark.parametrize("handler_class", CHANNEL_HANDLER_CLASSES, ids=_handler_id)
+    def test_channel_content_validation(self, all_handlers, run, handler_class):
+        """Test content validation across channels"""
+        result = run(all_handlers[handler_class].send(
+            recipient="test_recipient",
+            content={
+                "title": "Test Title",
+                "body": "Test Body",
+                "subject": "Test Subject",
+                "data": {"key": "value"}
+            },
+            context={}
+        ))
+
+        # Should not crash, even with unexpected content
+        assert isinstance(result, dict)
+        assert 'success' in result
+
+    @pytest.mark.parametrize("handler_class,credentials", CHANNEL_SEND_CREDENTIALS, ids=_handler_id)
     @patch('notifications.channels.sms_handler.Client')
     @patch('notifications.channels.push_handler.messaging.send')
     @patch('notifications.channels.inapp_handler.get_channel_layer')
-    def test_all_channels_can_send(self, mock_inapp_layer, mock_push_send,
-                                   mock_sms_client, mock_email_send):
+    def test_all_channels_can_send(self, mock_inapp_layer, mock_push_send, mock_sms_client,
+                                   run, handler_class, credentials):
         """Test that all channels can be instantiated and attempt to send"""
-        # Setup mocks
-        mock_email_send.return_value = 1
         mock_sms_client.return_value.messages.create.return_value.sid = "SM123"
         mock_sms_client.return_value.messages.create.return_value.status = "queued"
         mock_push_send.return_value = "msg_123"
         mock_inapp_layer.return_value.group_send = MagicMock()
 
-        handlers = [
-            ("Email", EmailHandler(self.tenant_id, {"from_email": "test@example.com"})),
-            ("SMS", SMSHandler(self.tenant_id, {"account_sid": "AC123", "auth_token": "token", "from_number": "+1234567890"})),
-            ("Push", PushHandler(self.tenant_id, {"project_id": "test"})),
-            ("InApp", InAppHandler(self.tenant_id, {}))
-        ]
+        result = run(handler_class(self.tenant_id, credentials).send(
+            recipient="test_recipient",
+            content={"body": "Test message", "title": "Test", "subject": "Test"},
+            context={}
+        ))
+
+        # Should return a result without crashing
+        assert isinstance(result, dict)
+        assert 'success' in result
+
+    def test_send_all_dispatches_concurrently(self, run):
+        """Test multi-channel sends overlap instead of running one after another"""
+        events = []
+
+        def make_handler(channel, error=None):
+            async def send(recipient, content, context):
+                events.append(('start', channel))
+                await asyncio.sleep(0)
+                events.append(('end', channel))
+                if error:
+                    raise error
+                return {'success': True, 'response': recipient}
+
+            handler = MagicMock()
+            handler.send = AsyncMock(side_effect=send)
+            return handler
+
+        handlers = {
+            'email': make_handler('email'),
+            'sms': make_handler('sms', error=RuntimeError("Twilio down")),
+            'inapp': make_handler('inapp'),
+        }
+        recipients = {'email': 'user@example.com', 'sms': '+1234567890', 'inapp': 'user_123'}
 
-        for name, handler in handlers:
-            with self.subTest(channel=name):
-                result = async_to_sync(handler.send)(
-                    recipient="test_recipient",
-                    content={"body": "Test message", "title": "Test", "subject": "Test"},
-                    context={}
-                )
+        results = run(Dispatcher.send_all(handlers, recipients, {"body": "Hi"}, {}))
 
-                # Should return a result without crashing
-                self.assertIsInstance(result, dict)
-                self.assertIn('success', result)
\ No newline at end of file
+        assert [kind for kind, _ in events[:3]] == ['start'] * 3
+        assert results['email'] == {'success': True, 'response': 'user@example.com'}
+        assert results['sms'] == {'success': False, 'error': 'Twilio down', 'response': None}
+        handlers['inapp'].send.assert_awaited_once_with('user_123', {"body": "Hi"}, {})
@@ -1,72 +1,132 @@
 import json
-from django.test import TestCase
+from uuid import UUID
+from django.db.models import Count
+from django.test import SimpleTestCase, TestCase
 from unittest.mock import patch, MagicMock
+from notifications.channels.rendering import render_template
 from notifications.events.base_handler import BaseEventHandler
 from notifications.events.auth_handlers import (
     UserRegistrationHandler, PasswordResetHandler,
     LoginSecurityHandler
 )
 from notifications.events.app_handlers import (
-    InvoicePaymentHandler, TaskAssignedHandler,
-    CommentMentionedHandler, ContentLikedHandler
-)
-from notifications.events.security_handlers import (
-    TwoFactorCodeHandler, TwoFactorFailureHandler,
-    TwoFactorMethodChangedHandler
+    InvoicePaymentHandler, TaskAssignmentHandler,
+    CommentMentionHandler, ContentEngagementHandler
 )
+from notifications.events.security_handlers import TwoFactorAuthHandler
 from notifications.models import ChannelType, NotificationRecord
+from notifications.tasks import send_notifications_batch_task
+from tests.factories import TENANT_ID, USER_ID
 
 
-class EventHandlerBaseTest(TestCase):
-    """Test base event handler functionality"""
+class EventTestIds:
+    """Tenant and user ids shared by every event test"""
+    TENANT_ID = TENANT_ID
+    USER_ID = USER_ID
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
+
+class EventHandlerBaseTest(EventTestIds, SimpleTestCase):
+    """Test base event handler functionality"""
 
     def test_base_handler_interface(self):
         """Test that base handler defines required interface"""
-        handler = BaseEventHandler()
+        class MinimalHandler(BaseEventHandler):
+            __slots__ = ()
+            SUPPORTED_EVENTS = {'test.event'}
+
+            def get_template_data(self, event_payload):
+                return dict(event_payload)
+
+            def _get_email_content(self, event_type, context):
+                return {}
+
+        handler = MinimalHandler()
 
         # Should have required methods
-        self.assertTrue(hasattr(handler, 'can_handle'))
-        self.assertTrue(hasattr(handler, 'get_default_channels'))
-        self.assertTrue(hasattr(handler, 'get_template_data'))
-        self.assertTrue(hasattr(handler, 'get_recipient'))
-        self.assertTrue(hasattr(handler, 'get_channel_content'))
-        self.assertTrue(hasattr(handler, 'process_event'))
+        self.assertTrue(BaseEventHandler.HANDLER_INTERFACE.issubset(dir(handler)))
 
         # Should have default implementations
-        self.assertEqual(handler.get_default_channels('test'), [])
+        self.assertEqual(handler.get_default_channels('test'), frozenset())
         self.assertEqual(handler.priority, 'medium')
 
+    def test_handler_interface_enforced_at_definition(self):
+        """Test broken handlers are rejected when defined, not when first instantiated"""
+        # Declares events but leaves the abstract hooks unimplemented
+        with self.assertRaisesRegex(TypeError, 'get_template_data'):
+            class UnimplementedHandler(BaseEventHandler):
+                SUPPORTED_EVENTS = {'test.event'}
+
+        # Implements every hook but can never be dispatched to
+        with self.assertRaisesRegex(TypeError, 'SUPPORTED_EVENTS'):
+            class EventlessHandler(BaseEventHandler):
+                def get_template_data(self, event_payload):
+                    return {}
+
+                def _get_email_content(self, event_type, context):
+                    return {}
+
+        # An intermediate base with no events may stay abstract
+        class AbstractBaseHandler(BaseEventHandler):
+            pass
+
     def test_handler_registration(self):
         """Test event handler registration system"""
-        from notifications.events import EVENT_HANDLERS
+        from notifications.events import EVENT_HANDLERS, HANDLER_BY_EVENT
 
         # Should have handlers registered
         self.assertIsInstance(EVENT_HANDLERS, dict)
         self.assertGreater(len(EVENT_HANDLERS), 0)
 
-        # Each handler should be a class
+        # Each handler should be a class, served by a shared instance
         for event_type, handler_class in EVENT_HANDLERS.items():
             self.assertTrue(issubclass(handler_class, BaseEventHandler))
+            self.assertIs(type(HANDLER_BY_EVENT[event_type]), handler_class)
+            self.assertFalse(hasattr(HANDLER_BY_EVENT[event_type], '__dict__'))  # Slotted
+
+        # Events served by the same handler share one instance
+        self.assertIs(HANDLER_BY_EVENT['user.login.succeeded'],
+                      HANDLER_BY_EVENT['user.login.failed'])
+
+    def test_dispatch_without_handler(self):
+        """Test dispatch is a no-op for unregistered event types"""
+        from notifications.events import dispatch
 
+        self.assertIsNone(dispatch({'event_type': 'no.such.event', 'payload': {}}))
 
-class AuthenticationEventTest(TestCase):
+
+    @patch('notifications.events.base_handler.get_template')
+    def test_event_templates_compiled_once(self, mock_get_template):
+        """Test email templates are resolved once and reused across events"""
+        from notifications.events.base_handler import _compiled_template, render_event_template
+
+        _compiled_template.cache_clear()
+        mock_get_template.return_value.render.side_effect = lambda context: context['code']
+
+        self.assertEqual(render_event_template('email/otp_email.html', {'code': '111111'}), '111111')
+        self.assertEqual(render_event_template('email/otp_email.html', {'code': '222222'}), '222222')
+        mock_get_template.assert_called_once_with('email/otp_email.html')
+        _compiled_template.cache_clear()
+
+
+class AuthenticationEventTest(EventTestIds, SimpleTestCase):
     """Test authentication-related event handlers"""
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Handlers are stateless, so one instance per class serves every test
+        cls.registration_handler = UserRegistrationHandler()
+        cls.password_reset_handler = PasswordResetHandler()
+        cls.login_handler = LoginSecurityHandler()
 
     def test_user_registration_handler(self):
         """Test user registration event handling"""
-        handler = UserRegistrationHandler()
+        handler = self.registration_handler
 
         # Should handle registration events
         self.assertTrue(handler.can_handle('user.registration.completed'))
         self.assertFalse(handler.can_handle('user.login.succeeded'))
+        self.assertIsInstance(UserRegistrationHandler.SUPPORTED_EVENTS, frozenset)
 
         # Should use email and in-app channels
         channels = handler.get_default_channels('user.registration.completed')
@@ -75,7 +135,7 @@ class AuthenticationEventTest(TestCase):
 
         # Test template data extraction
         event_payload = {
-            'user_id': self.user_id,
+            'user_id': self.USER_ID,
             'email': 'user@example.com',
             'first_name': 'John',
             'last_name': 'Doe',
@@ -87,10 +147,10 @@ class AuthenticationEventTest(TestCase):
         self.assertEqual(template_data['email'], 'user@example.com')
         self.assertTrue(template_data['verification_required'])
 
-        # Test email content generation
+        # Test email content generation; placeholders are filled in when the channel renders it
         email_content = handler._get_email_content('user.registration.completed', template_data)
-        self.assertIn('Welcome John!', email_content['subject'])
-        self.assertIn('Welcome John, welcome!', email_content['body'])
+        self.assertIn('John!', render_template(email_content['subject'], template_data))
+        self.assertIn('account has been successfully created', email_content['body'])
 
         # Test in-app content generation
         inapp_content = handler._get_inapp_content('user.registration.completed', template_data)
@@ -99,7 +159,7 @@ class AuthenticationEventTest(TestCase):
 
     def test_password_reset_handler(self):
         """Test password reset event handling"""
-        handler = PasswordResetHandler()
+        handler = self.password_reset_handler
 
         self.assertTrue(handler.can_handle('user.password.reset.requested'))
         self.assertEqual(handler.priority, 'high')
@@ -125,7 +185,7 @@ class AuthenticationEventTest(TestCase):
 
     def test_login_security_handler(self):
         """Test login security event handling"""
-        handler = LoginSecurityHandler()
+        handler = self.login_handler
 
         # Should handle both success and failure
         self.assertTrue(handler.can_handle('user.login.succeeded'))
@@ -142,6 +202,11 @@ class AuthenticationEventTest(TestCase):
         self.assertIn(ChannelType.SMS, failure_channels)
         self.assertIn(ChannelType.PUSH, failure_channels)
 
+        # Resolved channel sets are memoized per event type
+        self.assertIs(handler.get_channels('user.login.failed'),
+                      handler.get_channels('user.login.failed'))
+        self.assertEqual(handler.get_channels('user.login.succeeded'), success_channels)
+
         # Test failure event content
         event_payload = {
             'email': 'user@example.com',
@@ -156,19 +221,24 @@ class AuthenticationEventTest(TestCase):
 
         email_content = handler._get_email_content('user.login.failed', template_data)
         self.assertIn('Security Alert', email_content['subject'])
-        self.assertIn('invalid_password', email_content['body'])
+        self.assertIn('invalid_password', render_template(email_content['body'], template_data))
 
 
-class ApplicationEventTest(TestCase):
+class ApplicationEventTest(EventTestIds, SimpleTestCase):
     """Test application-related event handlers"""
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Handlers are stateless, so one instance per class serves every test
+        cls.invoice_handler = InvoicePaymentHandler()
+        cls.task_handler = TaskAssignmentHandler()
+        cls.mention_handler = CommentMentionHandler()
+        cls.like_handler = ContentEngagementHandler()
 
     def test_invoice_payment_handler(self):
         """Test invoice payment event handling"""
-        handler = InvoicePaymentHandler()
+        handler = self.invoice_handler
 
         self.assertTrue(handler.can_handle('invoice.payment.failed'))
         self.assertEqual(handler.priority, 'high')
@@ -180,7 +250,7 @@ class ApplicationEventTest(TestCase):
         self.assertIn(ChannelType.PUSH, channels)
 
         event_payload = {
-            'user_id': self.user_id,
+            'user_id': self.USER_ID,
             'invoice_id': 'inv_123',
             'amount': 99.99,
             'currency': 'USD',
@@ -193,7 +263,7 @@ class ApplicationEventTest(TestCase):
 
     def test_task_assigned_handler(self):
         """Test task assignment event handling"""
-        handler = TaskAssignedHandler()
+        handler = self.task_handler
 
         self.assertTrue(handler.can_handle('task.assigned'))
         self.assertEqual(handler.priority, 'medium')
@@ -205,12 +275,12 @@ class ApplicationEventTest(TestCase):
 
     def test_comment_mention_handler(self):
         """Test comment mention event handling"""
-        handler = CommentMentionedHandler()
+        handler = self.mention_handler
 
         self.assertTrue(handler.can_handle('comment.mentioned'))
 
         event_payload = {
-            'user_id': self.user_id,
+            'user_id': self.USER_ID,
             'comment_text': 'Hey @john, check this out!',
             'author_name': 'Jane Smith',
             'entity_title': 'Project Proposal'
@@ -222,7 +292,7 @@ class ApplicationEventTest(TestCase):
 
     def test_content_liked_handler(self):
         """Test content liked event handling"""
-        handler = ContentLikedHandler()
+        handler = self.like_handler
 
         self.assertTrue(handler.can_handle('content.liked'))
         self.assertEqual(handler.priority, 'low')
@@ -234,29 +304,31 @@ class ApplicationEventTest(TestCase):
         self.assertNotIn(ChannelType.EMAIL, channels)  # Not for likes
 
 
-class SecurityEventTest(TestCase):
+class SecurityEventTest(EventTestIds, SimpleTestCase):
     """Test security-related event handlers"""
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Handlers are stateless, so one instance per class serves every test
+        # One handler covers every 2FA event
+        cls.handler = TwoFactorAuthHandler()
 
     def test_2fa_code_handler(self):
         """Test 2FA code request handling"""
-        handler = TwoFactorCodeHandler()
+        handler = self.handler
 
         self.assertTrue(handler.can_handle('auth.2fa.code.requested'))
         self.assertEqual(handler.priority, 'high')
 
-        # Should use SMS, email, and in-app
+        # Should use SMS, with email as the backup
         channels = handler.get_default_channels('auth.2fa.code.requested')
         self.assertIn(ChannelType.SMS, channels)
         self.assertIn(ChannelType.EMAIL, channels)
-        self.assertIn(ChannelType.INAPP, channels)
 
     def test_2fa_failure_handler(self):
         """Test 2FA failure handling"""
-        handler = TwoFactorFailureHandler()
+        handler = self.handler
 
         self.assertTrue(handler.can_handle('auth.2fa.attempt.failed'))
         self.assertEqual(handler.priority, 'high')
@@ -269,34 +341,37 @@ class SecurityEventTest(TestCase):
 
     def test_2fa_method_changed_handler(self):
         """Test 2FA method change handling"""
-        handler = TwoFactorMethodChangedHandler()
+        handler = self.handler
 
         self.assertTrue(handler.can_handle('auth.2fa.method.changed'))
-        self.assertEqual(handler.priority, 'medium')
+        self.assertEqual(handler.priority, 'high')
 
         channels = handler.get_default_channels('auth.2fa.method.changed')
         self.assertIn(ChannelType.EMAIL, channels)
-        self.assertIn(ChannelType.SMS, channels)
         self.assertIn(ChannelType.INAPP, channels)
 
 
-class EventProcessingTest(TestCase):
+class EventProcessingTest(EventTestIds, TestCase):
     """Test end-to-end event processing"""
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Handlers are stateless, so one instance per class serves every test
+        cls.registration_handler = UserRegistrationHandler()
+        cls.invoice_handler = InvoicePaymentHandler()
+        cls.task_handler = TaskAssignmentHandler()
 
-    @patch('notifications.tasks.send_notification_task.delay')
+    @patch.object(send_notifications_batch_task, 'delay')
     def test_user_registration_event_processing(self, mock_task):
         """Test complete user registration event processing"""
-        handler = UserRegistrationHandler()
+        handler = self.registration_handler
 
         event = {
             'event_type': 'user.registration.completed',
-            'tenant_id': self.tenant_id,
+            'tenant_id': self.TENANT_ID,
             'payload': {
-                'user_id': self.user_id,
+                'user_id': self.USER_ID,
                 'email': 'user@example.com',
                 'first_name': 'John',
                 'last_name': 'Doe',
@@ -310,30 +385,28 @@ class EventProcessingTest(TestCase):
         self.assertIsNotNone(result)
 
         # Should have queued notification tasks
-        self.assertEqual(mock_task.call_count, 2)  # Email and in-app
+        self.assertEqual(mock_task.call_count, 1)  # One batched enqueue
+        self.assertEqual(len(mock_task.call_args[0][0]), 2)  # Email and in-app
 
-        # Check notification records were created
-        notifications = NotificationRecord.objects.filter(
-            tenant_id=self.tenant_id,
+        # Check notification records were created, one per channel
+        channels = list(NotificationRecord.objects.filter(
+            tenant_id=self.TENANT_ID,
             recipient='user@example.com'
-        )
-        self.assertEqual(notifications.count(), 2)
+        ).values_list('channel', flat=True))
+        self.assertEqual(len(channels), 2)
+        self.assertIn(ChannelType.EMAIL.value, channels)
+        self.assertIn(ChannelType.INAPP.value, channels)
 
-        # Check channels
-        channels = notifications.values_list('channel', flat=True)
-        self.assertIn(ChannelType.EMAIL, channels)
-        self.assertIn(ChannelType.INAPP, channels)
-
-    @patch('notifications.tasks.send_notification_task.delay')
+    @patch.object(send_notifications_batch_task, 'delay')
     def test_payment_failure_event_processing(self, mock_task):
         """Test payment failure event processing"""
-        handler = InvoicePaymentHandler()
+        handler = self.invoice_handler
 
         event = {
             'event_type': 'invoice.payment.failed',
-            'tenant_id': self.tenant_id,
+            'tenant_id': self.TENANT_ID,
             'payload': {
-                'user_id': self.user_id,
+                'user_id': self.USER_ID,
                 'email': 'user@example.com',
                 'phone': '+1234567890',
                 'invoice_id': 'inv_123',
@@ -345,43 +418,89 @@ class EventProcessingTest(TestCase):
         result = handler.process_event(event)
 
         self.assertIsNotNone(result)
-        self.assertEqual(mock_task.call_count, 3)  # Email, SMS, Push
-
-        # Check all channels were used
-        notifications = NotificationRecord.objects.filter(
-            tenant_id=self.tenant_id
-        )
-        channels = set(notifications.values_list('channel', flat=True))
-        expected_channels = {ChannelType.EMAIL, ChannelType.SMS, ChannelType.PUSH}
+        self.assertEqual(mock_task.call_count, 1)  # One batched enqueue
+        self.assertEqual(len(mock_task.call_args[0][0]), 3)  # Email, SMS, Push
+
+        # Check all channels were used; the batch length above already pins one record each
+        channels = set(NotificationRecord.objects.filter(
+            tenant_id=self.TENANT_ID
+        ).values_list('channel', flat=True).distinct())
+        expected_channels = {ChannelType.EMAIL.value, ChannelType.SMS.value, ChannelType.PUSH.value}
         self.assertEqual(channels, expected_channels)
 
+    @patch.object(send_notifications_batch_task, 'delay')
+    def test_event_records_inserted_in_one_statement(self, mock_task):
+        """Test per-channel records for an event are bulk inserted"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        handler = self.invoice_handler
+        event = {
+            'event_type': 'invoice.payment.failed',
+            'tenant_id': self.TENANT_ID,
+            'payload': {
+                'user_id': self.USER_ID,
+                'email': 'user@example.com',
+                'invoice_id': 'inv_123',
+                'amount': 99.99
+            }
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            handler.process_event(event)
+
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(NotificationRecord.objects.filter(tenant_id=self.TENANT_ID).count(), 3)
+
+    @patch.object(send_notifications_batch_task, 'delay')
+    def test_template_data_extracted_once_per_event(self, mock_task):
+        """Test every channel's content is built from one template data extraction"""
+        handler = self.invoice_handler
+        event = {
+            'event_type': 'invoice.payment.failed',
+            'tenant_id': self.TENANT_ID,
+            'payload': {'user_id': self.USER_ID, 'email': 'user@example.com', 'amount': 99.99}
+        }
+
+        with patch.object(InvoicePaymentHandler, 'get_template_data', autospec=True,
+                          side_effect=InvoicePaymentHandler.get_template_data) as mock_template_data:
+            handler.process_event(event)
+
+        self.assertEqual(mock_template_data.call_count, 1)
+        self.assertEqual(len(mock_task.call_args[0][0]), 3)
+
     def test_event_handler_error_handling(self):
         """Test event handler error handling"""
-        handler = UserRegistrationHandler()
+        handler = self.registration_handler
 
-        # Test with missing payload
-        result = handler.process_event({
-            'event_type': 'user.registration.completed',
-            'tenant_id': self.tenant_id
-        })
+        with patch.object(UserRegistrationHandler, 'get_template_data') as mock_template_data:
+            # Test with missing payload
+            result = handler.process_event({
+                'event_type': 'user.registration.completed',
+                'tenant_id': self.TENANT_ID
+            })
 
-        self.assertIsNone(result)  # Should handle gracefully
+            self.assertIsNone(result)  # Should handle gracefully
 
-        # Test with invalid event type
-        result = handler.process_event({
-            'event_type': 'invalid.event',
-            'tenant_id': self.tenant_id,
-            'payload': {}
-        })
+            # Test with invalid event type
+            result = handler.process_event({
+                'event_type': 'invalid.event',
+                'tenant_id': self.TENANT_ID,
+                'payload': {'email': 'user@example.com'}
+            })
 
-        self.assertIsNone(result)  # Should not handle invalid events
+            self.assertIsNone(result)  # Should not handle invalid events
+
+            # Both are rejected before any content is built
+            mock_template_data.assert_not_called()
 
     def test_template_context_injection(self):
         """Test template context injection in events"""
-        handler = TaskAssignedHandler()
+        handler = self.task_handler
 
         event_payload = {
-            'user_id': self.user_id,
+            'user_id': self.USER_ID,
             'task_title': 'Review Report',
             'assigned_by': 'manager@example.com',
             'due_date': '2024-01-15T17:00:00Z',
@@ -392,17 +511,18 @@ class EventProcessingTest(TestCase):
 
         # Test context injection
         email_content = handler._get_email_content('task.assigned', template_data)
-        self.assertIn('Review Report', email_content['body'])
-        self.assertIn('manager@example.com', email_content['body'])
-        self.assertIn('high', email_content['body'])
+        body = render_template(email_content['body'], template_data)
+        self.assertIn('Review Report', body)
+        self.assertIn('manager@example.com', body)
+        self.assertIn('high', body)
 
     def test_event_priority_handling(self):
         """Test event priority handling"""
         handlers = [
             (UserRegistrationHandler(), 'high'),
             (PasswordResetHandler(), 'high'),
-            (TaskAssignedHandler(), 'medium'),
-            (ContentLikedHandler(), 'low')
+            (TaskAssignmentHandler(), 'medium'),
+            (ContentEngagementHandler(), 'low')
         ]
 
         for handler, expected_priority in handlers:
@@ -410,17 +530,13 @@ class EventProcessingTest(TestCase):
                            f"{handler.__class__.__name__} should have {expected_priority} priority")
 
 
-class EventIntegrationTest(TestCase):
+class EventIntegrationTest(EventTestIds, TestCase):
     """Test event system integration"""
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
-
-    @patch('notifications.events.base_handler.BaseEventHandler.process_event')
+    @patch.object(BaseEventHandler, 'process_event')
     def test_event_router_integration(self, mock_process):
         """Test event routing to appropriate handlers"""
-        from notifications.events import EVENT_HANDLERS
+        from notifications.events import EVENT_HANDLERS, HANDLER_BY_EVENT
 
         # Test that all supported events have handlers
         supported_events = [
@@ -438,14 +554,14 @@ class EventIntegrationTest(TestCase):
         ]
 
         for event_type in supported_events:
-            self.assertIn(event_type, EVENT_HANDLERS,
+            self.assertIn(event_type, HANDLER_BY_EVENT,
                          f"No handler registered for event: {event_type}")
 
-            handler_class = EVENT_HANDLERS[event_type]
-            handler = handler_class()
+            handler = HANDLER_BY_EVENT[event_type]
 
+            self.assertIs(type(handler), EVENT_HANDLERS[event_type])
             self.assertTrue(handler.can_handle(event_type),
-                          f"Handler {handler_class.__name__} should handle {event_type}")
+                          f"Handler {handler.__class__.__name__} should handle {event_type}")
 
     def test_event_payload_validation(self):
         """Test event payload validation"""
@@ -454,9 +570,9 @@ class EventIntegrationTest(TestCase):
         # Valid payload
         valid_event = {
             'event_type': 'user.registration.completed',
-            'tenant_id': self.tenant_id,
+            'tenant_id': self.TENANT_ID,
             'payload': {
-                'user_id': self.user_id,
+                'user_id': self.USER_ID,
                 'email': 'user@example.com',
                 'first_name': 'John'
             }
@@ -468,7 +584,7 @@ class EventIntegrationTest(TestCase):
         # Invalid payload - missing required fields
         invalid_event = {
             'event_type': 'user.registration.completed',
-            'tenant_id': self.tenant_id,
+            'tenant_id': self.TENANT_ID,
             'payload': {}  # Missing required fields
         }
 
@@ -479,16 +595,18 @@ class EventIntegrationTest(TestCase):
         """Test tenant isolation in event processing"""
         handler1 = UserRegistrationHandler()
         handler2 = UserRegistrationHandler()
+        tenant1 = UUID(self.TENANT_ID)
+        tenant2 = UUID('550e8400-e29b-41d4-a716-446655440099')
 
         event1 = {
             'event_type': 'user.registration.completed',
-            'tenant_id': 'tenant1',
+            'tenant_id': tenant1,
             'payload': {'user_id': 'user1', 'email': 'user1@example.com'}
         }
 
         event2 = {
             'event_type': 'user.registration.completed',
-            'tenant_id': 'tenant2',
+            'tenant_id': tenant2,
             'payload': {'user_id': 'user2', 'email': 'user2@example.com'}
         }
 
@@ -496,9 +614,12 @@ class EventIntegrationTest(TestCase):
         handler1.process_event(event1)
         handler2.process_event(event2)
 
-        # Check that notifications were created for correct tenants
-        notifications1 = NotificationRecord.objects.filter(tenant_id='tenant1')
-        notifications2 = NotificationRecord.objects.filter(tenant_id='tenant2')
+        # Check that notifications were created for correct tenants, counted in one query
+        counts = {
+            row['tenant_id']: row['n']
+            for row in NotificationRecord.objects.filter(tenant_id__in=[tenant1, tenant2])
+            .values('tenant_id').annotate(n=Count('id'))
+        }
 
-        # Should be isolated (though mocked, this tests the logic)
-        self.assertNotEqual(notifications1.count(), notifications2.count())
\ No newline at end of file
+        # Each tenant gets only its own email and in-app records
+        self.assertEqual(counts, {tenant1: 2, tenant2: 2})
\ No newline at end of file
@@ -1,423 +1,403 @@
+import functools
+import uuid
+import factory
 import pytest
-from django.test import TestCase
 from django.utils import timezone
 from datetime import timedelta
 from notifications.models import (
     NotificationRecord, TenantCredentials, NotificationTemplate,
     Campaign, CampaignStatus, ChannelType, NotificationStatus,
-    FailureReason, DeviceToken, DeviceType, PushAnalytics,
-    SMSAnalytics, ChatConversation, ChatParticipant, ChatMessage,
+    DeviceToken, DeviceType, PushAnalytics, SMSAnalytics,
+    ChatConversation, ChatParticipant, ChatMessage,
     MessageReaction, UserPresence, MessageType, TypingIndicator
 )
-from django.core.exceptions import ValidationError
-
-
-class NotificationModelsTest(TestCase):
-    """Test notification service models"""
-
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
-
-    def test_notification_record_creation(self):
-        """Test NotificationRecord model creation"""
-        record = NotificationRecord.objects.create(
-            tenant_id=self.tenant_id,
-            channel=ChannelType.EMAIL,
-            recipient="test@example.com",
-            context={"name": "Test User"}
-        )
-
-        self.assertEqual(record.status, NotificationStatus.PENDING.value)
-        self.assertEqual(record.retry_count, 0)
-        self.assertEqual(record.max_retries, 3)
-        self.assertIsNotNone(record.created_at)
-
-    def test_tenant_credentials_creation(self):
-        """Test TenantCredentials model with encryption"""
-        credentials = TenantCredentials.objects.create(
-            tenant_id=self.tenant_id,
-            channel=ChannelType.EMAIL,
-            credentials={
-                "smtp_host": "smtp.gmail.com",
-                "username": "test@example.com",
-                "password": "secret_password"
-            }
-        )
-
-        self.assertEqual(credentials.channel, ChannelType.EMAIL)
-        self.assertIsInstance(credentials.credentials, dict)
-        self.assertTrue(credentials.is_active)
-
-    def test_notification_template_creation(self):
-        """Test NotificationTemplate model"""
-        template = NotificationTemplate.objects.create(
-            tenant_id=self.tenant_id,
-            name="Welcome Email",
-            channel=ChannelType.EMAIL,
-            content={
-                "subject": "Welcome {{name}}!",
-                "body": "Hello {{name}}, welcome!"
-            },
-            placeholders=["{{name}}"]
-        )
-
-        self.assertEqual(template.version, 1)
-        self.assertTrue(template.is_active)
-        self.assertEqual(template.placeholders, ["{{name}}"])
-
-    def test_campaign_creation(self):
-        """Test Campaign model"""
-        campaign = Campaign.objects.create(
-            tenant_id=self.tenant_id,
-            name="Test Campaign",
-            channel=ChannelType.PUSH,
-            recipients=[
-                {"recipient": "token1", "context": {"name": "User1"}},
-                {"recipient": "token2", "context": {"name": "User2"}}
-            ]
-        )
-
-        self.assertEqual(campaign.status, CampaignStatus.DRAFT.value)
-        self.assertEqual(campaign.total_recipients, 2)
-        self.assertEqual(campaign.sent_count, 0)
-
-    def test_device_token_creation(self):
-        """Test DeviceToken model"""
-        device_token = DeviceToken.objects.create(
-            tenant_id=self.tenant_id,
-            user_id=self.user_id,
-            device_type=DeviceType.ANDROID,
-            device_token="fcm_test_token_123",
-            device_id="device_123",
-            app_version="1.0.0"
-        )
-
-        self.assertEqual(device_token.device_type, DeviceType.ANDROID)
-        self.assertTrue(device_token.is_active)
-        self.assertIsNotNone(device_token.created_at)
-
-    def test_push_analytics_creation(self):
-        """Test PushAnalytics model"""
-        analytics = PushAnalytics.objects.create(
-            tenant_id=self.tenant_id,
-            notification_id="550e8400-e29b-41d4-a716-446655440002",
-            device_token_id="550e8400-e29b-41d4-a716-446655440003",
-            fcm_message_id="msg_123",
-            status="delivered",
-            platform=DeviceType.ANDROID
-        )
-
-        self.assertEqual(analytics.status, "delivered")
-        self.assertEqual(analytics.platform, DeviceType.ANDROID)
-        self.assertIsNotNone(analytics.created_at)
-
-    def test_sms_analytics_creation(self):
-        """Test SMSAnalytics model"""
-        analytics = SMSAnalytics.objects.create(
-            tenant_id=self.tenant_id,
-            notification_id="550e8400-e29b-41d4-a716-446655440002",
-            twilio_sid="SM1234567890",
-            recipient="+1234567890",
-            status="delivered",
-            segments=1,
-            price=0.0075,
-            price_unit="USD"
-        )
-
-        self.assertEqual(analytics.status, "delivered")
-        self.assertEqual(analytics.segments, 1)
-        self.assertEqual(float(analytics.price), 0.0075)
-
-    def test_chat_conversation_creation(self):
-        """Test ChatConversation model"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            title="Test Chat",
-            conversation_type="group",
-            created_by=self.user_id
-        )
-
-        self.assertEqual(conversation.conversation_type, "group")
-        self.assertTrue(conversation.is_active)
-        self.assertEqual(conversation.created_by, self.user_id)
-
-    def test_chat_participant_creation(self):
-        """Test ChatParticipant model"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        participant = ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id,
-            role="admin"
-        )
-
-        self.assertEqual(participant.role, "admin")
-        self.assertTrue(participant.is_active)
-        self.assertIsNotNone(participant.joined_at)
-
-    def test_chat_message_creation(self):
-        """Test ChatMessage model"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        message = ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Hello world!"
-        )
-
-        self.assertEqual(message.message_type, MessageType.TEXT)
-        self.assertEqual(message.content, "Hello world!")
-        self.assertFalse(message.is_deleted)
-        self.assertIsNotNone(message.created_at)
-
-    def test_message_reaction_creation(self):
-        """Test MessageReaction model"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        message = ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Hello!"
-        )
-
-        reaction = MessageReaction.objects.create(
-            tenant_id=self.tenant_id,
-            message=message,
-            user_id=self.user_id,
-            emoji="👍"
-        )
-
-        self.assertEqual(reaction.emoji, "👍")
-        self.assertIsNotNone(reaction.created_at)
-
-    def test_user_presence_creation(self):
-        """Test UserPresence model"""
-        presence = UserPresence.objects.create(
-            tenant_id=self.tenant_id,
-            user_id=self.user_id,
-            status="online"
-        )
-
-        self.assertEqual(presence.status, "online")
-        self.assertIsNotNone(presence.last_seen)
-
-    def test_typing_indicator_creation(self):
-        """Test TypingIndicator model"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        expires_at = timezone.now() + timedelta(seconds=10)
-        indicator = TypingIndicator.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id,
-            expires_at=expires_at
-        )
-
-        self.assertEqual(indicator.user_id, self.user_id)
-        self.assertIsNotNone(indicator.started_at)
+from django.db import IntegrityError, transaction
+from tests.factories import (
+    TENANT_UUID, USER_UUID, NotificationRecordFactory, ChatConversationFactory,
+    ChatParticipantFactory, ChatMessageFactory
+)
 
-    def test_soft_delete_functionality(self):
-        """Test soft delete functionality"""
-        record = NotificationRecord.objects.create(
-            tenant_id=self.tenant_id,
-            channel=ChannelType.EMAIL,
-            recipient="test@example.com"
-        )
 
-        # Soft delete
-        record.soft_delete()
+# Shared literals for the JSONField tests. These stay plain dicts because a
+# read-only MappingProxyType is not JSON serialisable; nothing here mutates them
+DEFAULT_CONTEXT = {"name": "Test User"}
+EMAIL_CREDENTIALS = {
+    "smtp_host": "smtp.gmail.com",
+    "username": "test@example.com",
+    "password": "secret_password"
+}
+WELCOME_TEMPLATE_CONTENT = {
+    "subject": "Welcome {{name}}!",
+    "body": "Hello {{name}}, welcome!"
+}
+
+
+@pytest.fixture(scope="module")
+def conversation_factory(django_db_setup, django_db_blocker):
+    """Create chat conversations inside a transaction held open for the module
+
+    Rows created at module scope are shared by every test in the file: each
+    test's savepoint is rolled back on top of them, and the module transaction
+    is rolled back at teardown.
+    """
+    def create(**kwargs):
+        with django_db_blocker.unblock():
+            return ChatConversationFactory(**kwargs)
+
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+    try:
+        yield create
+    finally:
+        with django_db_blocker.unblock():
+            transaction.set_rollback(True)
+            atomic.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="module")
+def conversation(conversation_factory):
+    """Direct conversation inserted once and reused across the chat tests"""
+    return conversation_factory()
+
+
+@pytest.fixture(scope="session")
+def typing_expires_at():
+    """Typing indicator expiry, computed once per session"""
+    return timezone.now() + timedelta(seconds=10)
+
+
+@pytest.mark.django_db
+def test_analytics_models_smoke():
+    """Test NotificationRecord, DeviceToken, PushAnalytics and SMSAnalytics creation"""
+    record = NotificationRecordFactory.build(context=DEFAULT_CONTEXT)
+    device_token = DeviceToken(
+        tenant_id=TENANT_UUID,
+        user_id=USER_UUID,
+        device_type=DeviceType.ANDROID,
+        device_token="fcm_test_token_123",
+        device_id="device_123",
+        app_version="1.0.0"
+    )
+    push_analytics = PushAnalytics(
+        tenant_id=TENANT_UUID,
+        notification_id="550e8400-e29b-41d4-a716-446655440002",
+        device_token_id="550e8400-e29b-41d4-a716-446655440003",
+        fcm_message_id="msg_123",
+        status="delivered",
+        platform=DeviceType.ANDROID
+    )
+    sms_analytics = SMSAnalytics(
+        tenant_id=TENANT_UUID,
+        notification_id="550e8400-e29b-41d4-a716-446655440002",
+        twilio_sid="SM1234567890",
+        recipient="+1234567890",
+        status="delivered",
+        segments=1,
+        price=0.0075,
+        price_unit="USD"
+    )
+    for instance in (record, device_token, push_analytics, sms_analytics):
+        type(instance).objects.bulk_create([instance])
+
+    assert record.status == NotificationStatus.PENDING.value
+    assert record.retry_count == 0
+    assert record.max_retries == 3
+    assert record.created_at is not None
+
+    assert device_token.device_type == DeviceType.ANDROID
+    assert device_token.is_active
+    assert device_token.created_at is not None
+
+    assert push_analytics.status == "delivered"
+    assert push_analytics.platform == DeviceType.ANDROID
+    assert push_analytics.created_at is not None
+
+    assert sms_analytics.status == "delivered"
+    assert sms_analytics.segments == 1
+    assert float(sms_analytics.price) == 0.0075
+
+
+@pytest.mark.django_db
+def test_tenant_credentials_creation():
+    """Test TenantCredentials model with encryption"""
+    credentials = TenantCredentials.objects.create(
+        tenant_id=TENANT_UUID,
+        channel=ChannelType.EMAIL,
+        credentials=EMAIL_CREDENTIALS
+    )
+
+    assert credentials.channel == ChannelType.EMAIL
+    assert isinstance(credentials.credentials, dict)
+    assert credentials.is_active
+
+
+@pytest.mark.django_db
+def test_notification_template_creation():
+    """Test NotificationTemplate model"""
+    template = NotificationTemplate.objects.create(
+        tenant_id=TENANT_UUID,
+        name="Welcome Email",
+        channel=ChannelType.EMAIL,
+        content=WELCOME_TEMPLATE_CONTENT,
+        placeholders=["{{name}}"]
+    )
+
+    assert template.version == 1
+    assert template.is_active
+    assert template.placeholders == ["{{name}}"]
+
+
+@pytest.mark.django_db
+def test_campaign_creation():
+    """Test Campaign model"""
+    campaign = Campaign.objects.create(
+        tenant_id=TENANT_UUID,
+        name="Test Campaign",
+        channel=ChannelType.PUSH,
+        recipients=[
+            {"recipient": "token1", "context": {"name": "User1"}},
+            {"recipient": "token2", "context": {"name": "User2"}}
+        ]
+    )
+
+    assert campaign.status == CampaignStatus.DRAFT.value
+    assert campaign.total_recipients == 2
+    assert campaign.sent_count == 0
+
+
+@pytest.mark.django_db
+def test_chat_conversation_creation():
+    """Test ChatConversation model"""
+    conversation = ChatConversationFactory(title="Test Chat", conversation_type="group")
+
+    assert conversation.conversation_type == "group"
+    assert conversation.is_active
+    assert conversation.created_by == USER_UUID
+
+
+@pytest.mark.django_db
+def test_chat_participant_creation(conversation):
+    """Test ChatParticipant model"""
+    participant = ChatParticipantFactory(conversation=conversation, role="admin")
+
+    assert participant.role == "admin"
+    assert participant.is_active
+    assert participant.joined_at is not None
+
+
+@pytest.mark.django_db
+def test_chat_message_creation(conversation):
+    """Test ChatMessage model"""
+    message = ChatMessageFactory(
+        conversation=conversation,
+        message_type=MessageType.TEXT,
+        content="Hello world!"
+    )
+
+    assert message.message_type == MessageType.TEXT
+    assert message.content == "Hello world!"
+    assert not message.is_deleted
+    assert message.created_at is not None
+
+
+@pytest.mark.django_db
+def test_message_reaction_creation(conversation):
+    """Test MessageReaction model"""
+    message = ChatMessageFactory(conversation=conversation, content="Hello!")
+
+    reaction = MessageReaction.objects.create(
+        tenant_id=TENANT_UUID,
+        message=message,
+        user_id=USER_UUID,
+        emoji="👍"
+    )
+
+    assert reaction.emoji == "👍"
+    assert reaction.created_at is not None
+
+
+@pytest.mark.django_db
+def test_user_presence_creation():
+    """Test UserPresence model"""
+    presence = UserPresence.objects.create(
+        tenant_id=TENANT_UUID,
+        user_id=USER_UUID,
+        status="online"
+    )
+
+    assert presence.status == "online"
+    assert presence.last_seen is not None
+
+
+@pytest.mark.django_db
+def test_typing_indicator_creation(conversation, typing_expires_at):
+    """Test TypingIndicator model"""
+    indicator = TypingIndicator.objects.create(
+        tenant_id=TENANT_UUID,
+        conversation=conversation,
+        user_id=USER_UUID,
+        expires_at=typing_expires_at
+    )
+
+    assert indicator.user_id == USER_UUID
+    assert indicator.started_at is not None
+
+
+@pytest.mark.django_db
+def test_soft_delete_functionality():
+    """Test soft delete functionality"""
+    record = NotificationRecordFactory()
+
+    # Soft delete
+    record.soft_delete()
+
+    assert record.is_deleted
+    assert record.deleted_at is not None
+
+    # Should not appear in default queryset
+    assert not NotificationRecord.objects.filter(pk=record.pk).exists()
+    assert NotificationRecord.objects.all_with_deleted().filter(pk=record.pk).exists()
 
-        self.assertTrue(record.is_deleted)
-        self.assertIsNotNone(record.deleted_at)
 
-        # Should not appear in default queryset
-        self.assertEqual(NotificationRecord.objects.count(), 0)
-        self.assertEqual(NotificationRecord.objects.all_with_deleted().count(), 1)
+@pytest.mark.django_db
+def test_unique_constraints():
+    """Test unique constraints"""
+    # Test tenant credentials uniqueness
+    TenantCredentials.objects.create(
+        tenant_id=TENANT_UUID,
+        channel=ChannelType.EMAIL,
+        credentials={"host": "smtp.test.com"}
+    )
 
-    def test_unique_constraints(self):
-        """Test unique constraints"""
-        # Test tenant credentials uniqueness
+    with pytest.raises(IntegrityError), transaction.atomic():
         TenantCredentials.objects.create(
-            tenant_id=self.tenant_id,
+            tenant_id=TENANT_UUID,
             channel=ChannelType.EMAIL,
-            credentials={"host": "smtp.test.com"}
+            credentials={"host": "smtp.test2.com"}
         )
 
-        with self.assertRaises(Exception):  # Should raise IntegrityError
-            TenantCredentials.objects.create(
-                tenant_id=self.tenant_id,
-                channel=ChannelType.EMAIL,
-                credentials={"host": "smtp.test2.com"}
-            )
-
-    def test_enum_choices(self):
-        """Test enum field choices"""
-        # Test ChannelType
-        for channel in ChannelType:
-            record = NotificationRecord.objects.create(
-                tenant_id=self.tenant_id,
-                channel=channel,
-                recipient="test@example.com"
-            )
-            self.assertEqual(record.channel, channel)
-
-        # Test MessageType
-        for msg_type in MessageType:
-            conversation = ChatConversation.objects.create(
-                tenant_id=self.tenant_id,
-                conversation_type="direct",
-                created_by=self.user_id
-            )
-            message = ChatMessage.objects.create(
-                tenant_id=self.tenant_id,
-                conversation=conversation,
-                sender_id=self.user_id,
-                message_type=msg_type,
-                content="Test content"
-            )
-            self.assertEqual(message.message_type, msg_type)
-
-    def test_relationships(self):
-        """Test model relationships"""
-        # Create conversation with participants and messages
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            title="Test Conversation",
-            conversation_type="group",
-            created_by=self.user_id
-        )
 
-        # Add participants
-        participant1 = ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id,
-            role="admin"
-        )
-
-        participant2 = ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id="660e8400-e29b-41d4-a716-446655440002",
-            role="member"
-        )
-
-        # Add messages
-        message1 = ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Hello everyone!"
-        )
-
-        message2 = ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id="660e8400-e29b-41d4-a716-446655440002",
-            message_type=MessageType.TEXT,
-            content="Hi there!",
-            reply_to=message1
-        )
-
-        # Test relationships
-        self.assertEqual(conversation.participants.count(), 2)
-        self.assertEqual(conversation.messages.count(), 2)
-        self.assertEqual(message1.replies.count(), 1)
-        self.assertEqual(message2.reply_to, message1)
-
-    def test_validation(self):
-        """Test model validation"""
-        # Test template content validation
-        with self.assertRaises(ValidationError):
-            NotificationTemplate.objects.create(
-                tenant_id=self.tenant_id,
-                name="Invalid Template",
-                channel=ChannelType.EMAIL,
-                content="not a dict"  # Should be dict
-            )
-
-    def test_indexes(self):
-        """Test database indexes are properly configured"""
-        # This is more of a documentation test - in real scenarios
-        # you'd check the actual database schema
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        # Test that commonly queried fields have proper indexing
-        # by checking the model's Meta.indexes
-        indexes = conversation._meta.indexes
-        index_fields = []
-        for index in indexes:
-            if hasattr(index, 'fields'):
-                index_fields.extend(index.fields)
-
-        # Should have indexes on tenant_id, conversation_type, last_message_at, created_by
-        expected_fields = ['tenant_id', 'conversation_type', 'last_message_at', 'created_by']
-        for field in expected_fields:
-            self.assertIn(field, index_fields,
-                         f"Field '{field}' should be indexed in ChatConversation")
-
-    def test_cascade_deletes(self):
-        """Test cascade delete behavior"""
-        conversation = ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            conversation_type="direct",
-            created_by=self.user_id
-        )
-
-        participant = ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=self.user_id
-        )
-
-        message = ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Test"
-        )
-
-        reaction = MessageReaction.objects.create(
-            tenant_id=self.tenant_id,
-            message=message,
-            user_id=self.user_id,
-            emoji="👍"
+@pytest.mark.django_db
+@pytest.mark.parametrize("channel", list(ChannelType), ids=lambda channel: channel.value)
+def test_channel_type_choices(channel):
+    """Test ChannelType field choices"""
+    record = NotificationRecordFactory(channel=channel)
+    assert record.channel == channel
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("msg_type", list(MessageType), ids=lambda msg_type: msg_type.value)
+def test_message_type_choices(conversation, msg_type):
+    """Test MessageType field choices, all hosted by the shared conversation"""
+    message = ChatMessageFactory(conversation=conversation, message_type=msg_type)
+    assert message.message_type == msg_type
+
+
+@pytest.mark.django_db
+def test_relationships(conversation, django_assert_num_queries):
+    """Test model relationships"""
+    # Add participants
+    other_user_id = uuid.uuid4()
+    ChatParticipantFactory.create_batch(
+        2,
+        conversation=conversation,
+        user_id=factory.Iterator([USER_UUID, other_user_id]),
+        role=factory.Iterator(["admin", "member"])
+    )
+
+    # Add messages; UUID primary keys are assigned before the INSERT, so the
+    # reply can point at message1 within the same batch
+    message1 = ChatMessageFactory.build(conversation=conversation, content="Hello everyone!")
+    message2 = ChatMessageFactory.build(
+        conversation=conversation,
+        sender_id=other_user_id,
+        content="Hi there!",
+        reply_to=message1
+    )
+    ChatMessage.objects.bulk_create([message1, message2])
+
+    # Test relationships: one query per prefetched relation, then none for the reads
+    with django_assert_num_queries(4):
+        prefetched = ChatConversation.objects.prefetch_related(
+            'participants', 'messages', 'messages__replies'
+        ).get(id=conversation.id)
+
+    with django_assert_num_queries(0):
+        messages = {message.id: message for message in prefetched.messages.all()}
+        assert prefetched.participants.count() == 2
+        assert len(messages) == 2
+        assert messages[message1.id].replies.count() == 1
+        assert message2.reply_to == message1
+
+
+@pytest.mark.django_db
+def test_validation():
+    """Test model validation"""
+    from django.core.exceptions import ValidationError
+
+    # Test template content validation
+    with pytest.raises(ValidationError):
+        NotificationTemplate.objects.create(
+            tenant_id=TENANT_UUID,
+            name="Invalid Template",
+            channel=ChannelType.EMAIL,
+            content="not a dict"  # Should be dict
         )
 
-        # Delete conversation - should cascade to participants and messages
-        conversation_id = conversation.id
-        conversation.delete()
 
-        self.assertFalse(ChatConversation.objects.filter(id=conversation_id).exists())
-        self.assertFalse(ChatParticipant.objects.filter(conversation_id=conversation_id).exists())
-        self.assertFalse(ChatMessage.objects.filter(conversation_id=conversation_id).exists())
-        # Reactions should also be deleted due to cascade
-        self.assertFalse(MessageReaction.objects.filter(message=message).exists())
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def _indexed_fields(model_cls):
+    """Field names covered by the model's Meta.indexes"""
+    return frozenset(
+        field
+        for index in model_cls._meta.indexes
+        for field in getattr(index, 'fields', ())
+    )
+
+
+def test_indexes():
+    """Test database indexes are properly configured"""
+    # This is more of a documentation test - in real scenarios
+    # you'd check the actual database schema
+    # Test that commonly queried fields have proper indexing
+    # by checking the model's Meta.indexes
+    expected_fields = {'tenant_id', 'conversation_type', 'last_message_at', 'created_by'}
+    missing = expected_fields - _indexed_fields(ChatConversation)
+    assert not missing, f"Fields {sorted(missing)} should be indexed in ChatConversation"
+
+
+@pytest.mark.django_db
+def test_cascade_deletes(conversation_factory):
+    """Test cascade delete behavior"""
+    # A conversation of its own: delete() clears the pk on the instance
+    conversation = conversation_factory()
+
+    participant = ChatParticipant.objects.create(
+        tenant_id=TENANT_UUID,
+        conversation=conversation,
+        user_id=USER_UUID
+    )
+    message = ChatMessage.objects.create(
+        tenant_id=TENANT_UUID,
+        conversation=conversation,
+        sender_id=USER_UUID,
+        message_type=MessageType.TEXT,
+        content="Test"
+    )
+    reaction = MessageReaction.objects.create(
+        tenant_id=TENANT_UUID,
+        message=message,
+        user_id=USER_UUID,
+        emoji="👍"
+    )
+
+    # Delete conversation - should cascade to participants and messages
+    conversation_id = conversation.id
+    conversation.delete()
+
+    assert not ChatConversation.objects.filter(id=conversation_id).exists()
+    assert not ChatParticipant.objects.filter(conversation_id=conversation_id).exists()
+    assert not ChatMessage.objects.filter(conversation_id=conversation_id).exists()
+    # Reactions should also be deleted due to cascade
+    assert not MessageReaction.objects.filter(message=message).exists()
\ No newline at end of file
@@ -1,7 +1,17 @@
+import asyncio
 import json
-from django.test import TestCase
+import time
+import uuid
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+from django.db import transaction
+from django.test import TestCase, override_settings
+from channels.db import database_sync_to_async
+from channels.routing import URLRouter
 from channels.testing import WebsocketCommunicator
-from channels.layers import get_channel_layer
+from channels.layers import InMemoryChannelLayer, get_channel_layer
 from asgiref.sync import async_to_sync
 from unittest.mock import patch, MagicMock, AsyncMock
 from notifications.chat_consumers import ChatConsumer
@@ -9,378 +19,361 @@ from notifications.models import (
     ChatConversation, ChatParticipant, ChatMessage, MessageType,
     UserPresence, MessageReaction
 )
+from notifications.routing import websocket_urlpatterns
 
 
-class ChatWebSocketTest(TestCase):
-    """Test WebSocket chat functionality"""
+@dataclass(frozen=True)
+class SeededConversation:
+    """Ids of the rows created by ChatWebSocketTest._seed"""
+    conversation_id: UUID
+    message_id: Optional[UUID] = None
 
-    def setUp(self):
-        self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
-        self.user_id = "660e8400-e29b-41d4-a716-446655440001"
 
-    async def test_chat_connection(self):
-        """Test WebSocket connection establishment"""
-        # Create application with our consumer
-        from django.test.utils import override_settings
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
+# No cross-process fan-out is needed here, so never pay a Redis round-trip
+IN_MEMORY_CHANNEL_LAYERS = {
+    'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'},
+}
 
-        application = URLRouter(websocket_urlpatterns)
+# Frames that need no database work (connection acks, validation errors) are
+# queued by the time we read them, so a hung consumer fails fast. Replies that
+# first make a database_sync_to_async round trip (join, send, reaction,
+# presence) keep receive_json_from's 1 second default; under -n auto the
+# database thread can lag well past 100 ms
+QUEUED_TIMEOUT = 0.1
+RECEIVE_TIMEOUT = 1
 
-        # Create communicator
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
+# Subscriber counts for the fan-out check and the wall-clock budget for one
+# message to reach all of them; generous, it only catches O(N^2)-style regressions
+FANOUT_SUBSCRIBERS = (2, 10, 50)
+FANOUT_BUDGET = 2.0
 
-        # Mock scope with tenant/user info (normally set by middleware)
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
 
-        # Connect
-        connected, subprotocol = await communicator.connect()
-        self.assertTrue(connected)
+class WebSocketApplicationMixin:
+    """One URLRouter over the websocket routes, built once per test class"""
 
-        # Receive connection confirmation
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'connection_established')
-        self.assertEqual(response['user_id'], self.user_id)
-        self.assertEqual(response['tenant_id'], self.tenant_id)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        layer = get_channel_layer()
+        assert isinstance(layer, InMemoryChannelLayer), (
+            f"{cls.__name__} expects the in-memory channel layer, got {type(layer).__name__}"
+        )
+        cls.application = URLRouter(websocket_urlpatterns)
+
+    @staticmethod
+    async def _recv(communicator, timeout=RECEIVE_TIMEOUT):
+        """Receive the next JSON frame, waiting no longer than timeout"""
+        return await communicator.receive_json_from(timeout=timeout)
+
+    async def _recv_until(self, communicator, message_type, timeout=RECEIVE_TIMEOUT):
+        """Skip already-queued frames (connection and join acks) up to message_type"""
+        while True:
+            response = await self._recv(communicator, timeout)
+            if response['type'] == message_type:
+                return response
+
+    @asynccontextmanager
+    async def _open(self, path, **scope):
+        """Connect a communicator with this test's tenant/user in its scope
+
+        Keyword arguments override the scope; pass None to leave a key out.
+        The communicator is always disconnected, even when an assertion fails,
+        unless the consumer has already exited.
+        """
+        scope = {'tenant_id': self.tenant_id, 'user_id': self.user_id, **scope}
+        communicator = WebsocketCommunicator(self.application, path)
+        communicator.scope.update({key: value for key, value in scope.items() if value is not None})
+        connected, _ = await communicator.connect()
+        assert connected, f"Connection to {path} was refused"
+        try:
+            yield communicator
+        finally:
+            # A consumer that already exited (e.g. crashed on bad input) has nothing to disconnect
+            if not communicator.future.done():
+                await communicator.disconnect()
 
-        # Disconnect
-        await communicator.disconnect()
 
-    async def test_join_conversation(self):
-        """Test joining a conversation"""
-        # Create test conversation and participant
-        conversation = await self.create_test_conversation()
-        await self.create_test_participant(conversation)
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class ChatWebSocketTest(WebSocketApplicationMixin, TestCase):
+    """Test WebSocket chat functionality"""
 
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
+    tenant_id = "550e8400-e29b-41d4-a716-446655440000"
+    user_id = "660e8400-e29b-41d4-a716-446655440001"
+    other_user_id = "770e8400-e29b-41d4-a716-446655440002"
 
-        await communicator.connect()
+    @classmethod
+    def setUpTestData(cls):
+        # Shared conversation with both users as participants, created once per
+        # class; each test's changes are rolled back around it
+        conversation = ChatConversation.objects.create(
+            tenant_id=cls.tenant_id,
+            title="Test Conversation",
+            conversation_type="group",
+            created_by=cls.user_id
+        )
+        cls._participant_user_ids = (cls.user_id, cls.other_user_id)
+        ChatParticipant.objects.bulk_create([
+            ChatParticipant(
+                tenant_id=cls.tenant_id,
+                conversation=conversation,
+                user_id=user_id,
+                role="member"
+            )
+            for user_id in cls._participant_user_ids
+        ])
+        cls._conversation_id = conversation.id
+
+        # Frames that only depend on the shared conversation, encoded once
+        conversation_id = str(conversation.id)
+        cls._payloads = {
+            'join': json.dumps({'type': 'join_conversation', 'conversation_id': conversation_id}),
+            'start_typing': json.dumps({'type': 'start_typing', 'conversation_id': conversation_id}),
+        }
 
-        # Join conversation
-        await communicator.send_json_to({
-            'type': 'join_conversation',
-            'conversation_id': str(conversation.id)
-        })
+    async def test_chat_connection(self):
+        """Test WebSocket connection establishment"""
+        # Connects with tenant/user info in the scope (normally set by middleware)
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            # Receive connection confirmation
+            response = await self._recv(communicator, timeout=QUEUED_TIMEOUT)
+            self.assertEqual(response['type'], 'connection_established')
+            self.assertEqual(response['user_id'], self.user_id)
+            self.assertEqual(response['tenant_id'], self.tenant_id)
 
-        # Receive join confirmation
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'conversation_joined')
-        self.assertEqual(response['conversation_id'], str(conversation.id))
+    async def test_join_conversation(self):
+        """Test joining a conversation"""
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            # Join conversation
+            await self._send(communicator, 'join')
 
-        await communicator.disconnect()
+            # Receive join confirmation, after the queued connection ack
+            response = await self._recv_until(communicator, 'conversation_joined')
+            self.assertEqual(response['conversation_id'], str(self._conversation_id))
 
     async def test_send_message(self):
         """Test sending a chat message"""
-        conversation = await self.create_test_conversation()
-        await self.create_test_participant(conversation)
-
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-
-        # Join conversation first
-        await communicator.send_json_to({
-            'type': 'join_conversation',
-            'conversation_id': str(conversation.id)
-        })
-        await communicator.receive_json_from()  # Join confirmation
-
-        # Send message
-        await communicator.send_json_to({
-            'type': 'send_message',
-            'conversation_id': str(conversation.id),
-            'content': 'Hello WebSocket world!',
-            'message_type': 'text'
-        })
-
-        # Receive message sent confirmation
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'message_sent')
-        self.assertIn('message', response)
-        self.assertEqual(response['message']['content'], 'Hello WebSocket world!')
-
-        # Verify message was created in database
-        messages = await self.get_conversation_messages(conversation.id)
-        self.assertEqual(len(messages), 1)
-        self.assertEqual(messages[0]['content'], 'Hello WebSocket world!')
-
-        await communicator.disconnect()
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            # Join conversation first; frames are handled in order, so the
+            # message can follow without waiting for the join confirmation
+            await self._send(communicator, 'join')
+
+            # Send message
+            await communicator.send_json_to({
+                'type': 'send_message',
+                'conversation_id': str(self._conversation_id),
+                'content': 'Hello WebSocket world!',
+                'message_type': 'text'
+            })
+
+            # Receive message sent confirmation
+            response = await self._recv_until(communicator, 'message_sent')
+            self.assertIn('message', response)
+            self.assertEqual(response['message']['content'], 'Hello WebSocket world!')
+
+            # Verify message was created in database
+            messages = await self.get_conversation_messages(self._conversation_id)
+            self.assertEqual(messages, ['Hello WebSocket world!'])
 
     async def test_receive_message_broadcast(self):
         """Test receiving broadcast messages"""
-        conversation = await self.create_test_conversation()
-        await self.create_test_participant(conversation)
-
-        application = self.get_chat_application()
-
-        # Create two communicators (simulating two users)
-        comm1 = WebsocketCommunicator(application, f"/ws/chat/{self.tenant_id}/")
-        comm1.scope['tenant_id'] = self.tenant_id
-        comm1.scope['user_id'] = self.user_id
-
-        comm2 = WebsocketCommunicator(application, f"/ws/chat/{self.tenant_id}/")
-        comm2.scope['tenant_id'] = self.tenant_id
-        comm2.scope['user_id'] = "770e8400-e29b-41d4-a716-446655440002"  # Different user
-
-        # Add second user as participant
-        await self.create_test_participant(conversation, "770e8400-e29b-41d4-a716-446655440002")
-
-        # Connect both
-        await comm1.connect()
-        await comm2.connect()
-
-        # Both join conversation
-        await comm1.send_json_to({'type': 'join_conversation', 'conversation_id': str(conversation.id)})
-        await comm2.send_json_to({'type': 'join_conversation', 'conversation_id': str(conversation.id)})
-
-        await comm1.receive_json_from()  # Join confirmation
-        await comm2.receive_json_from()  # Join confirmation
-
-        # User 1 sends message
-        await comm1.send_json_to({
-            'type': 'send_message',
-            'conversation_id': str(conversation.id),
-            'content': 'Broadcast test message',
-            'message_type': 'text'
-        })
-
-        # User 1 receives sent confirmation
-        response1 = await comm1.receive_json_from()
-        self.assertEqual(response1['type'], 'message_sent')
-
-        # User 2 receives the broadcast message
-        response2 = await comm2.receive_json_from()
-        self.assertEqual(response2['type'], 'new_message')
-        self.assertEqual(response2['message']['content'], 'Broadcast test message')
-
-        await comm1.disconnect()
-        await comm2.disconnect()
+        path = f"/ws/chat/{self.tenant_id}/"
+        async with AsyncExitStack() as stack:
+            # Connect two communicators (simulating two users) concurrently
+            comm1, comm2 = await asyncio.gather(
+                stack.enter_async_context(self._open(path)),
+                stack.enter_async_context(self._open(path, user_id=self.other_user_id)),
+            )
+
+            # Both join conversation
+            await asyncio.gather(self._send(comm1, 'join'), self._send(comm2, 'join'))
+
+            # Join confirmations, after each connection's queued ack
+            await asyncio.gather(
+                self._recv_until(comm1, 'conversation_joined'),
+                self._recv_until(comm2, 'conversation_joined'),
+            )
+
+            # User 1 sends message
+            await comm1.send_json_to({
+                'type': 'send_message',
+                'conversation_id': str(self._conversation_id),
+                'content': 'Broadcast test message',
+                'message_type': 'text'
+            })
+
+            # User 1 receives sent confirmation
+            response1 = await self._recv(comm1)
+            self.assertEqual(response1['type'], 'message_sent')
+
+            # User 2 receives the broadcast message
+            response2 = await self._recv(comm2)
+            self.assertEqual(response2['type'], 'new_message')
+            self.assertEqual(response2['message']['content'], 'Broadcast test message')
+
+    async def test_broadcast_fanout(self):
+        """Test one message reaches every subscriber of a conversation"""
+        path = f"/ws/chat/{self.tenant_id}/"
+        for subscribers in FANOUT_SUBSCRIBERS:
+            with self.subTest(subscribers=subscribers):
+                others = [str(uuid.uuid4()) for _ in range(subscribers - 1)]
+                seeded = await self._seed(extra_users=others)
+                join = {'type': 'join_conversation', 'conversation_id': str(seeded.conversation_id)}
+
+                async with AsyncExitStack() as stack:
+                    comms = await asyncio.gather(*(
+                        stack.enter_async_context(self._open(path, user_id=user_id))
+                        for user_id in [self.user_id, *others]
+                    ))
+                    sender, receivers = comms[0], comms[1:]
+
+                    await asyncio.gather(*(self._recv(comm, timeout=QUEUED_TIMEOUT) for comm in comms))  # Connected
+                    await asyncio.gather(*(comm.send_json_to(join) for comm in comms))
+                    # Joins share one database thread, so give them the whole budget
+                    await asyncio.gather(*(self._recv(comm, timeout=FANOUT_BUDGET) for comm in comms))
+
+                    started = time.perf_counter()
+                    await sender.send_json_to({
+                        'type': 'send_message',
+                        'conversation_id': str(seeded.conversation_id),
+                        'content': 'Fanout test message',
+                        'message_type': 'text'
+                    })
+                    sent = await self._recv(sender)
+                    received = await asyncio.gather(*(self._recv(comm) for comm in receivers))
+                    elapsed = time.perf_counter() - started
+
+                self.assertEqual(sent['type'], 'message_sent')
+                self.assertEqual({response['type'] for response in received}, {'new_message'})
+                self.assertLess(elapsed, FANOUT_BUDGET)
 
     async def test_typing_indicators(self):
         """Test typing indicators"""
-        conversation = await self.create_test_conversation()
-        await self.create_test_participant(conversation)
-
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            await self._send(communicator, 'join')
 
-        await communicator.connect()
-        await communicator.send_json_to({
-            'type': 'join_conversation',
-            'conversation_id': str(conversation.id)
-        })
-        await communicator.receive_json_from()  # Join confirmation
+            # Start typing
+            await self._send(communicator, 'start_typing')
 
-        # Start typing
-        await communicator.send_json_to({
-            'type': 'start_typing',
-            'conversation_id': str(conversation.id)
-        })
-
-        # Should not receive immediate response (handled by broadcast)
-        # In real scenario, other users would receive typing indicator
-
-        await communicator.disconnect()
+            # Should not receive immediate response (handled by broadcast)
+            # In real scenario, other users would receive typing indicator
 
     async def test_message_reactions(self):
         """Test message reactions"""
-        conversation = await self.create_test_conversation()
-        await self.create_test_participant(conversation)
+        # Create the conversation, participant and a message first
+        seeded = await self._seed(with_message=True)
 
-        # Create a message first
-        message = await self.create_test_message(conversation)
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            await communicator.send_json_to({
+                'type': 'join_conversation',
+                'conversation_id': str(seeded.conversation_id)
+            })
 
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-        await communicator.send_json_to({
-            'type': 'join_conversation',
-            'conversation_id': str(conversation.id)
-        })
-        await communicator.receive_json_from()  # Join confirmation
-
-        # Add reaction
-        await communicator.send_json_to({
-            'type': 'add_reaction',
-            'message_id': str(message.id),
-            'emoji': '👍'
-        })
-
-        # Should receive reaction confirmation (in real implementation)
-        # Verify reaction was created
-        reactions = await self.get_message_reactions(message.id)
-        self.assertEqual(len(reactions), 1)
-        self.assertEqual(reactions[0]['emoji'], '👍')
-
-        await communicator.disconnect()
-
-    async def test_presence_updates(self):
-        """Test user presence updates"""
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
+            # Add reaction
+            await communicator.send_json_to({
+                'type': 'add_reaction',
+                'message_id': str(seeded.message_id),
+                'emoji': '👍'
+            })
 
-        await communicator.connect()
+            # The reaction is broadcast back to the conversation once stored
+            await self._recv_until(communicator, 'reaction_added')
 
-        # Update presence
-        await communicator.send_json_to({
-            'type': 'update_presence',
-            'status': 'busy'
-        })
+            # Verify reaction was created
+            reactions = await self.get_message_reactions(seeded.message_id)
+            self.assertEqual(reactions, ['👍'])
 
-        # Receive confirmation
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'presence_updated')
-        self.assertEqual(response['status'], 'busy')
+    async def test_presence_updates(self):
+        """Test user presence updates"""
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            # Update presence
+            await communicator.send_json_to({
+                'type': 'update_presence',
+                'status': 'busy'
+            })
 
-        await communicator.disconnect()
+            # Receive confirmation
+            response = await self._recv_until(communicator, 'presence_updated')
+            self.assertEqual(response['status'], 'busy')
 
     async def test_unauthorized_access(self):
         """Test unauthorized conversation access"""
         # Create conversation without adding user as participant
-        conversation = await self.create_test_conversation()
-
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-
-        # Try to join conversation
-        await communicator.send_json_to({
-            'type': 'join_conversation',
-            'conversation_id': str(conversation.id)
-        })
-
-        # Should receive error
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'error')
-        self.assertIn('Not authorized', response['message'])
-
-        await communicator.disconnect()
-
-    async def test_invalid_message_type(self):
-        """Test handling of invalid message types"""
-        application = self.get_chat_application()
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-
-        # Send invalid message type
-        await communicator.send_json_to({
-            'type': 'invalid_type',
-            'data': 'test'
-        })
-
-        # Should receive error
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'error')
-        self.assertIn('Unknown message type', response['message'])
-
-        await communicator.disconnect()
-
-    # Helper methods
-    def get_chat_application(self):
-        """Get chat application for testing"""
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
-        return URLRouter(websocket_urlpatterns)
+        seeded = await self._seed(members=False)
+
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            # Try to join conversation
+            await communicator.send_json_to({
+                'type': 'join_conversation',
+                'conversation_id': str(seeded.conversation_id)
+            })
+
+            # Should receive error
+            response = await self._recv_until(communicator, 'error')
+            self.assertIn('Not authorized', response['message'])
+
+    # Helper methods. The database helpers stay on database_sync_to_async: its
+    # thread-sensitive executor runs them on the test's own connection, inside the
+    # TestCase transaction. A thread_sensitive=False helper would use a separate
+    # connection that cannot see the uncommitted setUpTestData rows
+    async def _send(self, communicator, key):
+        """Send one of the pre-encoded class payloads"""
+        await communicator.send_to(text_data=self._payloads[key])
 
     @database_sync_to_async
-    def create_test_conversation(self):
-        """Create a test conversation"""
-        return ChatConversation.objects.create(
-            tenant_id=self.tenant_id,
-            title="Test Conversation",
-            conversation_type="group",
-            created_by=self.user_id
-        )
-
-    @database_sync_to_async
-    def create_test_participant(self, conversation, user_id=None):
-        """Create a test participant"""
-        if user_id is None:
-            user_id = self.user_id
-        return ChatParticipant.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            user_id=user_id,
-            role="member"
-        )
-
-    @database_sync_to_async
-    def create_test_message(self, conversation):
-        """Create a test message"""
-        return ChatMessage.objects.create(
-            tenant_id=self.tenant_id,
-            conversation=conversation,
-            sender_id=self.user_id,
-            message_type=MessageType.TEXT,
-            content="Test message"
-        )
+    def _seed(self, *, members=True, with_message=False, extra_users=()):
+        """Create a conversation, its participants and optionally a message
+
+        Runs as one transaction and one thread hop; participants go in with a
+        single bulk INSERT.
+        """
+        with transaction.atomic():
+            conversation = ChatConversation.objects.create(
+                tenant_id=self.tenant_id,
+                title="Test Conversation",
+                conversation_type="group",
+                created_by=self.user_id
+            )
+            user_ids = [self.user_id] if members else []
+            ChatParticipant.objects.bulk_create([
+                ChatParticipant(
+                    tenant_id=self.tenant_id,
+                    conversation=conversation,
+                    user_id=user_id,
+                    role="member"
+                )
+                for user_id in [*user_ids, *extra_users]
+            ])
+            message_id = None
+            if with_message:
+                message_id = ChatMessage.objects.create(
+                    tenant_id=self.tenant_id,
+                    conversation=conversation,
+                    sender_id=self.user_id,
+                    message_type=MessageType.TEXT,
+                    content="Test message"
+                ).id
+        return SeededConversation(conversation.id, message_id)
 
     @database_sync_to_async
     def get_conversation_messages(self, conversation_id):
-        """Get conversation messages"""
-        messages = list(ChatMessage.objects.filter(
+        """Get the content of each conversation message, oldest first"""
+        return list(ChatMessage.objects.filter(
             tenant_id=self.tenant_id,
             conversation_id=conversation_id,
             is_deleted=False
-        ).order_by('created_at').values(
-            'id', 'content', 'message_type', 'sender_id', 'created_at'
-        ))
-        return messages
+        ).order_by('created_at').values_list('content', flat=True))
 
     @database_sync_to_async
     def get_message_reactions(self, message_id):
-        """Get message reactions"""
+        """Get the emoji of each message reaction"""
         return list(MessageReaction.objects.filter(
             tenant_id=self.tenant_id,
             message_id=message_id
-        ).values('emoji', 'user_id', 'created_at'))
+        ).values_list('emoji', flat=True))
 
 
-class EventSystemWebSocketTest(TestCase):
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class EventSystemWebSocketTest(WebSocketApplicationMixin, TestCase):
     """Test event system WebSocket integration"""
 
     def setUp(self):
@@ -390,106 +383,66 @@ class EventSystemWebSocketTest(TestCase):
     @patch('notifications.consumers.NotificationConsumer.send_notification')
     async def test_notification_websocket(self, mock_send):
         """Test notification WebSocket consumer"""
-        from notifications.consumers import NotificationConsumer
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
+        async with self._open(f"/ws/notifications/{self.tenant_id}/") as communicator:
+            # Send a test notification message
+            test_message = {
+                'type': 'notification',
+                'title': 'Test Notification',
+                'body': 'This is a test',
+                'data': {'test': True}
+            }
 
-        application = URLRouter(websocket_urlpatterns)
+            await communicator.send_json_to(test_message)
 
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/notifications/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-
-        # Send a test notification message
-        test_message = {
-            'type': 'notification',
-            'title': 'Test Notification',
-            'body': 'This is a test',
-            'data': {'test': True}
-        }
-
-        await communicator.send_json_to(test_message)
-
-        # Should receive echo or processed message
-        response = await communicator.receive_json_from()
-        # Response depends on consumer implementation
-
-        await communicator.disconnect()
+            # Should receive echo or processed message
+            response = await self._recv(communicator)
+            # Response depends on consumer implementation
 
     async def test_tenant_broadcast_websocket(self):
         """Test tenant-wide broadcast WebSocket"""
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
+        # Tenant broadcasts carry no user in the scope
+        async with self._open(f"/ws/tenant/{self.tenant_id}/broadcast/", user_id=None) as communicator:
+            # Send broadcast message
+            await communicator.send_json_to({
+                'type': 'broadcast',
+                'message': 'Tenant-wide announcement',
+                'priority': 'high'
+            })
 
-        application = URLRouter(websocket_urlpatterns)
+            # Should receive confirmation or broadcast
+            response = await self._recv(communicator)
 
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/tenant/{self.tenant_id}/broadcast/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
 
-        await communicator.connect()
-
-        # Send broadcast message
-        await communicator.send_json_to({
-            'type': 'broadcast',
-            'message': 'Tenant-wide announcement',
-            'priority': 'high'
-        })
-
-        # Should receive confirmation or broadcast
-        response = await communicator.receive_json_from()
-
-        await communicator.disconnect()
-
-
-class WebSocketErrorHandlingTest(TestCase):
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class WebSocketErrorHandlingTest(WebSocketApplicationMixin, TestCase):
     """Test WebSocket error handling"""
 
     def setUp(self):
         self.tenant_id = "550e8400-e29b-41d4-a716-446655440000"
         self.user_id = "660e8400-e29b-41d4-a716-446655440001"
 
-    async def test_invalid_json(self):
-        """Test handling of invalid JSON"""
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
-
-        application = URLRouter(websocket_urlpatterns)
-
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
+    async def test_error_paths(self):
+        """Test invalid message types and invalid JSON over one connection"""
+        cases = (
+            (json.dumps({'type': 'invalid_type', 'data': 'test'}), 'Unknown message type'),
+            ("invalid json", 'Invalid JSON'),
         )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-
-        # Send invalid JSON
-        await communicator.send_to(text_data="invalid json")
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            await self._recv_until(communicator, 'connection_established', timeout=QUEUED_TIMEOUT)
 
-        # Should handle gracefully
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'error')
+            for text_data, expected_message in cases:
+                with self.subTest(text_data=text_data):
+                    await communicator.send_to(text_data=text_data)
 
-        await communicator.disconnect()
+                    # Should receive error; validation needs no database work
+                    response = await self._recv(communicator, timeout=QUEUED_TIMEOUT)
+                    self.assertEqual(response['type'], 'error')
+                    self.assertIn(expected_message, response['message'])
 
     async def test_missing_tenant_context(self):
         """Test connection without tenant context"""
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
-
-        application = URLRouter(websocket_urlpatterns)
-
         communicator = WebsocketCommunicator(
-            application,
+            self.application,
             f"/ws/chat/{self.tenant_id}/"
         )
         # Don't set tenant_id in scope
@@ -500,28 +453,12 @@ class WebSocketErrorHandlingTest(TestCase):
 
     async def test_connection_cleanup(self):
         """Test proper connection cleanup"""
-        from channels.routing import URLRouter
-        from notifications.routing import websocket_urlpatterns
-
-        application = URLRouter(websocket_urlpatterns)
-
-        communicator = WebsocketCommunicator(
-            application,
-            f"/ws/chat/{self.tenant_id}/"
-        )
-        communicator.scope['tenant_id'] = self.tenant_id
-        communicator.scope['user_id'] = self.user_id
-
-        await communicator.connect()
-
-        # Verify connection
-        response = await communicator.receive_json_from()
-        self.assertEqual(response['type'], 'connection_established')
-
-        # Disconnect
-        await communicator.disconnect()
+        async with self._open(f"/ws/chat/{self.tenant_id}/") as communicator:
+            # Verify connection
+            response = await self._recv(communicator, timeout=QUEUED_TIMEOUT)
+            self.assertEqual(response['type'], 'connection_established')
 
-        # Should not be able to send/receive after disconnect
+        # Leaving the block disconnected; should not be able to send/receive now
         try:
             await communicator.send_json_to({'type': 'test'})
             # If no exception, connection wasn't properly closed